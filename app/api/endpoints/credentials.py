@@ -129,25 +129,12 @@ async def delete_service_credential(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a service credential by ID."""
-    # First check if the credential belongs to the user
-    result = db.execute(
-        select(ServiceCredentials)
-        .where(
-            ServiceCredentials.id == credential_id,
-            ServiceCredentials.user_id == current_user.id
-        )
-    )
-    credential = result.scalar_one_or_none()
-
-    if not credential:
+    # Scoping the delete to the current user both checks ownership and
+    # deletes in a single statement
+    deleted = credentials_service.delete_service_credential(
+        db, credential_id, user_id=current_user.id)
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Service credential not found"
         )
-
-    deleted = credentials_service.delete_service_credential(db, credential_id)
-    if not deleted:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete service credential"
-        )
@@ -17,7 +17,7 @@ from app.models.grafana import (
     FolderRead,
     FoldersList,
 )
-from app.services.grafana_service import GrafanaService
+from app.services.grafana_service import GrafanaService, get_grafana_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -27,7 +27,7 @@ router = APIRouter()
 async def get_dashboards(
     folder_id: Optional[int] = Query(
         None, description="Filter dashboards by folder ID"),
-    grafana_service: GrafanaService = Depends(),
+    grafana_service: GrafanaService = Depends(get_grafana_service),
 ) -> DashboardsList:
     """
     Retrieve all dashboards from Grafana.
@@ -53,7 +53,7 @@ async def get_dashboards(
 async def get_dashboard(
     dashboard_uid: str = Path(...,
                               description="The UID of the dashboard to retrieve"),
-    grafana_service: GrafanaService = Depends(),
+    grafana_service: GrafanaService = Depends(get_grafana_service),
 ) -> DashboardRead:
     """
     Retrieve a specific dashboard by UID.
@@ -85,7 +85,7 @@ async def get_dashboard(
 @router.post("/dashboards", response_model=DashboardRead, status_code=status.HTTP_201_CREATED, summary="Create Dashboard")
 async def create_dashboard(
     dashboard: DashboardCreate,
-    grafana_service: GrafanaService = Depends(),
+    grafana_service: GrafanaService = Depends(get_grafana_service),
 ) -> DashboardRead:
     """
     Create a new dashboard in Grafana.
@@ -111,7 +111,7 @@ async def create_dashboard(
 async def delete_dashboard(
     dashboard_uid: str = Path(...,
                               description="The UID of the dashboard to delete"),
-    grafana_service: GrafanaService = Depends(),
+    grafana_service: GrafanaService = Depends(get_grafana_service),
 ) -> None:
     """
     Delete a dashboard from Grafana.
@@ -138,7 +138,7 @@ async def delete_dashboard(
 
 @router.get("/folders", response_model=FoldersList, summary="Get All Folders")
 async def get_folders(
-    grafana_service: GrafanaService = Depends(),
+    grafana_service: GrafanaService = Depends(get_grafana_service),
 ) -> FoldersList:
     """
     Retrieve all folders from Grafana.
@@ -160,7 +160,7 @@ async def get_folders(
 @router.post("/folders", response_model=FolderRead, status_code=status.HTTP_201_CREATED, summary="Create Folder")
 async def create_folder(
     folder: FolderCreate,
-    grafana_service: GrafanaService = Depends(),
+    grafana_service: GrafanaService = Depends(get_grafana_service),
 ) -> FolderRead:
     """
     Create a new folder in Grafana.
@@ -184,7 +184,7 @@ async def create_folder(
 
 @router.get("/datasources", response_model=DataSourcesList, summary="Get All Data Sources")
 async def get_datasources(
-    grafana_service: GrafanaService = Depends(),
+    grafana_service: GrafanaService = Depends(get_grafana_service),
 ) -> DataSourcesList:
     """
     Retrieve all data sources from Grafana.
@@ -206,7 +206,7 @@ async def get_datasources(
 @router.post("/datasources", response_model=DataSourceRead, status_code=status.HTTP_201_CREATED, summary="Create Data Source")
 async def create_datasource(
     datasource: DataSourceCreate,
-    grafana_service: GrafanaService = Depends(),
+    grafana_service: GrafanaService = Depends(get_grafana_service),
 ) -> DataSourceRead:
     """
     Create a new data source in Grafana.
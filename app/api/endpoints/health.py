@@ -1,6 +1,7 @@
 """
 Health check endpoints for the application.
 """
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List
@@ -8,10 +9,10 @@ from typing import Dict, List
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.models.uptime_kuma import SystemHealthResponse
-from app.services.uptime_kuma_service import UptimeKumaService
-from app.services.prometheus_service import PrometheusService
-from app.services.grafana_service import GrafanaService
-from app.services.proxmox_service import ProxmoxService
+from app.services.uptime_kuma_service import UptimeKumaService, get_uptime_kuma_service
+from app.services.prometheus_service import PrometheusService, get_prometheus_service
+from app.services.grafana_service import GrafanaService, get_grafana_service
+from app.services.proxmox_service import ProxmoxService, get_proxmox_service
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -20,10 +21,10 @@ router = APIRouter()
 
 @router.get("/", response_model=SystemHealthResponse, summary="System Health Check")
 async def health_check(
-    uptime_kuma_service: UptimeKumaService = Depends(),
-    prometheus_service: PrometheusService = Depends(),
-    grafana_service: GrafanaService = Depends(),
-    proxmox_service: ProxmoxService = Depends(),
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
+    prometheus_service: PrometheusService = Depends(get_prometheus_service),
+    grafana_service: GrafanaService = Depends(get_grafana_service),
+    proxmox_service: ProxmoxService = Depends(get_proxmox_service),
 ) -> SystemHealthResponse:
     logger.info("Performing system health check")
     settings = get_settings()
@@ -35,65 +36,37 @@ async def health_check(
         "proxmox": {"status": "unknown", "message": None, "enabled": "false"},
     }
 
-    # Check Uptime Kuma
-    if hasattr(settings, 'UPTIME_KUMA_URL') and settings.UPTIME_KUMA_URL:
-        services_status["uptime_kuma"]["enabled"] = "true"
-        try:
-            await uptime_kuma_service.check_health()
-            services_status["uptime_kuma"].update(
-                {"status": "healthy", "message": "Connected successfully"})
-        except Exception as e:
-            logger.warning(
-                f"Uptime Kuma health check failed: {type(e).__name__}: {str(e)}")
-            services_status["uptime_kuma"].update({
-                "status": "unhealthy",
-                "message": f"{type(e).__name__}: {str(e)}"
-            })
-
-    # Check Prometheus
-    if hasattr(settings, 'PROMETHEUS_URL') and settings.PROMETHEUS_URL:
-        services_status["prometheus"]["enabled"] = "true"
-        try:
-            await prometheus_service.check_health()
-            services_status["prometheus"].update(
-                {"status": "healthy", "message": "Connected successfully"})
-        except Exception as e:
-            logger.warning(
-                f"Prometheus health check failed: {type(e).__name__}: {str(e)}")
-            services_status["prometheus"].update({
-                "status": "unhealthy",
-                "message": f"{type(e).__name__}: {str(e)}"
-            })
+    # Check every configured service at once, so a slow backend costs its own
+    # timeout rather than adding to everyone else's
+    checks = [
+        (name, label, service)
+        for name, label, service, url in (
+            ("uptime_kuma", "Uptime Kuma", uptime_kuma_service, settings.UPTIME_KUMA_URL),
+            ("prometheus", "Prometheus", prometheus_service, settings.PROMETHEUS_URL),
+            ("grafana", "Grafana", grafana_service, settings.GRAFANA_URL),
+            ("proxmox", "Proxmox", proxmox_service, settings.PROXMOX_URL),
+        )
+        if url
+    ]
+    results = await asyncio.gather(
+        *(service.check_health() for _, _, service in checks),
+        return_exceptions=True,
+    )
 
-    # Check Grafana
-    if hasattr(settings, 'GRAFANA_URL') and settings.GRAFANA_URL:
-        services_status["grafana"]["enabled"] = "true"
-        try:
-            await grafana_service.check_health()
-            services_status["grafana"].update(
-                {"status": "healthy", "message": "Connected successfully"})
-        except Exception as e:
+    for (name, label, _), result in zip(checks, results):
+        services_status[name]["enabled"] = "true"
+        if isinstance(result, Exception):
             logger.warning(
-                f"Grafana health check failed: {type(e).__name__}: {str(e)}")
-            services_status["grafana"].update({
+                f"{label} health check failed: {type(result).__name__}: {str(result)}")
+            services_status[name].update({
                 "status": "unhealthy",
-                "message": f"{type(e).__name__}: {str(e)}"
+                "message": f"{type(result).__name__}: {str(result)}"
             })
-
-    # Check Proxmox
-    if hasattr(settings, 'PROXMOX_URL') and settings.PROXMOX_URL:
-        services_status["proxmox"]["enabled"] = "true"
-        try:
-            await proxmox_service.check_health()
-            services_status["proxmox"].update(
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            services_status[name].update(
                 {"status": "healthy", "message": "Connected successfully"})
-        except Exception as e:
-            logger.warning(
-                f"Proxmox health check failed: {type(e).__name__}: {str(e)}")
-            services_status["proxmox"].update({
-                "status": "unhealthy",
-                "message": f"{type(e).__name__}: {str(e)}"
-            })
 
     overall_status = "healthy"
     for service, status_info in services_status.items():
@@ -13,7 +13,7 @@ from app.models.prometheus import (
     MetricResponse,
     QueryResult,
 )
-from app.services.prometheus_service import PrometheusService
+from app.services.prometheus_service import PrometheusService, get_prometheus_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -24,7 +24,7 @@ async def query_prometheus(
     query: str = Query(..., description="PromQL query string"),
     time: Optional[datetime] = Query(
         None, description="Evaluation timestamp (RFC3339 or Unix timestamp)"),
-    prometheus_service: PrometheusService = Depends(),
+    prometheus_service: PrometheusService = Depends(get_prometheus_service),
 ) -> QueryResult:
     """
     Execute a PromQL query against Prometheus.
@@ -47,6 +47,33 @@ async def query_prometheus(
         )
 
 
+@router.get("/query/batch", response_model=List[QueryResult], summary="Execute Multiple PromQL Queries")
+async def query_batch(
+    query: List[str] = Query(..., description="PromQL query strings"),
+    time: Optional[datetime] = Query(
+        None, description="Evaluation timestamp (RFC3339 or Unix timestamp)"),
+    prometheus_service: PrometheusService = Depends(get_prometheus_service),
+) -> List[QueryResult]:
+    """
+    Execute several PromQL queries against Prometheus concurrently.
+
+    Args:
+        query: PromQL query strings
+        time: Optional evaluation timestamp
+
+    Returns:
+        List[QueryResult]: Query results, in request order
+    """
+    try:
+        return await prometheus_service.query_batch(query, time)
+    except Exception as e:
+        logger.error(f"Failed to execute Prometheus query batch: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to execute Prometheus query batch: {str(e)}",
+        )
+
+
 @router.get("/query_range", response_model=MetricRange, summary="Execute PromQL Range Query")
 async def query_range(
     query: str = Query(..., description="PromQL query string"),
@@ -56,7 +83,7 @@ async def query_range(
                           description="End timestamp (RFC3339 or Unix timestamp)"),
     step: str = Query(...,
                       description="Query resolution step width (e.g. 30s, 1m, 1h)"),
-    prometheus_service: PrometheusService = Depends(),
+    prometheus_service: PrometheusService = Depends(get_prometheus_service),
 ) -> MetricRange:
     """
     Execute a PromQL range query against Prometheus.
@@ -83,7 +110,7 @@ async def query_range(
 
 @router.get("/alerts", response_model=AlertsResponse, summary="Get Active Alerts")
 async def get_alerts(
-    prometheus_service: PrometheusService = Depends(),
+    prometheus_service: PrometheusService = Depends(get_prometheus_service),
 ) -> AlertsResponse:
     """
     Get all active alerts from Prometheus.
@@ -106,7 +133,7 @@ async def get_alerts(
 async def list_metrics(
     match: Optional[str] = Query(
         None, description="Regex pattern to match metric names"),
-    prometheus_service: PrometheusService = Depends(),
+    prometheus_service: PrometheusService = Depends(get_prometheus_service),
 ) -> List[str]:
     """
     List available metrics in Prometheus.
@@ -132,7 +159,7 @@ async def list_metrics(
 async def get_metric_metadata(
     metric: Optional[str] = Query(
         None, description="Metric name to retrieve metadata for"),
-    prometheus_service: PrometheusService = Depends(),
+    prometheus_service: PrometheusService = Depends(get_prometheus_service),
 ) -> Dict[str, MetricResponse]:
     """
     Get metadata about metrics in Prometheus.
@@ -14,7 +14,7 @@ from app.models.proxmox import (
     VMRead,
     VMsList,
 )
-from app.services.proxmox_service import ProxmoxService
+from app.services.proxmox_service import ProxmoxService, get_proxmox_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -22,7 +22,7 @@ router = APIRouter()
 
 @router.get("/nodes", response_model=NodesList, summary="Get All Nodes")
 async def get_nodes(
-    proxmox_service: ProxmoxService = Depends(),
+    proxmox_service: ProxmoxService = Depends(get_proxmox_service),
 ) -> NodesList:
     """
     Retrieve all nodes from Proxmox cluster.
@@ -44,7 +44,7 @@ async def get_nodes(
 @router.get("/nodes/{node}", response_model=ClusterNodeRead, summary="Get Node Details")
 async def get_node(
     node: str = Path(..., description="The ID of the node to retrieve"),
-    proxmox_service: ProxmoxService = Depends(),
+    proxmox_service: ProxmoxService = Depends(get_proxmox_service),
 ) -> ClusterNodeRead:
     """
     Retrieve a specific node's details.
@@ -75,7 +75,7 @@ async def get_node(
 
 @router.get("/cluster", response_model=ClusterOverview, summary="Get Cluster Overview")
 async def get_cluster_overview(
-    proxmox_service: ProxmoxService = Depends(),
+    proxmox_service: ProxmoxService = Depends(get_proxmox_service),
 ) -> ClusterOverview:
     """
     Retrieve an overview of the Proxmox cluster.
@@ -97,7 +97,7 @@ async def get_cluster_overview(
 @router.get("/vms", response_model=VMsList, summary="Get All VMs")
 async def get_vms(
     node: Optional[str] = Query(None, description="Filter VMs by node"),
-    proxmox_service: ProxmoxService = Depends(),
+    proxmox_service: ProxmoxService = Depends(get_proxmox_service),
 ) -> VMsList:
     """
     Retrieve all virtual machines from Proxmox.
@@ -123,7 +123,7 @@ async def get_vms(
 async def get_vm(
     node: str = Path(..., description="The node where the VM is located"),
     vmid: int = Path(..., description="The ID of the VM to retrieve"),
-    proxmox_service: ProxmoxService = Depends(),
+    proxmox_service: ProxmoxService = Depends(get_proxmox_service),
 ) -> VMRead:
     """
     Retrieve a specific VM's details.
@@ -157,7 +157,7 @@ async def get_vm(
 async def create_vm(
     vm: VMCreate,
     node: str = Path(..., description="The node where to create the VM"),
-    proxmox_service: ProxmoxService = Depends(),
+    proxmox_service: ProxmoxService = Depends(get_proxmox_service),
 ) -> VMRead:
     """
     Create a new VM on a specific node.
@@ -184,7 +184,7 @@ async def create_vm(
 async def start_vm(
     node: str = Path(..., description="The node where the VM is located"),
     vmid: int = Path(..., description="The ID of the VM to start"),
-    proxmox_service: ProxmoxService = Depends(),
+    proxmox_service: ProxmoxService = Depends(get_proxmox_service),
 ) -> Dict[str, str]:
     """
     Start a VM.
@@ -211,7 +211,7 @@ async def start_vm(
 async def stop_vm(
     node: str = Path(..., description="The node where the VM is located"),
     vmid: int = Path(..., description="The ID of the VM to stop"),
-    proxmox_service: ProxmoxService = Depends(),
+    proxmox_service: ProxmoxService = Depends(get_proxmox_service),
 ) -> Dict[str, str]:
     """
     Stop a VM.
@@ -238,7 +238,7 @@ async def stop_vm(
 async def delete_vm(
     node: str = Path(..., description="The node where the VM is located"),
     vmid: int = Path(..., description="The ID of the VM to delete"),
-    proxmox_service: ProxmoxService = Depends(),
+    proxmox_service: ProxmoxService = Depends(get_proxmox_service),
 ) -> None:
     """
     Delete a VM from Proxmox.
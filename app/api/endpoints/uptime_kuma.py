@@ -18,18 +18,18 @@ from app.models.uptime_kuma import (
     StatusPageRead,
     StatusPagesList,
 )
-from app.services.uptime_kuma_service import UptimeKumaService
+from app.services.uptime_kuma_service import UptimeKumaService, get_uptime_kuma_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 @router.get("/info", summary="Get Uptime Kuma Instance Info")
-def get_info(
-    uptime_kuma_service: UptimeKumaService = Depends(),
+async def get_info(
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> dict:
     try:
-        return uptime_kuma_service.get_info()
+        return await uptime_kuma_service.get_info()
     except Exception as e:
         logger.error(f"Failed to get Uptime Kuma instance info: {str(e)}")
         raise HTTPException(
@@ -39,11 +39,11 @@ def get_info(
 
 
 @router.get("/monitors", response_model=MonitorsList, summary="Get All Monitors")
-def get_monitors(
-    uptime_kuma_service: UptimeKumaService = Depends(),
+async def get_monitors(
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> MonitorsList:
     try:
-        monitors = uptime_kuma_service.get_monitors()
+        monitors = await uptime_kuma_service.get_monitors()
         return MonitorsList(monitors=monitors)
     except Exception as e:
         logger.error(f"Failed to get monitors: {str(e)}")
@@ -101,22 +101,22 @@ def get_monitors(
     }
 )
 async def get_all_monitors_statistics(
-    service: UptimeKumaService = Depends()
+    service: UptimeKumaService = Depends(get_uptime_kuma_service)
 ):
     """
     Get comprehensive statistics for all monitors.
     """
-    return service.get_all_monitors_statistics()
+    return await service.get_all_monitors_statistics()
 
 
 @router.get("/monitors/{monitor_id}", response_model=MonitorRead, summary="Get Monitor by ID")
-def get_monitor(
+async def get_monitor(
     monitor_id: int = Path(...,
                            description="The ID of the monitor to retrieve"),
-    uptime_kuma_service: UptimeKumaService = Depends(),
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> MonitorRead:
     try:
-        monitor = uptime_kuma_service.get_monitor(monitor_id)
+        monitor = await uptime_kuma_service.get_monitor(monitor_id)
         if not monitor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -134,12 +134,12 @@ def get_monitor(
 
 
 @router.post("/monitors", response_model=MonitorRead, status_code=status.HTTP_201_CREATED, summary="Create Monitor")
-def create_monitor(
+async def create_monitor(
     monitor: MonitorCreate,
-    uptime_kuma_service: UptimeKumaService = Depends(),
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> MonitorRead:
     try:
-        new_monitor = uptime_kuma_service.create_monitor(monitor)
+        new_monitor = await uptime_kuma_service.create_monitor(monitor)
         return new_monitor
     except Exception as e:
         logger.error(f"Failed to create monitor: {str(e)}")
@@ -150,13 +150,13 @@ def create_monitor(
 
 
 @router.patch("/monitors/{monitor_id}", response_model=MonitorRead, summary="Update Monitor")
-def update_monitor(
+async def update_monitor(
     monitor_update: MonitorUpdate,
     monitor_id: int = Path(..., description="The ID of the monitor to update"),
-    uptime_kuma_service: UptimeKumaService = Depends(),
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> MonitorRead:
     try:
-        updated_monitor = uptime_kuma_service.update_monitor(
+        updated_monitor = await uptime_kuma_service.update_monitor(
             monitor_id, monitor_update)
         if not updated_monitor:
             raise HTTPException(
@@ -175,12 +175,12 @@ def update_monitor(
 
 
 @router.delete("/monitors/{monitor_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete Monitor")
-def delete_monitor(
+async def delete_monitor(
     monitor_id: int = Path(..., description="The ID of the monitor to delete"),
-    uptime_kuma_service: UptimeKumaService = Depends(),
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> None:
     try:
-        success = uptime_kuma_service.delete_monitor(monitor_id)
+        success = await uptime_kuma_service.delete_monitor(monitor_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -197,13 +197,13 @@ def delete_monitor(
 
 
 @router.get("/monitors/{monitor_id}/avg-ping", summary="Get Average Ping for Monitor")
-def get_avg_ping(
+async def get_avg_ping(
     monitor_id: int = Path(...,
                            description="The ID of the monitor to get average ping for"),
-    uptime_kuma_service: UptimeKumaService = Depends(),
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> Optional[float]:
     try:
-        return uptime_kuma_service.get_avg_ping(monitor_id)
+        return await uptime_kuma_service.get_avg_ping(monitor_id)
     except Exception as e:
         logger.error(
             f"Failed to get average ping for monitor {monitor_id}: {str(e)}")
@@ -214,13 +214,13 @@ def get_avg_ping(
 
 
 @router.get("/monitors/{monitor_id}/cert-info", summary="Get Certificate Info for Monitor")
-def get_cert_info(
+async def get_cert_info(
     monitor_id: int = Path(...,
                            description="The ID of the monitor to get certificate info for"),
-    uptime_kuma_service: UptimeKumaService = Depends(),
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> Optional[dict]:
     try:
-        return uptime_kuma_service.get_cert_info(monitor_id)
+        return await uptime_kuma_service.get_cert_info(monitor_id)
     except Exception as e:
         logger.error(
             f"Failed to get certificate info for monitor {monitor_id}: {str(e)}")
@@ -231,15 +231,15 @@ def get_cert_info(
 
 
 @router.get("/monitors/{monitor_id}/uptime", summary="Get Uptime for Monitor")
-def get_uptime(
+async def get_uptime(
     monitor_id: int = Path(...,
                            description="The ID of the monitor to get uptime for"),
     days: int = Query(
         7, description="Number of days to calculate uptime for", ge=1),
-    uptime_kuma_service: UptimeKumaService = Depends(),
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> Optional[float]:
     try:
-        return uptime_kuma_service.get_uptime(monitor_id, days)
+        return await uptime_kuma_service.get_uptime(monitor_id, days)
     except Exception as e:
         logger.error(
             f"Failed to get uptime for monitor {monitor_id}: {str(e)}")
@@ -250,13 +250,13 @@ def get_uptime(
 
 
 @router.get("/monitors/{monitor_id}/statistics", summary="Get Comprehensive Statistics for Monitor")
-def get_monitor_statistics(
+async def get_monitor_statistics(
     monitor_id: int = Path(...,
                            description="The ID of the monitor to get statistics for"),
-    uptime_kuma_service: UptimeKumaService = Depends(),
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> dict:
     try:
-        return uptime_kuma_service.get_monitor_statistics(monitor_id)
+        return await uptime_kuma_service.get_monitor_statistics(monitor_id)
     except Exception as e:
         logger.error(
             f"Failed to get statistics for monitor {monitor_id}: {str(e)}")
@@ -267,11 +267,11 @@ def get_monitor_statistics(
 
 
 @router.get("/status-pages", response_model=StatusPagesList, summary="Get All Status Pages")
-def get_status_pages(
-    uptime_kuma_service: UptimeKumaService = Depends(),
+async def get_status_pages(
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> StatusPagesList:
     try:
-        status_pages = uptime_kuma_service.get_status_pages()
+        status_pages = await uptime_kuma_service.get_status_pages()
         return StatusPagesList(status_pages=status_pages)
     except Exception as e:
         logger.error(f"Failed to get status pages: {str(e)}")
@@ -282,13 +282,13 @@ def get_status_pages(
 
 
 @router.get("/status-pages/{page_id}", response_model=StatusPageRead, summary="Get Status Page by ID")
-def get_status_page(
+async def get_status_page(
     page_id: int = Path(...,
                         description="The ID of the status page to retrieve"),
-    uptime_kuma_service: UptimeKumaService = Depends(),
+    uptime_kuma_service: UptimeKumaService = Depends(get_uptime_kuma_service),
 ) -> StatusPageRead:
     try:
-        status_page = uptime_kuma_service.get_status_page(page_id)
+        status_page = await uptime_kuma_service.get_status_page(page_id)
         if not status_page:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
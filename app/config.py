@@ -53,6 +53,7 @@ class Settings(BaseSettings):
     PROXMOX_USERNAME: str = os.getenv("PROXMOX_USERNAME", "")
     PROXMOX_PASSWORD: str = os.getenv("PROXMOX_PASSWORD", "")
     PROXMOX_VERIFY_SSL: bool = os.getenv("PROXMOX_VERIFY_SSL", "True").lower() == "true"
+    PROXMOX_WATCH_INTERVAL: int = int(os.getenv("PROXMOX_WATCH_INTERVAL", "15"))
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -2,7 +2,7 @@
 Database models for the application.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database.base import Base, TimestampMixin
 
@@ -18,12 +18,17 @@ class User(Base, TimestampMixin):
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
     token = Column(String(255), nullable=True)
-    token_expires_at = Column(DateTime, nullable=True)
+    token_expires_at = Column(DateTime(timezone=True), nullable=True)
     last_login = Column(DateTime, nullable=True)
     
     # Relationship with ServiceCredentials
     credentials = relationship("ServiceCredentials", back_populates="user")
 
+    __table_args__ = (
+        # verify_user_token looks users up by their login token
+        Index("ix_users_token", "token"),
+    )
+
 
 class ServiceCredentials(Base, TimestampMixin):
     """Model for storing service JWT bearer tokens associated with users."""
@@ -33,8 +38,21 @@ class ServiceCredentials(Base, TimestampMixin):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     service_name = Column(String(100), nullable=False)
     token = Column(String(1024), nullable=False)
-    token_expires_at = Column(DateTime, nullable=False)
+    token_expires_at = Column(DateTime(timezone=True), nullable=False)
     is_active = Column(Boolean, default=True)
     
     # Relationship with User
-    user = relationship("User", back_populates="credentials")
\ No newline at end of file
+    user = relationship("User", back_populates="credentials")
+
+    __table_args__ = (
+        # verify_token looks up active credentials by token; partial on
+        # PostgreSQL, prefix-length on MySQL where the column is too wide
+        Index(
+            "ix_svc_cred_token_active",
+            "token",
+            postgresql_where=is_active,
+            mysql_length=255,
+        ),
+        # create_access_token upserts on (user_id, service_name)
+        Index("ix_svc_cred_user_service", "user_id", "service_name"),
+    )
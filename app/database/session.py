@@ -17,6 +17,8 @@ engine = create_engine(
     settings.DATABASE_URL.replace('mysql+mysqlconnector', 'mysql+pymysql'),
     pool_pre_ping=True,
     pool_recycle=3600,
+    # Room for the credentials service's prepared statements plus ad-hoc queries
+    query_cache_size=1200,
     connect_args=settings.DATABASE_CONNECT_ARGS,
 )
 
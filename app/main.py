@@ -2,6 +2,8 @@
 Entry point for the FastAPI application.
 This module initializes and configures the API.
 """
+import asyncio
+import contextlib
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -9,13 +11,17 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
-from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
 
 from app.api.router import main_router
 from app.core.exceptions import register_exception_handlers
 from app.core.logging import setup_logging
 from app.api.endpoints import credentials
 from app.config import get_settings
+from app.services.grafana_service import GrafanaService
+from app.services.prometheus_service import PrometheusService
+from app.services.proxmox_service import ProxmoxService
+from app.services.uptime_kuma_service import UptimeKumaService
 
 # Configure logging first
 setup_logging()
@@ -84,10 +90,72 @@ async def lifespan(app: FastAPI):
             logger.error(f"Error during database initialization: {e}")
             # Continue startup even if database initialization fails
     
+    # Build the API clients up front so the first request doesn't pay for the
+    # connection setup, and bad configuration shows up in the startup logs
+    app.state.grafana_service = GrafanaService(settings)
+    app.state.prometheus_service = PrometheusService(settings)
+    app.state.proxmox_service = ProxmoxService(settings)
+    app.state.uptime_kuma_service = UptimeKumaService(settings)
+    
+    async def warm_up(name: str, service) -> None:
+        try:
+            await asyncio.wait_for(service.check_health(), timeout=settings.DEFAULT_TIMEOUT)
+            logger.info(f"{name} client ready")
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"{name} client warm-up timed out after {settings.DEFAULT_TIMEOUT}s")
+        except Exception as e:
+            logger.warning(f"{name} client warm-up failed: {e}")
+        # Continue startup either way; requests will report the failure
+    
+    # The health checks run their blocking client calls in threads, so the
+    # warm-ups overlap and startup waits for the slowest one, not the sum
+    await asyncio.gather(*(
+        warm_up(name, service)
+        for name, service, url in (
+            ("Grafana", app.state.grafana_service, settings.GRAFANA_URL),
+            ("Prometheus", app.state.prometheus_service, settings.PROMETHEUS_URL),
+            ("Proxmox", app.state.proxmox_service, settings.PROXMOX_URL),
+            ("Uptime Kuma", app.state.uptime_kuma_service, settings.UPTIME_KUMA_URL),
+        )
+        if url
+    ))
+    
+    # Invalidate cached Proxmox data as cluster tasks come in
+    proxmox_watcher = None
+    if settings.PROXMOX_URL:
+        proxmox_watcher = asyncio.create_task(
+            app.state.proxmox_service.watch_cluster_tasks(settings.PROXMOX_WATCH_INTERVAL)
+        )
+    
     yield
     
     # Perform cleanup operations here, such as closing connections
     logger.info("Shutting down monitoring and infrastructure management API")
+    if proxmox_watcher is not None:
+        proxmox_watcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await proxmox_watcher
+    app.state.prometheus_service.close()
+    await app.state.uptime_kuma_service.close()
+
+
+def generate_operation_id(route: APIRoute) -> str:
+    """
+    Build short OpenAPI operation IDs from the route's tag and function name.
+    
+    The default IDs repeat the full path and method, which bloats the schema
+    and the names of generated client methods.
+    
+    Args:
+        route: API route
+        
+    Returns:
+        str: Operation ID, e.g. "proxmox-get_vms"
+    """
+    if route.tags:
+        return f"{route.tags[0]}-{route.name}"
+    return route.name
 
 
 # Initialize FastAPI application with custom configuration
@@ -97,6 +165,7 @@ app = FastAPI(
     version="1.0.0",  # Change this to your desired version
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    generate_unique_id_function=generate_operation_id,
     docs_url=None,  # We'll serve custom Swagger UI
     redoc_url=None,  # We'll serve custom ReDoc
 )
@@ -133,12 +202,8 @@ async def custom_swagger_ui_html():
 @app.get("/openapi.json", include_in_schema=False)
 async def get_open_api_endpoint():
     """Serve OpenAPI schema."""
-    return get_openapi(
-        title=app.title,
-        version=app.version,
-        description=app.description,
-        routes=app.routes,
-    )
+    # app.openapi() builds the schema once and reuses it afterwards
+    return app.openapi()
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ Credential models for the API.
 from datetime import datetime
 from typing import Dict, Optional, Any, List
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 
 
 class ServiceCredentialBase(BaseModel):
@@ -35,9 +35,7 @@ class ServiceCredentialResponse(ServiceCredentialBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ServiceCredentialList(BaseModel):
@@ -36,6 +36,20 @@ class MetricRange(BaseModel):
     data: Optional[List[Dict[str, Any]]] = Field(None, description="Range query result data")
 
 
+class RangeQueryData(BaseModel):
+    """Model for the data section of a Prometheus range query response."""
+    
+    resultType: str = Field(..., description="Type of the result vector")
+    result: List[Dict[str, Any]] = Field(..., description="Range query result series")
+
+
+class RangeQueryResponse(BaseModel):
+    """Model for a raw Prometheus /api/v1/query_range response."""
+    
+    status: str = Field(..., description="Status of the query")
+    data: RangeQueryData = Field(..., description="Range query result")
+
+
 class Alert(BaseModel):
     """Model for Prometheus alert."""
     
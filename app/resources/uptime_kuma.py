@@ -1,6 +1,8 @@
 from typing import Dict, List, Any, Optional
+from collections import Counter
 from datetime import datetime
 import re
+import statistics
 
 
 class UptimeKumaResource:
@@ -249,11 +251,8 @@ class MonitorStatisticsResource(UptimeKumaResource):
         uptime_data = UptimeResource.transform(data.get("uptime", {}))
 
         # Calculate status change frequency
-        status_changes = 0
-        if len(heartbeats) > 1:
-            for i in range(1, len(heartbeats)):
-                if heartbeats[i].get("status") != heartbeats[i-1].get("status"):
-                    status_changes += 1
+        status_changes = sum(1 for prev, hb in zip(heartbeats, heartbeats[1:])
+                             if hb.get("status") != prev.get("status"))
 
         # Calculate time since last status change
         last_status_change_time = None
@@ -264,11 +263,10 @@ class MonitorStatisticsResource(UptimeKumaResource):
 
         # Calculate response time stability (standard deviation of ping)
         ping_stability = "-"
-        if valid_pings and len(valid_pings) > 1:
+        if len(valid_pings) > 1:
             try:
-                import statistics
                 ping_stability = round(statistics.stdev(valid_pings), 2)
-            except (ImportError, statistics.StatisticsError):
+            except statistics.StatisticsError:
                 pass
 
         # Create logs from heartbeats
@@ -431,9 +429,10 @@ class AllMonitorsStatisticsResource(UptimeKumaResource):
         # Add timestamp
         current_time = datetime.now().isoformat()
 
-        # Calculate average health score across all monitors
-        health_scores = [m.get("health_score") for m in monitors
-                         if m.get("health_score") != "-" and not m.get("maintenance")]
+        # Calculate average health score and response time across all monitors
+        active_monitors = [m for m in monitors if not m.get("maintenance")]
+        health_scores = [m.get("health_score") for m in active_monitors
+                         if m.get("health_score") != "-"]
         avg_health_score = "-"
         if health_scores:
             try:
@@ -442,6 +441,14 @@ class AllMonitorsStatisticsResource(UptimeKumaResource):
             except (TypeError, ZeroDivisionError):
                 pass
 
+        response_times = [m.get("avg_ping_calculated") for m in active_monitors
+                          if m.get("avg_ping_calculated") != "-"]
+        avg_response_time = round(sum(response_times) / len(response_times), 2) \
+            if response_times else "-"
+
+        # Count monitors per type in a single pass
+        type_counts = Counter(m.get("type") for m in monitors if m.get("type") != "-")
+
         return {
             "uptime_kuma_info": UptimeKumaInfoResource.transform(data.get("uptime_kuma_info", {})),
             "monitors": monitors,
@@ -456,11 +463,7 @@ class AllMonitorsStatisticsResource(UptimeKumaResource):
             "timestamp": current_time,
             "avg_health_score": avg_health_score,
             # Additional analytics
-            "monitor_types": list(set(m.get("type") for m in monitors if m.get("type") != "-")),
-            "monitors_by_type": {t: len([m for m in monitors if m.get("type") == t])
-                                 for t in set(m.get("type") for m in monitors if m.get("type") != "-")},
-            "avg_response_time": round(sum(m.get("avg_ping_calculated") for m in monitors
-                                           if m.get("avg_ping_calculated") != "-" and not m.get("maintenance")) /
-                                       len([m for m in monitors if m.get("avg_ping_calculated") != "-" and not m.get("maintenance")]), 2)
-            if len([m for m in monitors if m.get("avg_ping_calculated") != "-" and not m.get("maintenance")]) > 0 else "-"
+            "monitor_types": list(type_counts),
+            "monitors_by_type": dict(type_counts),
+            "avg_response_time": avg_response_time
         }
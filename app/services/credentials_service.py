@@ -1,18 +1,81 @@
-from datetime import datetime, timedelta
+import base64
+import binascii
+import calendar
+import hmac
+import json
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 from jose import jwt, JWTError
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy import bindparam, update, delete
 
 from passlib.context import CryptContext
+from pydantic import TypeAdapter
 from app.models.user import User, UserInDB, UserCreate, UserUpdate
 from app.models.credentials import ServiceCredentialCreate, ServiceCredentialResponse, ServiceCredentialUpdate
 from app.database.models import ServiceCredentials, User as DBUser
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Built once and reused for every authenticated request
+_user_validator = TypeAdapter(UserInDB)
+
+# Only the columns UserInDB needs; skips ORM hydration on the auth hot path
+_USER_IN_DB_COLUMNS = (
+    DBUser.id,
+    DBUser.username,
+    DBUser.email,
+    DBUser.hashed_password,
+    DBUser.is_active,
+    DBUser.is_superuser,
+    DBUser.created_at,
+    DBUser.updated_at,
+)
+
+# Statements are built once so SQLAlchemy's compiled cache is hit on every call
+_GET_USER_BY_USERNAME = select(*_USER_IN_DB_COLUMNS).where(DBUser.username == bindparam("username"))
+_GET_USER_ID_BY_USERNAME = select(DBUser.id).where(DBUser.username == bindparam("username"))
+_GET_USER_BY_TOKEN = select(*_USER_IN_DB_COLUMNS).where(
+    DBUser.username == bindparam("username"),
+    DBUser.token == bindparam("token"),
+    DBUser.token_expires_at > bindparam("now"),
+)
+_GET_SERVICE_CREDENTIAL_ID = select(ServiceCredentials.id).where(
+    ServiceCredentials.user_id == bindparam("user_id"),
+    ServiceCredentials.service_name == bindparam("service_name"),
+)
+_GET_ACTIVE_CREDENTIAL_EXPIRY_BY_TOKEN = select(ServiceCredentials.token_expires_at).where(
+    ServiceCredentials.token == bindparam("token"),
+    ServiceCredentials.is_active == True,
+)
+_GET_ACTIVE_CREDENTIALS_BY_USER = select(
+    ServiceCredentials.service_name,
+    ServiceCredentials.token,
+    ServiceCredentials.token_expires_at,
+    ServiceCredentials.is_active,
+).where(
+    ServiceCredentials.user_id == bindparam("user_id"),
+    ServiceCredentials.is_active == True,
+)
+
+# HMAC algorithms we sign/verify ourselves; anything else goes through jose
+_HMAC_DIGESTS = {"HS256": "sha256", "HS384": "sha384", "HS512": "sha512"}
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _as_utc(value: datetime) -> datetime:
+    # MySQL DATETIME columns come back naive; they are stored in UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
 
 class CredentialsService:
     def __init__(self, secret_key: str, algorithm: str = "HS256", token_expire_minutes: int = 30):
@@ -20,17 +83,86 @@ class CredentialsService:
         self.algorithm = algorithm
         self.token_expire_minutes = token_expire_minutes
 
+        # The HMAC key schedule only depends on the secret, so prime it once
+        # and copy the context for every sign/verify instead of rederiving it.
+        self._signing_key = self.secret_key.encode()
+        digest = _HMAC_DIGESTS.get(self.algorithm)
+        self._hmac_template = hmac.new(self._signing_key, digestmod=digest) if digest else None
+        self._header_segment = _b64url_encode(json.dumps(
+            {"alg": self.algorithm, "typ": "JWT"},
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode())
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        h = self._hmac_template.copy()
+        h.update(signing_input)
+        return h.digest()
+
+    def _encode_token(self, claims: dict) -> str:
+        """Encode a JWT, signing with the primed HMAC context when possible."""
+        if self._hmac_template is None:
+            return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+        claims = dict(claims)
+        if isinstance(claims.get("exp"), datetime):
+            claims["exp"] = calendar.timegm(claims["exp"].utctimetuple())
+        payload_segment = _b64url_encode(json.dumps(claims, separators=(",", ":")).encode())
+        signing_input = self._header_segment + b"." + payload_segment
+        signature = _b64url_encode(self._sign(signing_input))
+        return (signing_input + b"." + signature).decode()
+
+    def _decode_token(self, token: str, now: Optional[datetime] = None) -> dict:
+        """
+        Verify a JWT and return its claims.
+
+        The signature is checked with the primed HMAC context before any of
+        the payload JSON is parsed. Raises the same jose exceptions as
+        jwt.decode so callers can handle both paths identically.
+        """
+        if self._hmac_template is None:
+            return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+
+        try:
+            signing_input, _, crypto_segment = token.encode().rpartition(b".")
+            header_segment, _, payload_segment = signing_input.partition(b".")
+            signature = _b64url_decode(crypto_segment)
+        except (UnicodeEncodeError, binascii.Error, ValueError):
+            raise JWTError("Invalid token encoding")
+
+        if not header_segment or not hmac.compare_digest(self._sign(signing_input), signature):
+            raise JWTError("Signature verification failed.")
+
+        try:
+            header = json.loads(_b64url_decode(header_segment))
+            claims = json.loads(_b64url_decode(payload_segment))
+        except (binascii.Error, ValueError):
+            raise JWTError("Invalid token payload")
+
+        if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+            raise JWTError("The specified alg value is not allowed")
+        if not isinstance(claims, dict):
+            raise JWTError("Invalid payload string: must be a json object")
+
+        exp = claims.get("exp")
+        if exp is not None:
+            if not isinstance(exp, (int, float)):
+                raise JWTError("Expiration Time claim (exp) must be an integer.")
+            now = now or datetime.now(timezone.utc)
+            if exp <= calendar.timegm(now.utctimetuple()):
+                raise jwt.ExpiredSignatureError("Signature has expired.")
+
+        return claims
+
     def get_user(self, db: AsyncSession, username: str) -> Optional[UserInDB]:
-        result = db.execute(select(DBUser).where(DBUser.username == username))
-        user = result.scalars().first()
-        if user:
-            return UserInDB.from_orm(user)
+        row = db.execute(_GET_USER_BY_USERNAME, {"username": username}).first()
+        if row:
+            return _user_validator.validate_python(row, from_attributes=True)
         return None
 
     def create_user(self, db: AsyncSession, user_data: UserCreate) -> dict:
         # Check if user exists
-        result = db.execute(select(DBUser).where(
-            DBUser.username == user_data.username))
+        result = db.execute(_GET_USER_ID_BY_USERNAME, {"username": user_data.username})
         existing_user = result.scalar_one_or_none()
 
         if existing_user:
@@ -40,15 +172,15 @@ class CredentialsService:
             )
 
         # Create new user
-        current_time = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         hashed_password = self.get_password_hash(user_data.password)
         db_user = DBUser(
             username=user_data.username,
             email=user_data.email,
             hashed_password=hashed_password,
             is_active=True,
-            created_at=current_time,
-            updated_at=current_time
+            created_at=now,
+            updated_at=now
         )
 
         db.add(db_user)
@@ -65,7 +197,7 @@ class CredentialsService:
         }
 
         # Generate login token
-        token_data = self.login_token(db, UserInDB.from_orm(db_user))
+        token_data = self.login_token(db, UserInDB.model_validate(db_user), now=now)
 
         return {
             **user_data,
@@ -87,21 +219,21 @@ class CredentialsService:
             return None
         if not self.verify_password(password, user.hashed_password):
             return None
-        return User.from_orm(user)
+        return User.model_validate(user)
 
-    def login_token(self, db: AsyncSession, user: UserInDB, expires_delta: Optional[timedelta] = None) -> dict:
+    def login_token(self, db: AsyncSession, user: UserInDB, expires_delta: Optional[timedelta] = None, now: Optional[datetime] = None) -> dict:
         # Create token with expiration
+        now = now or datetime.now(timezone.utc)
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=self.token_expire_minutes)
+            expire = now + timedelta(minutes=self.token_expire_minutes)
 
         to_encode = {
             "sub": user.username,
             "exp": expire
         }
-        token = jwt.encode(to_encode, self.secret_key,
-                           algorithm=self.algorithm)
+        token = self._encode_token(to_encode)
 
         # Update user table with login token
         db.execute(
@@ -110,7 +242,7 @@ class CredentialsService:
             .values(
                 token=token,
                 token_expires_at=expire,
-                updated_at=datetime.utcnow()
+                updated_at=now
             )
         )
         db.commit()
@@ -123,32 +255,29 @@ class CredentialsService:
 
     def create_access_token(self, db: AsyncSession, user: UserInDB, service_name: str, expires_delta: Optional[timedelta] = None) -> dict:
         # Create token with expiration
+        now = datetime.now(timezone.utc)
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=self.token_expire_minutes)
+            expire = now + timedelta(minutes=self.token_expire_minutes)
 
         to_encode = {
             "sub": user.username,
             "exp": expire
         }
-        token = jwt.encode(to_encode, self.secret_key,
-                           algorithm=self.algorithm)
+        token = self._encode_token(to_encode)
 
         # Create or update service credential
         result = db.execute(
-            select(ServiceCredentials)
-            .where(
-                ServiceCredentials.user_id == user.id,
-                ServiceCredentials.service_name == service_name
-            )
+            _GET_SERVICE_CREDENTIAL_ID,
+            {"user_id": user.id, "service_name": service_name}
         )
-        existing_cred = result.scalars().first()
+        existing_cred_id = result.scalars().first()
 
-        if existing_cred:
+        if existing_cred_id:
             db.execute(
                 update(ServiceCredentials)
-                .where(ServiceCredentials.id == existing_cred.id)
+                .where(ServiceCredentials.id == existing_cred_id)
                 .values(
                     token=token,
                     token_expires_at=expire,
@@ -175,25 +304,20 @@ class CredentialsService:
         }
 
     def verify_token(self, db: AsyncSession, token: str) -> dict:
+        now = datetime.now(timezone.utc)
         try:
             # First decode the token to check its basic validity
-            payload = jwt.decode(token, self.secret_key,
-                                 algorithms=[self.algorithm])
+            payload = self._decode_token(token, now)
             if not payload:
                 raise HTTPException(status_code=401, detail="Invalid token")
 
-            # Check if token exists in service_credentials and is not expired
-            result = db.execute(
-                select(ServiceCredentials)
-                .where(
-                    ServiceCredentials.token == token,
-                    ServiceCredentials.token_expires_at > datetime.utcnow(),
-                    ServiceCredentials.is_active == True
-                )
-            )
-            service_cred = result.scalars().first()
+            # Check if token exists in service_credentials and is not expired.
+            # Only filter on the columns covered by ix_svc_cred_token_active
+            # and check the expiry here so the planner can use the index.
+            result = db.execute(_GET_ACTIVE_CREDENTIAL_EXPIRY_BY_TOKEN, {"token": token})
+            expires_at = result.scalars().first()
 
-            if not service_cred:
+            if not expires_at or _as_utc(expires_at) <= now:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Token not found or expired",
@@ -215,14 +339,8 @@ class CredentialsService:
                 headers={"WWW-Authenticate": "Bearer"})
 
     def get_user_service_credentials(self, db: AsyncSession, user_id: int) -> list:
-        result = db.execute(
-            select(ServiceCredentials)
-            .where(
-                ServiceCredentials.user_id == user_id,
-                ServiceCredentials.is_active == True
-            )
-        )
-        credentials = result.scalars().all()
+        result = db.execute(_GET_ACTIVE_CREDENTIALS_BY_USER, {"user_id": user_id})
+        credentials = result.all()
         return [
             {
                 "service_name": cred.service_name,
@@ -233,45 +351,40 @@ class CredentialsService:
             for cred in credentials
         ]
 
-    def delete_service_credential(self, db: AsyncSession, credential_id: int) -> bool:
-        """Delete a service credential by its ID."""
-        result = db.execute(
-            delete(ServiceCredentials)
-            .where(ServiceCredentials.id == credential_id)
-            .returning(ServiceCredentials.id)
-        )
-        deleted = result.scalar_one_or_none()
+    def delete_service_credential(self, db: AsyncSession, credential_id: int, user_id: Optional[int] = None) -> bool:
+        """Delete a service credential by its ID, optionally scoped to its owner."""
+        stmt = delete(ServiceCredentials).where(ServiceCredentials.id == credential_id)
+        if user_id is not None:
+            stmt = stmt.where(ServiceCredentials.user_id == user_id)
+        result = db.execute(stmt)
         db.commit()
-        return bool(deleted)
+        return result.rowcount > 0
 
     def verify_user_token(self, db: AsyncSession, token: str) -> UserInDB:
         """Verify user token and check expiration."""
+        now = datetime.now(timezone.utc)
         try:
             # First decode the token
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = self._decode_token(token, now)
             username = payload.get("sub")
             if not username:
                 raise HTTPException(status_code=401, detail="Invalid token")
 
             # Check if token exists in user table and is not expired
             result = db.execute(
-                select(DBUser)
-                .where(
-                    DBUser.username == username,
-                    DBUser.token == token,
-                    DBUser.token_expires_at > datetime.utcnow()
-                )
+                _GET_USER_BY_TOKEN,
+                {"username": username, "token": token, "now": now}
             )
-            user = result.scalars().first()
+            row = result.first()
 
-            if not user:
+            if not row:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Token expired. Please login again.",
                     headers={"WWW-Authenticate": "Bearer"},
                 )
 
-            return UserInDB.from_orm(user)
+            return _user_validator.validate_python(row, from_attributes=True)
 
         except jwt.ExpiredSignatureError:
             raise HTTPException(
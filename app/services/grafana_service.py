@@ -1,7 +1,8 @@
+import asyncio
 import logging
 from typing import Dict, List, Optional, Union
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from grafana_client import GrafanaApi
 
 from app.config import Settings, get_settings
@@ -61,7 +62,12 @@ class GrafanaService:
     async def check_health(self) -> bool:
         client = await self._get_client()
         try:
-            health = client.health.check()
+            # GrafanaApi is synchronous; run it off the loop so a slow
+            # Grafana doesn't stall the other health checks
+            health = await asyncio.wait_for(
+                asyncio.to_thread(client.health.check),
+                timeout=self.settings.DEFAULT_TIMEOUT,
+            )
             logger.debug(f"Grafana health check: {health}")
             return True
         except Exception as e:
@@ -78,9 +84,9 @@ class GrafanaService:
             
             logger.debug(f"Retrieved {len(dashboards)} dashboards")
             
-            result = []
-            for dashboard in dashboards:
-                result.append(DashboardRead(
+            # Search results come straight from Grafana, so skip re-validation
+            return [
+                DashboardRead.model_construct(
                     id=dashboard.get("id"),
                     uid=dashboard.get("uid"),
                     title=dashboard.get("title"),
@@ -89,9 +95,9 @@ class GrafanaService:
                     folder_title=dashboard.get("folderTitle"),
                     is_starred=dashboard.get("isStarred", False),
                     tags=dashboard.get("tags", []),
-                ))
-            
-            return result
+                )
+                for dashboard in dashboards
+            ]
         except Exception as e:
             logger.error(f"Failed to get dashboards: {str(e)}")
             raise
@@ -164,16 +170,15 @@ class GrafanaService:
             folders = client.folder.get_all_folders()
             logger.debug(f"Retrieved {len(folders)} folders")
             
-            result = []
-            for folder in folders:
-                result.append(FolderRead(
+            return [
+                FolderRead.model_construct(
                     id=folder.get("id"),
                     uid=folder.get("uid"),
                     title=folder.get("title"),
                     url=folder.get("url"),
-                ))
-            
-            return result
+                )
+                for folder in folders
+            ]
         except Exception as e:
             logger.error(f"Failed to get folders: {str(e)}")
             raise
@@ -200,9 +205,8 @@ class GrafanaService:
             datasources = client.datasource.list_datasources()
             logger.debug(f"Retrieved {len(datasources)} data sources")
             
-            result = []
-            for ds in datasources:
-                result.append(DataSourceRead(
+            return [
+                DataSourceRead.model_construct(
                     id=ds.get("id"),
                     uid=ds.get("uid"),
                     name=ds.get("name"),
@@ -210,9 +214,9 @@ class GrafanaService:
                     url=ds.get("url"),
                     access=ds.get("access"),
                     is_default=ds.get("isDefault", False),
-                ))
-            
-            return result
+                )
+                for ds in datasources
+            ]
         except Exception as e:
             logger.error(f"Failed to get data sources: {str(e)}")
             raise
@@ -237,3 +241,16 @@ class GrafanaService:
         except Exception as e:
             logger.error(f"Failed to create data source: {str(e)}")
             raise
+
+
+def get_grafana_service(request: Request) -> GrafanaService:
+    """
+    Get the application-wide Grafana service.
+
+    The service and its client are built during startup (see the lifespan
+    in app.main); apps started without it get one on first use.
+    """
+    service = getattr(request.app.state, "grafana_service", None)
+    if service is None:
+        service = request.app.state.grafana_service = GrafanaService(get_settings())
+    return service
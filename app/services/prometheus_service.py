@@ -1,12 +1,14 @@
 """
 Service for interacting with the Prometheus API.
 """
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
-from fastapi import Depends
-from prometheus_api_client import PrometheusConnect
+import requests
+from fastapi import Depends, Request
+from prometheus_api_client import PrometheusConnect, PrometheusApiClientException
 
 from app.config import Settings, get_settings
 from app.models.prometheus import (
@@ -14,10 +16,13 @@ from app.models.prometheus import (
     MetricRange,
     MetricResponse,
     QueryResult,
+    RangeQueryResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+HEADERS = {"User-Agent": "PrometheusIntegrationAPI/0.1.0"}
+
 
 class PrometheusService:
     """Service for interacting with Prometheus API."""
@@ -31,6 +36,8 @@ class PrometheusService:
         """
         self.settings = settings
         self.client = None
+        self._session = None
+        self._auth = None
     
     async def _get_client(self) -> PrometheusConnect:
         """
@@ -43,12 +50,17 @@ class PrometheusService:
             auth = None
             if self.settings.PROMETHEUS_USERNAME and self.settings.PROMETHEUS_PASSWORD:
                 auth = (self.settings.PROMETHEUS_USERNAME, self.settings.PROMETHEUS_PASSWORD)
+            self._auth = auth
+            
+            # Own the HTTP session so range queries can bypass the SDK's JSON decoding
+            self._session = requests.Session()
+            self._session.verify = self.settings.PROMETHEUS_URL.startswith("https")
             
             self.client = PrometheusConnect(
                 url=self.settings.PROMETHEUS_URL,
-                disable_ssl=not self.settings.PROMETHEUS_URL.startswith("https"),
-                headers={"User-Agent": "PrometheusIntegrationAPI/0.1.0"},
+                headers=HEADERS,
                 auth=auth,
+                session=self._session,
             )
             logger.info("Successfully connected to Prometheus API")
         return self.client
@@ -66,7 +78,10 @@ class PrometheusService:
         client = await self._get_client()
         try:
             # Use a simple query to check if Prometheus is up
-            result = client.custom_query(query="up")
+            result = await asyncio.wait_for(
+                asyncio.to_thread(client.custom_query, query="up"),
+                timeout=self.settings.DEFAULT_TIMEOUT,
+            )
             logger.debug(f"Prometheus health check successful: {result}")
             return True
         except Exception as e:
@@ -86,13 +101,11 @@ class PrometheusService:
         """
         client = await self._get_client()
         
-        # Convert time to string format if provided
-        timestamp = None
-        if time:
-            timestamp = time.timestamp()
+        # The evaluation time goes out as a query parameter, only when given
+        params = {"time": time.timestamp()} if time else None
         
         try:
-            result = client.custom_query(query=query, time=timestamp)
+            result = client.custom_query(query=query, params=params)
             logger.debug(f"Executed Prometheus query: {query}")
             return QueryResult(
                 status="success",
@@ -102,12 +115,47 @@ class PrometheusService:
             logger.error(f"Failed to execute Prometheus query {query}: {str(e)}")
             raise
     
+    async def query_batch(
+        self, queries: List[str], time: Optional[datetime] = None
+    ) -> List[QueryResult]:
+        """
+        Execute several PromQL queries concurrently.
+        
+        The queries share the client's HTTP session, so they reuse its
+        keep-alive connections instead of paying a new handshake each.
+        
+        Args:
+            queries: PromQL query strings
+            time: Optional evaluation timestamp applied to every query
+            
+        Returns:
+            List[QueryResult]: Query results, in the same order as the queries
+        """
+        client = await self._get_client()
+        
+        params = {"time": time.timestamp()} if time else None
+        
+        try:
+            results = await asyncio.gather(*(
+                asyncio.to_thread(client.custom_query, query=query, params=params)
+                for query in queries
+            ))
+            logger.debug(f"Executed {len(queries)} Prometheus queries in batch")
+            return [QueryResult(status="success", data=result) for result in results]
+        except Exception as e:
+            logger.error(f"Failed to execute Prometheus query batch: {str(e)}")
+            raise
+    
     async def query_range(
         self, query: str, start: datetime, end: datetime, step: str
     ) -> MetricRange:
         """
         Execute a PromQL range query.
         
+        Range queries can return hundreds of thousands of samples, so the
+        response body is parsed and validated in a single pass by Pydantic
+        rather than decoded through the SDK.
+        
         Args:
             query: PromQL query string
             start: Start timestamp
@@ -117,23 +165,35 @@ class PrometheusService:
         Returns:
             MetricRange: Range query result data
         """
-        client = await self._get_client()
+        # Only for its side effect: it sets up self._session and self._auth
+        await self._get_client()
         
         # Convert timestamps to string format
         start_time = start.timestamp()
         end_time = end.timestamp()
         
         try:
-            result = client.custom_query_range(
-                query=query,
-                start_time=start_time,
-                end_time=end_time,
-                step=step
+            response = self._session.get(
+                f"{self.settings.PROMETHEUS_URL}/api/v1/query_range",
+                params={
+                    "query": query,
+                    "start": start_time,
+                    "end": end_time,
+                    "step": step,
+                },
+                headers=HEADERS,
+                auth=self._auth,
+                timeout=self.settings.DEFAULT_TIMEOUT,
             )
+            if response.status_code != 200:
+                raise PrometheusApiClientException(
+                    f"HTTP Status Code {response.status_code} ({response.content!r})"
+                )
+            body = RangeQueryResponse.model_validate_json(response.content)
             logger.debug(f"Executed Prometheus range query: {query}")
-            return MetricRange(
-                status="success",
-                data=result
+            return MetricRange.model_construct(
+                status=body.status,
+                data=body.data.result
             )
         except Exception as e:
             logger.error(f"Failed to execute Prometheus range query {query}: {str(e)}")
@@ -190,15 +250,43 @@ class PrometheusService:
             logger.debug(f"Retrieved metadata for Prometheus metrics")
             
             # Convert to our model format
-            result = {}
-            for key, value in metadata.items():
-                result[key] = MetricResponse(
+            return {
+                key: MetricResponse.model_construct(
                     type=value.get("type", ""),
                     help=value.get("help", ""),
                     unit=value.get("unit", "")
                 )
-            
-            return result
+                for key, value in metadata.items()
+            }
         except Exception as e:
             logger.error(f"Failed to get Prometheus metric metadata: {str(e)}")
             raise
+    
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session.
+        """
+        if self._session is not None:
+            self._session.close()
+            logger.info("Closed Prometheus API session")
+        self.client = None
+        self._session = None
+
+
+def get_prometheus_service(request: Request) -> PrometheusService:
+    """
+    Get the application-wide Prometheus service.
+    
+    The service and its client are built during startup (see the lifespan
+    in app.main); apps started without it get one on first use.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        PrometheusService: Shared service instance
+    """
+    service = getattr(request.app.state, "prometheus_service", None)
+    if service is None:
+        service = request.app.state.prometheus_service = PrometheusService(get_settings())
+    return service
@@ -1,12 +1,17 @@
 """
 Service for interacting with the Proxmox API.
 """
+import asyncio
 import logging
-import time
 from typing import Dict, List, Optional, Union
+from urllib.parse import urlparse
 
-from fastapi import Depends
-from proxmoxer import ProxmoxAPI
+from cachetools import TTLCache
+from fastapi import Depends, Request
+from pydantic import TypeAdapter
+from proxmoxer import ProxmoxAPI, ResourceException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.config import Settings, get_settings
 from app.models.proxmox import (
@@ -15,48 +20,156 @@ from app.models.proxmox import (
     VMCreate,
     VMRead,
 )
+from app.utils.cache import JitteredTTLCache
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for the shared client; sized for concurrent per-node fan-out
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 50
+
+# Validates a whole VM listing in one call into pydantic-core
+_vms_validator = TypeAdapter(List[VMRead])
+
+# How long a VM existence check is trusted before asking Proxmox again
+VM_EXISTS_TTL = 2
+
+# Cluster task types that change the node/VM inventory (vzdump is a backup)
+_INVENTORY_TASK_PREFIXES = ("qm", "vz", "startall", "stopall", "migrateall")
+
+
+def _changes_inventory(task: Dict) -> bool:
+    task_type = task.get("type", "")
+    return task_type.startswith(_INVENTORY_TASK_PREFIXES) and task_type != "vzdump"
+
+
+# Error messages Proxmox sends, with a 500, for unknown VMs and nodes
+_NOT_FOUND_MESSAGES = ("does not exist", "no such cluster node", "hostname lookup")
+
+
+def _is_not_found(error: ResourceException) -> bool:
+    """
+    Check whether a Proxmox API error means the resource does not exist.
+    
+    Proxmox answers lookups of unknown nodes and VMs with a 500 rather than
+    a 404, but so does every other failure (locks, storage, quorum), so a
+    500 only counts when its message says the resource is missing.
+    """
+    return error.status_code == 404 or any(
+        message in str(error) for message in _NOT_FOUND_MESSAGES
+    )
+
 
 class ProxmoxService:
     
     def __init__(self, settings: Settings = Depends(get_settings)):
         self.settings = settings
         self.client = None
-        self._cache = {}
-        self._cache_timestamp = {}
+        # Serializes authentication, so concurrent first calls share one login
+        self._client_lock = asyncio.Lock()
+        proxmox_url = settings.PROXMOX_URL
+        if proxmox_url.startswith(('http://', 'https://')):
+            self._proxmox_host = urlparse(proxmox_url).netloc.split(':')[0]
+        else:
+            self._proxmox_host = proxmox_url
+        self._log_target = f"Proxmox API at {proxmox_url}"
         self._cache_duration = 300  # Default cache duration: 5 minutes
+        self._cache = JitteredTTLCache(maxsize=64, ttl=self._cache_duration)
+        self._vm_exists_cache = TTLCache(maxsize=1024, ttl=VM_EXISTS_TTL)
     
     async def _get_client(self) -> ProxmoxAPI:
         if self.client is None:
-            proxmox_host = self.settings.PROXMOX_URL
-            if proxmox_host.startswith('http://') or proxmox_host.startswith('https://'):
-                from urllib.parse import urlparse
-                parsed_url = urlparse(proxmox_host)
-                proxmox_host = parsed_url.netloc.split(':')[0]
-            
-            logger.debug(f"Connecting to Proxmox at {proxmox_host}")
-            
-            self.client = ProxmoxAPI(
-                host=proxmox_host,
-                user=self.settings.PROXMOX_USERNAME,
-                password=self.settings.PROXMOX_PASSWORD,
-                verify_ssl=self.settings.PROXMOX_VERIFY_SSL,
-            )
-            logger.info(f"Connected to Proxmox API at {self.settings.PROXMOX_URL}")
+            async with self._client_lock:
+                # Another caller may have connected while we waited
+                if self.client is None:
+                    self.client = await self._connect()
         return self.client
     
+    async def _connect(self) -> ProxmoxAPI:
+        logger.debug("Connecting to Proxmox at %s", self._proxmox_host)
+        
+        # proxmoxer is requests-based and authenticates on construction,
+        # so every call into it is pushed off the event loop
+        client = await asyncio.to_thread(
+            ProxmoxAPI,
+            host=self._proxmox_host,
+            user=self.settings.PROXMOX_USERNAME,
+            password=self.settings.PROXMOX_PASSWORD,
+            verify_ssl=self.settings.PROXMOX_VERIFY_SSL,
+            timeout=self.settings.DEFAULT_TIMEOUT,
+        )
+        # proxmoxer keeps one requests session per client; give it a
+        # pool large enough to be shared by concurrent requests
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+            ),
+        )
+        client._store["session"].mount("https://", adapter)
+        logger.info("Connected to %s", self._log_target)
+        return client
+    
     async def check_health(self) -> bool:
         client = await self._get_client()
         try:
-            version = client.version.get()
-            logger.debug(f"Proxmox health check: {version}")
+            version = await asyncio.to_thread(client.version.get)
+            logger.debug("Proxmox health check: %s", version)
             return True
         except Exception as e:
             logger.error(f"Proxmox health check failed: {str(e)}")
             raise
     
+    def _invalidate_cluster_cache(self) -> None:
+        self._cache.pop('nodes', None)
+        self._cache.pop('cluster_overview', None)
+        self._vm_exists_cache.clear()
+    
+    async def _poll_cluster_tasks(self, last_seen: Optional[int]) -> int:
+        """
+        Invalidate cached cluster data if a VM or node task finished since last_seen.
+        
+        Args:
+            last_seen: End time of the newest task seen so far, None on the first poll
+            
+        Returns:
+            int: End time of the newest finished task
+        """
+        client = await self._get_client()
+        tasks = await asyncio.to_thread(client.cluster.tasks.get)
+        finished = [t for t in tasks if t.get("endtime")]
+        newest = max((t["endtime"] for t in finished), default=last_seen or 0)
+        
+        if last_seen is not None and any(
+            t["endtime"] > last_seen and _changes_inventory(t) for t in finished
+        ):
+            logger.info("Proxmox cluster changed, invalidating cached cluster data")
+            self._invalidate_cluster_cache()
+        
+        return max(newest, last_seen or 0)
+    
+    async def watch_cluster_tasks(self, interval: float) -> None:
+        """
+        Poll the cluster task list and drop cached data affected by new tasks.
+        
+        Runs until cancelled. The cache TTL stays in place as a backstop for
+        changes that don't go through a task, such as load figures.
+        
+        Args:
+            interval: Seconds between polls
+        """
+        last_seen = None
+        while True:
+            try:
+                last_seen = await self._poll_cluster_tasks(last_seen)
+            except Exception as e:
+                logger.warning(f"Failed to poll Proxmox cluster tasks: {str(e)}")
+            await asyncio.sleep(interval)
+    
     async def get_nodes(self) -> List[ClusterNodeRead]:
         """
         Get all nodes from the Proxmox cluster with caching.
@@ -66,44 +179,30 @@ class ProxmoxService:
         """
         client = await self._get_client()
         try:
-            # Use caching for nodes data
-            cache_key = 'nodes'
-            
-            # Check if we have cached data
-            current_time = time.time()
-            if (cache_key in self._cache and 
-                cache_key in self._cache_timestamp and 
-                current_time - self._cache_timestamp.get(cache_key, 0) <= self._cache_duration):
-                logger.info(f"Using cached data for {cache_key} (age: {int(current_time - self._cache_timestamp[cache_key])}s)")
-                return self._cache[cache_key]
-            
-            # Get all nodes
-            nodes = client.nodes.get()
-            logger.debug(f"Retrieved {len(nodes)} nodes from Proxmox")
-            
-            # Convert to our model format
-            result = []
-            for node in nodes:
-                result.append(ClusterNodeRead(
-                    id=node.get("id"),
-                    node=node.get("node"),
-                    status=node.get("status"),
-                    cpu=node.get("cpu"),
-                    memory=node.get("mem"),
-                    uptime=node.get("uptime"),
-                    ip=node.get("ip", ""),
-                ))
-            
-            # Cache the result
-            self._cache[cache_key] = result
-            self._cache_timestamp[cache_key] = current_time
-            logger.info(f"Updated cache for {cache_key}")
-            
-            return result
+            return await self._cache.get_or_fill('nodes', lambda: self._fetch_nodes(client))
         except Exception as e:
             logger.error(f"Failed to get nodes: {str(e)}")
             raise
     
+    async def _fetch_nodes(self, client: ProxmoxAPI) -> List[ClusterNodeRead]:
+        # Get all nodes
+        nodes = await asyncio.to_thread(client.nodes.get)
+        logger.debug("Retrieved %d nodes from Proxmox", len(nodes))
+        
+        # Convert to our model format
+        result = []
+        for node in nodes:
+            result.append(ClusterNodeRead(
+                id=node.get("id"),
+                node=node.get("node"),
+                status=node.get("status"),
+                cpu=node.get("cpu"),
+                memory=node.get("mem"),
+                uptime=node.get("uptime"),
+                ip=node.get("ip", ""),
+            ))
+        return result
+    
     async def get_node(self, node: str) -> Optional[ClusterNodeRead]:
         """
         Get a specific node's details.
@@ -116,16 +215,16 @@ class ProxmoxService:
         """
         client = await self._get_client()
         try:
-            # Check if node exists
-            nodes = client.nodes.get()
-            node_exists = any(n.get("node") == node for n in nodes)
-            if not node_exists:
+            # An unknown node fails the status call itself
+            try:
+                status = await asyncio.to_thread(client.nodes(node).status.get)
+            except ResourceException as e:
+                if not _is_not_found(e):
+                    raise
                 logger.warning(f"Node {node} not found")
                 return None
             
-            # Get node status
-            status = client.nodes(node).status.get()
-            logger.debug(f"Retrieved node {node} details from Proxmox")
+            logger.debug("Retrieved node %s details from Proxmox", node)
             
             return ClusterNodeRead(
                 id=node,
@@ -149,58 +248,46 @@ class ProxmoxService:
         """
         client = await self._get_client()
         try:
-            # Use caching for cluster overview
-            cache_key = 'cluster_overview'
-            
-            # Check if we have cached data
-            current_time = time.time()
-            if (cache_key in self._cache and 
-                cache_key in self._cache_timestamp and 
-                current_time - self._cache_timestamp.get(cache_key, 0) <= self._cache_duration):
-                logger.info(f"Using cached data for {cache_key} (age: {int(current_time - self._cache_timestamp[cache_key])}s)")
-                return self._cache[cache_key]
-            
-            # Get cluster resources
-            resources = client.cluster.resources.get()
-            
-            # Count VMs, storage and nodes
-            vm_count = sum(1 for r in resources if r.get("type") in ["qemu", "lxc"])
-            storage_count = sum(1 for r in resources if r.get("type") == "storage")
-            node_count = sum(1 for r in resources if r.get("type") == "node")
-            
-            # Calculate total resources
-            total_cpu = 0
-            total_memory = 0
-            total_disk = 0
-            
-            for resource in resources:
-                if resource.get("type") == "node":
-                    total_cpu += resource.get("maxcpu", 0)
-                    total_memory += resource.get("maxmem", 0)
-                elif resource.get("type") == "storage":
-                    total_disk += resource.get("maxdisk", 0)
-            
-            logger.debug(f"Retrieved cluster overview from Proxmox")
-            
-            result = ClusterOverview(
-                nodes=node_count,
-                vms=vm_count,
-                storage=storage_count,
-                total_cpu=total_cpu,
-                total_memory=total_memory,
-                total_disk=total_disk,
+            return await self._cache.get_or_fill(
+                'cluster_overview', lambda: self._fetch_cluster_overview(client)
             )
-            
-            # Cache the result
-            self._cache[cache_key] = result
-            self._cache_timestamp[cache_key] = current_time
-            logger.info(f"Updated cache for {cache_key}")
-            
-            return result
         except Exception as e:
             logger.error(f"Failed to get cluster overview: {str(e)}")
             raise
     
+    async def _fetch_cluster_overview(self, client: ProxmoxAPI) -> ClusterOverview:
+        # Get cluster resources
+        resources = await asyncio.to_thread(client.cluster.resources.get)
+        
+        # Count nodes, storage and VMs and total their resources in one pass
+        vm_count = storage_count = node_count = 0
+        total_cpu = total_memory = total_disk = 0
+        
+        # Every /cluster/resources entry carries "type"; the size fields can
+        # be missing (e.g. offline nodes), so those keep their defaults
+        for resource in resources:
+            resource_type = resource["type"]
+            if resource_type == "node":
+                node_count += 1
+                total_cpu += resource.get("maxcpu", 0)
+                total_memory += resource.get("maxmem", 0)
+            elif resource_type == "storage":
+                storage_count += 1
+                total_disk += resource.get("maxdisk", 0)
+            elif resource_type in ("qemu", "lxc"):
+                vm_count += 1
+        
+        logger.debug("Retrieved cluster overview from Proxmox")
+        
+        return ClusterOverview(
+            nodes=node_count,
+            vms=vm_count,
+            storage=storage_count,
+            total_cpu=total_cpu,
+            total_memory=total_memory,
+            total_disk=total_disk,
+        )
+    
     async def get_vms(self, node: Optional[str] = None) -> List[VMRead]:
         """
         Get all virtual machines.
@@ -213,41 +300,47 @@ class ProxmoxService:
         """
         client = await self._get_client()
         try:
-            vms = []
-            
-            # If node is specified, get VMs for that node only
+            # If node is specified, get VMs for that node only,
+            # otherwise get all nodes and fetch their VMs concurrently
             if node:
-                vm_list = client.nodes(node).qemu.get()
-                for vm in vm_list:
-                    vm["node"] = node
-                vms.extend(vm_list)
+                node_names = [node]
             else:
-                # Get all nodes and then get VMs for each node
-                nodes = client.nodes.get()
-                for n in nodes:
-                    node_name = n.get("node")
-                    vm_list = client.nodes(node_name).qemu.get()
-                    for vm in vm_list:
-                        vm["node"] = node_name
-                    vms.extend(vm_list)
-            
-            logger.debug(f"Retrieved {len(vms)} VMs from Proxmox")
-            
-            # Convert to our model format
-            result = []
-            for vm in vms:
-                result.append(VMRead(
-                    vmid=vm.get("vmid"),
-                    name=vm.get("name"),
-                    status=vm.get("status"),
-                    node=vm.get("node"),
-                    cpu=vm.get("cpu", 0),
-                    memory=vm.get("maxmem", 0),
-                    disk=vm.get("maxdisk", 0),
-                    uptime=vm.get("uptime", 0),
-                ))
+                nodes = await asyncio.to_thread(client.nodes.get)
+                node_names = [n.get("node") for n in nodes]
+            
+            # Resolve each node's qemu endpoint once, up front
+            endpoints = [client.nodes(name).qemu for name in node_names]
+            results = await asyncio.gather(
+                *(asyncio.to_thread(endpoint.get) for endpoint in endpoints),
+                return_exceptions=True,
+            )
             
-            return result
+            # Convert to our model format, taking the node name from the
+            # listing it came from rather than writing it into each VM dict
+            vms = []
+            for node_name, vm_list in zip(node_names, results):
+                if isinstance(vm_list, Exception):
+                    if node:
+                        raise vm_list
+                    logger.warning(f"Failed to get VMs for node {node_name}: {str(vm_list)}")
+                    continue
+                vms.extend(
+                    {
+                        "vmid": vm.get("vmid"),
+                        "name": vm.get("name"),
+                        "status": vm.get("status"),
+                        "node": node_name,
+                        "cpu": vm.get("cpu", 0),
+                        "memory": vm.get("maxmem", 0),
+                        "disk": vm.get("maxdisk", 0),
+                        "uptime": vm.get("uptime", 0),
+                    }
+                    for vm in vm_list
+                )
+            
+            logger.debug("Retrieved %d VMs from Proxmox", len(vms))
+            
+            return _vms_validator.validate_python(vms)
         except Exception as e:
             logger.error(f"Failed to get VMs: {str(e)}")
             raise
@@ -267,13 +360,18 @@ class ProxmoxService:
         try:
             # Check if VM exists
             try:
-                config = client.nodes(node).qemu(vmid).config.get()
-                status = client.nodes(node).qemu(vmid).status.current.get()
-            except Exception:
+                vm_api = client.nodes(node).qemu(vmid)
+                config, status = await asyncio.gather(
+                    asyncio.to_thread(vm_api.config.get),
+                    asyncio.to_thread(vm_api.status.current.get),
+                )
+            except ResourceException as e:
+                if not _is_not_found(e):
+                    raise
                 logger.warning(f"VM {vmid} not found on node {node}")
                 return None
             
-            logger.debug(f"Retrieved VM {vmid} details from Proxmox")
+            logger.debug("Retrieved VM %s details from Proxmox", vmid)
             
             return VMRead(
                 vmid=vmid,
@@ -289,6 +387,37 @@ class ProxmoxService:
             logger.error(f"Failed to get VM {vmid} on node {node}: {str(e)}")
             raise
     
+    async def _vm_exists(self, node: str, vmid: int) -> bool:
+        """
+        Check whether a VM exists with a single status call.
+        
+        Results are cached for VM_EXISTS_TTL seconds so back-to-back
+        actions on the same VM skip the lookup.
+        
+        Args:
+            node: Node where the VM is located
+            vmid: ID of the VM to check
+            
+        Returns:
+            bool: True if the VM exists, False otherwise
+        """
+        key = (node, vmid)
+        try:
+            return self._vm_exists_cache[key]
+        except KeyError:
+            pass
+        
+        client = await self._get_client()
+        try:
+            await asyncio.to_thread(client.nodes(node).qemu(vmid).status.current.get)
+            exists = True
+        except ResourceException as e:
+            if not _is_not_found(e):
+                raise
+            exists = False
+        self._vm_exists_cache[key] = exists
+        return exists
+    
     async def create_vm(self, node: str, vm: VMCreate) -> VMRead:
         """
         Create a new VM on a specific node.
@@ -303,11 +432,19 @@ class ProxmoxService:
         client = await self._get_client()
         try:
             # Prepare VM creation parameters
-            params = vm.dict(exclude_unset=True)
+            params = vm.model_dump(exclude_unset=True, mode="json")
+            
+            # The create call returns a task UPID rather than the VM ID, so
+            # settle the ID first, taking the next free one if none was given
+            vmid = vm.vmid
+            if vmid is None:
+                vmid = int(await asyncio.to_thread(client.cluster.nextid.get))
+                params["vmid"] = vmid
             
             # Create VM
-            vmid = client.nodes(node).qemu.post(**params)
-            logger.info(f"Created VM with ID {vmid} on node {node}")
+            upid = await asyncio.to_thread(client.nodes(node).qemu.post, **params)
+            self._vm_exists_cache.pop((node, vmid), None)
+            logger.info("Created VM with ID %s on node %s (task %s)", vmid, node, upid)
             
             # Return the created VM
             return await self.get_vm(node, vmid)
@@ -329,13 +466,12 @@ class ProxmoxService:
         client = await self._get_client()
         try:
             # Check if VM exists
-            vm = await self.get_vm(node, vmid)
-            if not vm:
+            if not await self._vm_exists(node, vmid):
                 raise ValueError(f"VM {vmid} not found on node {node}")
             
             # Start VM
-            result = client.nodes(node).qemu(vmid).status.start.post()
-            logger.info(f"Started VM {vmid} on node {node}")
+            result = await asyncio.to_thread(client.nodes(node).qemu(vmid).status.start.post)
+            logger.info("Started VM %s on node %s", vmid, node)
             
             return f"VM {vmid} start initiated"
         except Exception as e:
@@ -356,13 +492,12 @@ class ProxmoxService:
         client = await self._get_client()
         try:
             # Check if VM exists
-            vm = await self.get_vm(node, vmid)
-            if not vm:
+            if not await self._vm_exists(node, vmid):
                 raise ValueError(f"VM {vmid} not found on node {node}")
             
             # Stop VM
-            result = client.nodes(node).qemu(vmid).status.stop.post()
-            logger.info(f"Stopped VM {vmid} on node {node}")
+            result = await asyncio.to_thread(client.nodes(node).qemu(vmid).status.stop.post)
+            logger.info("Stopped VM %s on node %s", vmid, node)
             
             return f"VM {vmid} stop initiated"
         except Exception as e:
@@ -383,16 +518,29 @@ class ProxmoxService:
         client = await self._get_client()
         try:
             # Check if VM exists
-            vm = await self.get_vm(node, vmid)
-            if not vm:
+            if not await self._vm_exists(node, vmid):
                 logger.warning(f"VM {vmid} not found on node {node} for deletion")
                 return False
             
             # Delete VM
-            client.nodes(node).qemu(vmid).delete()
-            logger.info(f"Deleted VM {vmid} on node {node}")
+            await asyncio.to_thread(client.nodes(node).qemu(vmid).delete)
+            self._vm_exists_cache.pop((node, vmid), None)
+            logger.info("Deleted VM %s on node %s", vmid, node)
             
             return True
         except Exception as e:
             logger.error(f"Failed to delete VM {vmid} on node {node}: {str(e)}")
             raise
+
+
+def get_proxmox_service(request: Request) -> ProxmoxService:
+    """
+    Get the application-wide Proxmox service.
+    
+    The service and its client are built during startup (see the lifespan
+    in app.main); apps started without it get one on first use.
+    """
+    service = getattr(request.app.state, "proxmox_service", None)
+    if service is None:
+        service = request.app.state.proxmox_service = ProxmoxService(get_settings())
+    return service
@@ -1,7 +1,11 @@
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Union
 
-from fastapi import Depends
+from fastapi import Depends, Request
+from pydantic import TypeAdapter
 from uptime_kuma_api import UptimeKumaApi
 
 from app.config import Settings, get_settings
@@ -11,62 +15,95 @@ from app.models.uptime_kuma import (
     MonitorUpdate,
     StatusPageRead,
 )
+from app.utils.cache import JitteredTTLCache
 
 logger = logging.getLogger(__name__)
 
+# Validate whole listings in one call into pydantic-core
+_monitors_validator = TypeAdapter(List[MonitorRead])
+_status_pages_validator = TypeAdapter(List[StatusPageRead])
+
+# How long a global statistics snapshot is reused across per-monitor lookups
+SNAPSHOT_TTL = 5
+
+
+@dataclass(frozen=True)
+class _MonitorSnapshot:
+    """Instance-wide statistics, each keyed by monitor ID."""
+    info: dict
+    avg_pings: dict
+    uptimes: dict
+    cert_infos: dict
+    heartbeats: dict
+    important_heartbeats: dict
+
 
 class UptimeKumaService:
 
     def __init__(self, settings: Settings = Depends(get_settings)):
         self.settings = settings
         self.client = None
+        # Serializes connecting, so concurrent first calls share one login
+        self._client_lock = asyncio.Lock()
+        self._snapshot = None
+        self._snapshot_timestamp = 0.0
+        # Cache for get_all_monitors_statistics (5 minutes)
+        self._cache = JitteredTTLCache(maxsize=64, ttl=300)
 
-    def _get_client(self) -> UptimeKumaApi:
+    def _connect(self) -> UptimeKumaApi:
+        client = UptimeKumaApi(self.settings.UPTIME_KUMA_URL)
+        client.login(
+            self.settings.UPTIME_KUMA_USERNAME,
+            self.settings.UPTIME_KUMA_PASSWORD
+        )
+        return client
+
+    async def _get_client(self) -> UptimeKumaApi:
         if self.client is None:
-            try:
-                self.client = UptimeKumaApi(self.settings.UPTIME_KUMA_URL)
-                self.client.login(
-                    self.settings.UPTIME_KUMA_USERNAME,
-                    self.settings.UPTIME_KUMA_PASSWORD
-                )
-            except Exception as e:
-                logger.error(f"Connection to Uptime Kuma API failed: {str(e)}")
-                self.client = None
-                raise
+            async with self._client_lock:
+                # Another caller may have connected while we waited
+                if self.client is None:
+                    try:
+                        # uptime_kuma_api is synchronous; connect and log in off the event loop
+                        self.client = await asyncio.to_thread(self._connect)
+                    except Exception as e:
+                        logger.error(f"Connection to Uptime Kuma API failed: {str(e)}")
+                        self.client = None
+                        raise
         return self.client
 
     async def check_health(self) -> bool:
         try:
-            client = UptimeKumaApi(self.settings.UPTIME_KUMA_URL)
-            client.login(
-                self.settings.UPTIME_KUMA_USERNAME,
-                self.settings.UPTIME_KUMA_PASSWORD
-            )
+            # Reuse the logged-in connection; info() is a cheap round-trip
+            client = await self._get_client()
+            await asyncio.to_thread(client.info)
             logger.info("Uptime Kuma health check successful")
-            logger.info(
-                f"Connected to Uptime Kuma API at {self.settings.UPTIME_KUMA_URL}")
-            client.disconnect()
+            logger.info("Connected to Uptime Kuma API at %s", self.settings.UPTIME_KUMA_URL)
             return True
         except Exception as e:
             logger.error(f"Uptime Kuma health check failed: {str(e)}")
+            # uptime_kuma_api never reconnects or logs in again once its
+            # socket drops, so discard the connection and let the next call
+            # build a fresh one
+            await self.close()
             raise
 
-    def get_monitors(self) -> List[MonitorRead]:
-        client = self._get_client()
+    async def get_monitors(self) -> List[MonitorRead]:
+        client = await self._get_client()
         try:
-            monitors = client.get_monitors()
-            logger.info(f"Retrieved {len(monitors)} monitors")
-            return [MonitorRead(**monitor) for monitor in monitors]
+            monitors = await asyncio.to_thread(client.get_monitors)
+            logger.info("Retrieved %d monitors", len(monitors))
+            return _monitors_validator.validate_python(monitors)
         except Exception as e:
             logger.error(f"Failed to get monitors: {str(e)}")
             raise
 
-    def get_monitor(self, monitor_id: int) -> Optional[MonitorRead]:
-        client = self._get_client()
+    async def get_monitor(self, monitor_id: int) -> Optional[MonitorRead]:
+        client = await self._get_client()
         try:
-            monitor = client.get_monitor(monitor_id)
+            monitor = await asyncio.to_thread(client.get_monitor, monitor_id)
             if monitor:
-                logger.info(f"Retrieved monitor {monitor_id}")
+                logger.info("Retrieved monitor %s", monitor_id)
                 return MonitorRead(**monitor)
             logger.warning(f"Monitor {monitor_id} not found")
             return None
@@ -74,63 +111,63 @@ class UptimeKumaService:
             logger.error(f"Failed to get monitor {monitor_id}: {str(e)}")
             raise
 
-    def create_monitor(self, monitor: MonitorCreate) -> MonitorRead:
-        client = self._get_client()
+    async def create_monitor(self, monitor: MonitorCreate) -> MonitorRead:
+        client = await self._get_client()
         try:
-            created_monitor = client.add_monitor(**monitor.dict())
-            logger.info(f"Created monitor {created_monitor['id']}")
+            created_monitor = await asyncio.to_thread(client.add_monitor, **monitor.model_dump(mode="json"))
+            logger.info("Created monitor %s", created_monitor['id'])
             return MonitorRead(**created_monitor)
         except Exception as e:
             logger.error(f"Failed to create monitor: {str(e)}")
             raise
 
-    def update_monitor(self, monitor_id: int, monitor: MonitorUpdate) -> Optional[MonitorRead]:
-        client = self._get_client()
+    async def update_monitor(self, monitor_id: int, monitor: MonitorUpdate) -> Optional[MonitorRead]:
+        client = await self._get_client()
         try:
-            existing_monitor = client.get_monitor(monitor_id)
+            existing_monitor = await asyncio.to_thread(client.get_monitor, monitor_id)
             if not existing_monitor:
                 logger.warning(f"Monitor {monitor_id} not found for update")
                 return None
 
-            update_data = monitor.dict(exclude_unset=True)
-            updated_monitor = client.edit_monitor(monitor_id, **update_data)
-            logger.info(f"Updated monitor {monitor_id}")
+            update_data = monitor.model_dump(exclude_unset=True, mode="json")
+            updated_monitor = await asyncio.to_thread(client.edit_monitor, monitor_id, **update_data)
+            logger.info("Updated monitor %s", monitor_id)
             return MonitorRead(**updated_monitor)
         except Exception as e:
             logger.error(f"Failed to update monitor {monitor_id}: {str(e)}")
             raise
 
-    def delete_monitor(self, monitor_id: int) -> bool:
-        client = self._get_client()
+    async def delete_monitor(self, monitor_id: int) -> bool:
+        client = await self._get_client()
         try:
-            existing_monitor = client.get_monitor(monitor_id)
+            existing_monitor = await asyncio.to_thread(client.get_monitor, monitor_id)
             if not existing_monitor:
                 logger.warning(f"Monitor {monitor_id} not found for deletion")
                 return False
 
-            client.delete_monitor(monitor_id)
-            logger.info(f"Deleted monitor {monitor_id}")
+            await asyncio.to_thread(client.delete_monitor, monitor_id)
+            logger.info("Deleted monitor %s", monitor_id)
             return True
         except Exception as e:
             logger.error(f"Failed to delete monitor {monitor_id}: {str(e)}")
             raise
 
-    def get_status_pages(self) -> List[StatusPageRead]:
-        client = self._get_client()
+    async def get_status_pages(self) -> List[StatusPageRead]:
+        client = await self._get_client()
         try:
-            status_pages = client.get_status_pages()
-            logger.info(f"Retrieved {len(status_pages)} status pages")
-            return [StatusPageRead(**page) for page in status_pages]
+            status_pages = await asyncio.to_thread(client.get_status_pages)
+            logger.info("Retrieved %d status pages", len(status_pages))
+            return _status_pages_validator.validate_python(status_pages)
         except Exception as e:
             logger.error(f"Failed to get status pages: {str(e)}")
             raise
 
-    def get_status_page(self, page_id: int) -> Optional[StatusPageRead]:
-        client = self._get_client()
+    async def get_status_page(self, page_id: int) -> Optional[StatusPageRead]:
+        client = await self._get_client()
         try:
-            status_page = client.get_status_page(page_id)
+            status_page = await asyncio.to_thread(client.get_status_page, page_id)
             if status_page:
-                logger.info(f"Retrieved status page {page_id}")
+                logger.info("Retrieved status page %s", page_id)
                 return StatusPageRead(**status_page)
             logger.warning(f"Status page {page_id} not found")
             return None
@@ -138,10 +175,10 @@ class UptimeKumaService:
             logger.error(f"Failed to get status page {page_id}: {str(e)}")
             raise
 
-    def close(self) -> None:
-        if self.client:
+    async def close(self) -> None:
+        if self.client is not None:
             try:
-                self.client.disconnect()
+                await asyncio.to_thread(self.client.disconnect)
                 logger.info("Closed Uptime Kuma API connection")
             except Exception as e:
                 logger.error(
@@ -149,13 +186,12 @@ class UptimeKumaService:
             finally:
                 self.client = None
 
-    def get_avg_ping(self, monitor_id: int) -> Optional[float]:
-        client = self._get_client()
+    async def get_avg_ping(self, monitor_id: int) -> Optional[float]:
+        client = await self._get_client()
         try:
-            avg_ping = client.avg_ping()
+            avg_ping = await asyncio.to_thread(client.avg_ping)
             if avg_ping is not None:
-                logger.info(
-                    f"Retrieved average ping for monitor {monitor_id}")
+                logger.info("Retrieved average ping for monitor %s", monitor_id)
                 return avg_ping
             logger.warning(
                 f"Average ping not available for monitor {monitor_id}")
@@ -165,13 +201,12 @@ class UptimeKumaService:
                 f"Failed to get average ping for monitor {monitor_id}: {str(e)}")
             raise
 
-    def get_cert_info(self, monitor_id: int) -> Optional[dict]:
-        client = self._get_client()
+    async def get_cert_info(self, monitor_id: int) -> Optional[dict]:
+        client = await self._get_client()
         try:
-            cert_info = client.cert_info()
+            cert_info = await asyncio.to_thread(client.cert_info)
             if cert_info:
-                logger.info(
-                    f"Retrieved certificate info for monitor {monitor_id}")
+                logger.info("Retrieved certificate info for monitor %s", monitor_id)
                 return cert_info
             logger.warning(
                 f"Certificate info not available for monitor {monitor_id}")
@@ -181,13 +216,12 @@ class UptimeKumaService:
                 f"Failed to get certificate info for monitor {monitor_id}: {str(e)}")
             raise
 
-    def get_uptime(self, monitor_id: int, days: int = 7) -> Optional[float]:
-        client = self._get_client()
+    async def get_uptime(self, monitor_id: int, days: int = 7) -> Optional[float]:
+        client = await self._get_client()
         try:
-            uptime = client.uptime(monitor_id, days)
+            uptime = await asyncio.to_thread(client.uptime, monitor_id, days)
             if uptime is not None:
-                logger.info(
-                    f"Retrieved uptime for monitor {monitor_id} over {days} days")
+                logger.info("Retrieved uptime for monitor %s over %s days", monitor_id, days)
                 return uptime
             logger.warning(f"Uptime not available for monitor {monitor_id}")
             return None
@@ -196,17 +230,46 @@ class UptimeKumaService:
                 f"Failed to get uptime for monitor {monitor_id}: {str(e)}")
             raise
 
-    def get_info(self) -> dict:
-        client = self._get_client()
+    async def get_info(self) -> dict:
+        client = await self._get_client()
         try:
-            info = client.info()
+            info = await asyncio.to_thread(client.info)
             logger.info("Retrieved Uptime Kuma instance info")
             return info
         except Exception as e:
             logger.error(f"Failed to get Uptime Kuma instance info: {str(e)}")
             raise
 
-    def get_monitor_statistics(self, monitor_id: int) -> dict:
+    async def _fetch_global_snapshot(self) -> _MonitorSnapshot:
+        """
+        Fetch the statistics Uptime Kuma only exposes for all monitors at once.
+
+        The snapshot is kept for SNAPSHOT_TTL seconds so several monitors
+        looked up in a row share a single round of API calls.
+
+        Returns:
+            _MonitorSnapshot: Statistics keyed by monitor ID
+        """
+        current_time = time.monotonic()
+        if self._snapshot is not None and current_time - self._snapshot_timestamp <= SNAPSHOT_TTL:
+            return self._snapshot
+
+        client = await self._get_client()
+        # One worker thread for the whole round of calls on the shared socket
+        self._snapshot = await asyncio.to_thread(
+            lambda: _MonitorSnapshot(
+                info=client.info(),
+                avg_pings=client.avg_ping(),
+                uptimes=client.uptime(),
+                cert_infos=client.cert_info(),
+                heartbeats=client.get_heartbeats(),
+                important_heartbeats=client.get_important_heartbeats(),
+            )
+        )
+        self._snapshot_timestamp = current_time
+        return self._snapshot
+
+    async def get_monitor_statistics(self, monitor_id: int) -> dict:
         """
         Get comprehensive statistics for a monitor.
 
@@ -216,75 +279,54 @@ class UptimeKumaService:
         Returns:
             dict: Dictionary containing various monitor statistics
         """
-        client = self._get_client()
+        client = await self._get_client()
         try:
-            monitor = client.get_monitor(monitor_id)
-
-            all_avg_pings = client.avg_ping()
-            all_uptimes = client.uptime()
-            all_cert_infos = client.cert_info()
-            all_heartbeats = client.get_heartbeats()
-            all_important_heartbeats = client.get_important_heartbeats()
+            monitor = await asyncio.to_thread(client.get_monitor, monitor_id)
+            snapshot = await self._fetch_global_snapshot()
 
             stats = {
-                'uptime_kuma_info': client.info(),
+                'uptime_kuma_info': snapshot.info,
                 'monitor': monitor,
-                'avg_ping': all_avg_pings.get(monitor_id) if monitor_id in all_avg_pings else None,
-                'uptime': all_uptimes.get(monitor_id),
-                'cert_info': all_cert_infos.get(monitor_id),
-                'heartbeats': all_heartbeats.get(monitor_id),
-                'important_heartbeats': all_important_heartbeats.get(monitor_id),
+                'avg_ping': snapshot.avg_pings.get(monitor_id),
+                'uptime': snapshot.uptimes.get(monitor_id),
+                'cert_info': snapshot.cert_infos.get(monitor_id),
+                'heartbeats': snapshot.heartbeats.get(monitor_id),
+                'important_heartbeats': snapshot.important_heartbeats.get(monitor_id),
             }
 
-            logger.info(f"Retrieved statistics for monitor {monitor_id}")
+            logger.info("Retrieved statistics for monitor %s", monitor_id)
             return stats
         except Exception as e:
             logger.error(
                 f"Failed to get statistics for monitor {monitor_id}: {str(e)}")
             raise
             
-    def get_all_monitors_statistics(self) -> dict:
+    async def get_all_monitors_statistics(self) -> dict:
         """
         Get comprehensive statistics for all monitors with caching.
 
         Returns:
             dict: Dictionary containing various statistics for all monitors
         """
-        import time
         from app.resources.uptime_kuma import AllMonitorsStatisticsResource
         
-        client = self._get_client()
+        client = await self._get_client()
         try:
-            # Initialize cache attributes if they don't exist
-            if not hasattr(self, '_cache') or not hasattr(self, '_cache_timestamp'):
-                self._cache = {}
-                self._cache_timestamp = {}
-            
-            # Cache duration in seconds (5 minutes)
-            cache_duration = 300
-            current_time = time.time()
-            
-            # Function to get or update cached data
-            def get_cached_data(key, fetch_func):
-                if (key not in self._cache or 
-                    key not in self._cache_timestamp or 
-                    current_time - self._cache_timestamp.get(key, 0) > cache_duration):
-                    self._cache[key] = fetch_func()
-                    self._cache_timestamp[key] = current_time
-                    logger.info(f"Updated cache for {key}")
-                else:
-                    logger.info(f"Using cached data for {key} (age: {int(current_time - self._cache_timestamp[key])}s)")
-                return self._cache[key]
+            # Function to get or update cached data; concurrent misses share one fetch
+            async def get_cached_data(key, fetch_func):
+                return await self._cache.get_or_fill(
+                    key, lambda: asyncio.to_thread(fetch_func)
+                )
             
             # Get all data with caching
-            monitors = get_cached_data('monitors', client.get_monitors)
-            info = get_cached_data('info', client.info)
-            database_size = get_cached_data('database_size', client.get_database_size)
-            avg_pings = get_cached_data('avg_pings', client.avg_ping)
-            uptimes = get_cached_data('uptimes', client.uptime)
-            cert_infos = get_cached_data('cert_infos', client.cert_info)
-            heartbeats = get_cached_data('heartbeats', client.get_heartbeats)
-            important_heartbeats = get_cached_data('important_heartbeats', client.get_important_heartbeats)
+            monitors = await get_cached_data('monitors', client.get_monitors)
+            info = await get_cached_data('info', client.info)
+            database_size = await get_cached_data('database_size', client.get_database_size)
+            avg_pings = await get_cached_data('avg_pings', client.avg_ping)
+            uptimes = await get_cached_data('uptimes', client.uptime)
+            cert_infos = await get_cached_data('cert_infos', client.cert_info)
+            heartbeats = await get_cached_data('heartbeats', client.get_heartbeats)
+            important_heartbeats = await get_cached_data('important_heartbeats', client.get_important_heartbeats)
             
             # Compile statistics for all monitors
             raw_stats = {
@@ -310,8 +352,21 @@ class UptimeKumaService:
             
             stats = AllMonitorsStatisticsResource.transform(raw_stats)
             
-            logger.info(f"Retrieved statistics for all monitors ({len(monitors)} total)")
+            logger.info("Retrieved statistics for all monitors (%d total)", len(monitors))
             return stats
         except Exception as e:
             logger.error(f"Failed to get statistics for all monitors: {str(e)}")
             raise
+
+
+def get_uptime_kuma_service(request: Request) -> UptimeKumaService:
+    """
+    Get the application-wide Uptime Kuma service.
+
+    The service and its connection are built during startup (see the
+    lifespan in app.main); apps started without it get one on first use.
+    """
+    service = getattr(request.app.state, "uptime_kuma_service", None)
+    if service is None:
+        service = request.app.state.uptime_kuma_service = UptimeKumaService(get_settings())
+    return service
@@ -0,0 +1,81 @@
+"""
+Caching utilities for the application.
+"""
+import asyncio
+import logging
+import random
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Hashable, MutableMapping
+
+from cachetools import TLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class JitteredTTLCache(TLRUCache):
+    """
+    TTL cache whose entries expire after ttl ± jitter.
+
+    Spreading the expiry of entries written together keeps them from all
+    being refreshed against the upstream API at the same moment.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        jitter: float = 0.1,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Nominal time-to-live of an entry in seconds
+            jitter: Fraction of ttl by which an entry's lifetime may vary
+            timer: Clock used for expiry
+        """
+        self.ttl = ttl
+        self.jitter = jitter
+        # Held only while a fill is in flight; a key's lock goes away with
+        # its last waiter, so these don't outlive the entries they guard
+        self._fill_locks: MutableMapping[Hashable, asyncio.Lock] = weakref.WeakValueDictionary()
+        super().__init__(maxsize, self._time_to_use, timer)
+
+    def _time_to_use(self, key: Hashable, value: Any, now: float) -> float:
+        return now + self.ttl * (1 + self.jitter * (2 * random.random() - 1))
+
+    async def get_or_fill(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get an entry, fetching and storing it on a miss.
+
+        Concurrent misses on the same key share a single fetch: the first
+        caller fills the entry while the others wait for it.
+
+        Args:
+            key: Cache key
+            fetch: Coroutine function producing the value
+
+        Returns:
+            Any: The cached or freshly fetched value
+        """
+        try:
+            value = self[key]
+            logger.info("Using cached data for %s", key)
+            return value
+        except KeyError:
+            pass
+
+        lock = self._fill_locks.get(key)
+        if lock is None:
+            lock = self._fill_locks[key] = asyncio.Lock()
+        async with lock:
+            try:
+                return self[key]
+            except KeyError:
+                pass
+            value = self[key] = await fetch()
+            logger.info("Updated cache for %s", key)
+            return value
@@ -2,11 +2,21 @@
 Helper functions for the application.
 """
 import logging
+import math
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# Seconds per duration unit; a bare number is taken as seconds
+_DURATION_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400}
+_DURATION_RE = re.compile(r'^\s*(\d+)\s*([smhd]?)\s*$', re.IGNORECASE)
+
+# Binary size units, each 2**10 times the previous one
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB', 'EB')
+
 
 def format_timestamp(timestamp: Union[int, float, str, datetime]) -> str:
     """
@@ -21,14 +31,7 @@ def format_timestamp(timestamp: Union[int, float, str, datetime]) -> str:
     if isinstance(timestamp, (int, float)):
         dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
     elif isinstance(timestamp, str):
-        try:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        except ValueError:
-            try:
-                dt = datetime.fromtimestamp(float(timestamp), tz=timezone.utc)
-            except ValueError:
-                logger.warning(f"Unable to parse timestamp: {timestamp}")
-                return str(timestamp)
+        return _format_timestamp_string(timestamp)
     elif isinstance(timestamp, datetime):
         dt = timestamp
     else:
@@ -38,6 +41,20 @@ def format_timestamp(timestamp: Union[int, float, str, datetime]) -> str:
     return dt.isoformat()
 
 
+@lru_cache(maxsize=1024)
+def _format_timestamp_string(timestamp: str) -> str:
+    # fromisoformat accepts a trailing 'Z' natively since Python 3.11
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except ValueError:
+        try:
+            dt = datetime.fromtimestamp(float(timestamp), tz=timezone.utc)
+        except ValueError:
+            logger.warning(f"Unable to parse timestamp: {timestamp}")
+            return timestamp
+    return dt.isoformat()
+
+
 def parse_duration(duration: str) -> int:
     """
     Parse a duration string into seconds.
@@ -51,29 +68,16 @@ def parse_duration(duration: str) -> int:
     if not duration:
         return 0
     
-    unit = duration[-1].lower()
-    try:
-        value = int(duration[:-1])
-    except ValueError:
+    match = _DURATION_RE.match(duration)
+    if not match:
         logger.warning(f"Unable to parse duration: {duration}")
         return 0
     
-    if unit == 's':
-        return value
-    elif unit == 'm':
-        return value * 60
-    elif unit == 'h':
-        return value * 3600
-    elif unit == 'd':
-        return value * 86400
-    else:
-        try:
-            return int(duration)
-        except ValueError:
-            logger.warning(f"Unknown duration unit in: {duration}")
-            return 0
+    value, unit = match.groups()
+    return int(value) * _DURATION_UNITS[unit.lower()]
 
 
+@lru_cache(maxsize=1024)
 def bytes_to_human_readable(bytes_value: Union[int, float]) -> str:
     """
     Convert bytes to human-readable format.
@@ -87,18 +91,22 @@ def bytes_to_human_readable(bytes_value: Union[int, float]) -> str:
     if not bytes_value:
         return "0 B"
     
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB', 'PB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024.0
-    
-    return f"{bytes_value:.2f} EB"
+    # The unit index is the number of whole 10-bit steps in the value
+    if bytes_value < 1024:
+        index = 0
+    else:
+        index = min(int(math.log2(bytes_value)) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytes_value / (1 << (10 * index)):.2f} {_SIZE_UNITS[index]}"
 
 
 def filter_dict(data: Dict, keys_to_include: List[str]) -> Dict:
     """
     Filter a dictionary to include only specific keys.
     
+    Whichever of the two is smaller gets iterated: a short whitelist is
+    looked up in the dictionary, otherwise the dictionary's keys are
+    checked against the whitelist as a set.
+    
     Args:
         data: Dictionary to filter
         keys_to_include: List of keys to include
@@ -106,4 +114,9 @@ def filter_dict(data: Dict, keys_to_include: List[str]) -> Dict:
     Returns:
         Dict: Filtered dictionary
     """
+    if len(keys_to_include) <= len(data):
+        return {k: data[k] for k in keys_to_include if k in data}
+    
+    if not isinstance(keys_to_include, (set, frozenset)):
+        keys_to_include = frozenset(keys_to_include)
     return {k: v for k, v in data.items() if k in keys_to_include}
@@ -0,0 +1,64 @@
+"""create users and service_credentials
+
+Revision ID: 0b7d4e2a9c51
+Revises: 
+Create Date: 2026-10-15 08:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b7d4e2a9c51'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases set up by the app's create_all already have these tables;
+    # adopt them as they are instead of failing on a duplicate create
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'users' not in existing:
+        op.create_table(
+            'users',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('username', sa.String(length=50), nullable=False),
+            sa.Column('email', sa.String(length=100), nullable=False),
+            sa.Column('hashed_password', sa.String(length=255), nullable=False),
+            sa.Column('is_active', sa.Boolean(), nullable=True),
+            sa.Column('is_superuser', sa.Boolean(), nullable=True),
+            sa.Column('token', sa.String(length=255), nullable=True),
+            sa.Column('token_expires_at', sa.DateTime(), nullable=True),
+            sa.Column('last_login', sa.DateTime(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=False),
+        )
+        op.create_index('ix_users_id', 'users', ['id'])
+        op.create_index('ix_users_username', 'users', ['username'], unique=True)
+        op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    if 'service_credentials' not in existing:
+        op.create_table(
+            'service_credentials',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+            sa.Column('service_name', sa.String(length=100), nullable=False),
+            sa.Column('token', sa.String(length=1024), nullable=False),
+            sa.Column('token_expires_at', sa.DateTime(), nullable=False),
+            sa.Column('is_active', sa.Boolean(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=False),
+        )
+        op.create_index('ix_service_credentials_id', 'service_credentials', ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('service_credentials')
+    op.drop_table('users')
@@ -0,0 +1,54 @@
+"""add token lookup indexes
+
+Revision ID: 3f9a1c2d7b4e
+Revises: 0b7d4e2a9c51
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2d7b4e'
+down_revision: Union[str, None] = '0b7d4e2a9c51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _index_names(table: str) -> set:
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all builds these indexes from the models, so a database it set
+    # up may already have them
+    users_indexes = _index_names('users')
+    credentials_indexes = _index_names('service_credentials')
+
+    if 'ix_users_token' not in users_indexes:
+        op.create_index('ix_users_token', 'users', ['token'])
+    if 'ix_svc_cred_token_active' not in credentials_indexes:
+        op.create_index(
+            'ix_svc_cred_token_active',
+            'service_credentials',
+            ['token'],
+            postgresql_where=sa.text('is_active'),
+            mysql_length=255,
+        )
+    if 'ix_svc_cred_user_service' not in credentials_indexes:
+        op.create_index(
+            'ix_svc_cred_user_service',
+            'service_credentials',
+            ['user_id', 'service_name'],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_svc_cred_user_service', table_name='service_credentials')
+    op.drop_index('ix_svc_cred_token_active', table_name='service_credentials')
+    op.drop_index('ix_users_token', table_name='users')
@@ -0,0 +1,50 @@
+"""store token_expires_at as timezone-aware
+
+Revision ID: 8c2e5f0a1d37
+Revises: 3f9a1c2d7b4e
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2e5f0a1d37'
+down_revision: Union[str, None] = '3f9a1c2d7b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'users', 'token_expires_at',
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.DateTime(),
+        existing_nullable=True,
+    )
+    op.alter_column(
+        'service_credentials', 'token_expires_at',
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'service_credentials', 'token_expires_at',
+        type_=sa.DateTime(),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'users', 'token_expires_at',
+        type_=sa.DateTime(),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=True,
+    )
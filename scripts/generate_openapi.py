@@ -1,37 +1,69 @@
+import glob
+import hashlib
 import json
 import sys
 import os
+import importlib.metadata
 import importlib.util
 
+import orjson
+
 # Add the project root to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-try:
-    # Try to import the FastAPI app
-    from app.main import app
-    print("Successfully imported app from app.main")
-except ImportError as e:
-    print(f"Error importing app: {e}")
-    print("Current sys.path:", sys.path)
-    print("Checking for app directory structure...")
+
+def source_fingerprint() -> str:
+    """
+    Hash everything the schema is built from, without importing the app.
     
-    # List directories to help debug
-    print(f"Contents of {project_root}:", os.listdir(project_root))
+    Covers the app sources, the JSON examples embedded in the schema and the
+    FastAPI/Pydantic versions that render it.
+    """
+    digest = hashlib.sha1()
+    for dist in ("fastapi", "pydantic"):
+        digest.update(f"{dist}=={importlib.metadata.version(dist)}\n".encode())
+    paths = glob.glob(os.path.join(project_root, 'app', '**', '*.py'), recursive=True)
+    paths += glob.glob(os.path.join(project_root, 'dictionary', '**', '*.json'), recursive=True)
+    for path in sorted(paths):
+        digest.update(os.path.relpath(path, project_root).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Skip the app import and schema walk entirely if nothing changed since the last run
+fingerprint = source_fingerprint()
+try:
+    with open('build/openapi.sha') as f:
+        if f.read().strip() == fingerprint and os.path.exists('build/openapi.json'):
+            print("OpenAPI schema is up to date at build/openapi.json")
+            sys.exit(0)
+except FileNotFoundError:
+    pass
+
+# Create output directory if it doesn't exist
+if not os.path.isdir('build'):
+    os.makedirs('build')
+
+def write_fallback_schema(error: str) -> None:
+    """
+    Report why the app could not be imported, write a minimal schema and exit.
+    """
+    print(f"Error importing app: {error}")
     
-    # Check if app directory exists
-    app_dir = os.path.join(project_root, 'app')
-    if os.path.exists(app_dir):
-        print(f"App directory exists at {app_dir}")
-        print(f"Contents of app directory:", os.listdir(app_dir))
-    else:
-        print(f"App directory does not exist at {app_dir}")
+    # Directory listings to help debug, only when asked for
+    if os.environ.get("GENERATE_OPENAPI_DEBUG"):
+        print("Current sys.path:", sys.path)
+        print(f"Contents of {project_root}:", os.listdir(project_root))
         
-    # Try alternative import approaches
-    print("Trying alternative import approaches...")
-    
-    # Create output directory if it doesn't exist
-    os.makedirs('build', exist_ok=True)
+        # Check if app directory exists
+        app_dir = os.path.join(project_root, 'app')
+        if os.path.exists(app_dir):
+            print(f"App directory exists at {app_dir}")
+            print(f"Contents of app directory:", os.listdir(app_dir))
+        else:
+            print(f"App directory does not exist at {app_dir}")
     
     # Create a basic OpenAPI schema as fallback
     basic_schema = {
@@ -45,19 +77,37 @@ except ImportError as e:
     }
     
     with open('build/openapi.json', 'w') as f:
-        json.dump(basic_schema, f, indent=2)
+        json.dump(basic_schema, f, indent=2, sort_keys=True)
     
     print("Created basic OpenAPI schema as fallback")
     sys.exit(1)
 
+
+# Look the module up before importing it, so a missing app doesn't leave
+# half-imported modules behind
+try:
+    app_spec = importlib.util.find_spec("app.main")
+except ImportError:
+    app_spec = None
+if app_spec is None:
+    write_fallback_schema("No module named 'app.main'")
+
+try:
+    # Import the FastAPI app
+    from app.main import app
+    print("Successfully imported app from app.main")
+except ImportError as e:
+    # The module exists but one of its own imports failed
+    write_fallback_schema(str(e))
+
 # Get the OpenAPI schema
 openapi_schema = app.openapi()
 
-# Create output directory if it doesn't exist
-os.makedirs('build', exist_ok=True)
-
 # Write the schema to a file
-with open('build/openapi.json', 'w') as f:
-    json.dump(openapi_schema, f, indent=2)
+with open('build/openapi.json', 'wb') as f:
+    f.write(orjson.dumps(openapi_schema, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+
+with open('build/openapi.sha', 'w') as f:
+    f.write(fingerprint)
 
 print("OpenAPI schema generated successfully at build/openapi.json")
\ No newline at end of file
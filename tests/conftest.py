@@ -3,49 +3,431 @@ Pytest configuration module.
 """
 import asyncio
 import os
-from typing import AsyncGenerator, Dict, Generator
+import sys
+from types import MappingProxyType, SimpleNamespace
+from typing import AsyncGenerator, Generator
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
+from pytest_asyncio import is_async_test
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.api.router import api_router
+from app.config import Settings, get_settings
 from app.core.exceptions import register_exception_handlers
 from app.main import app as main_app
-from app.services.uptime_kuma_service import UptimeKumaService
-from app.services.prometheus_service import PrometheusService
-from app.services.grafana_service import GrafanaService
-from app.services.proxmox_service import ProxmoxService
+from app.services.uptime_kuma_service import get_uptime_kuma_service
+from app.services.prometheus_service import PrometheusService, get_prometheus_service
+from app.services.grafana_service import GrafanaService, get_grafana_service
+from app.services.proxmox_service import get_proxmox_service
 
 
-# Set test environment
-os.environ["UPTIME_KUMA_URL"] = "http://test-uptime-kuma"
-os.environ["UPTIME_KUMA_USERNAME"] = "test-user"
-os.environ["UPTIME_KUMA_PASSWORD"] = "test-password"
-os.environ["PROMETHEUS_URL"] = "http://test-prometheus"
-os.environ["GRAFANA_URL"] = "http://test-grafana"
-os.environ["GRAFANA_API_KEY"] = "test-grafana-key"
-os.environ["PROXMOX_URL"] = "http://test-proxmox"
-os.environ["PROXMOX_USERNAME"] = "test-user"
-os.environ["PROXMOX_PASSWORD"] = "test-password"
-os.environ["PROXMOX_VERIFY_SSL"] = "False"
+# Test environment, applied once per session by the _test_env fixture
+TEST_ENV = {
+    "UPTIME_KUMA_URL": "http://test-uptime-kuma",
+    "UPTIME_KUMA_USERNAME": "test-user",
+    "UPTIME_KUMA_PASSWORD": "test-password",
+    "PROMETHEUS_URL": "http://test-prometheus",
+    "GRAFANA_URL": "http://test-grafana",
+    "GRAFANA_API_KEY": "test-grafana-key",
+    "PROXMOX_URL": "http://test-proxmox",
+    "PROXMOX_USERNAME": "test-user",
+    "PROXMOX_PASSWORD": "test-password",
+    "PROXMOX_VERIFY_SSL": "False",
+}
 
+# Canned service responses, shared read-only by the mock services below
+_MONITOR_1 = MappingProxyType({
+    "id": 1,
+    "name": "Test Monitor",
+    "type": "http",
+    "url": "http://test-url",
+    "interval": 60,
+    "active": True,
+    "status": 1,
+    "uptime": 99.9,
+})
+_MONITORS = (_MONITOR_1,)
+_STATUS_PAGE_1 = MappingProxyType({
+    "id": 1,
+    "title": "Test Status Page",
+    "slug": "test-status-page",
+    "published": True,
+})
+_STATUS_PAGES = (_STATUS_PAGE_1,)
 
-@pytest.fixture
+_QUERY_RESULT = MappingProxyType({
+    "status": "success",
+    "data": [
+        {
+            "metric": {"__name__": "up", "instance": "localhost:9090", "job": "prometheus"},
+            "value": [1623860998.456, "1"]
+        }
+    ]
+})
+_QUERY_RANGE_RESULT = MappingProxyType({
+    "status": "success",
+    "data": [
+        {
+            "metric": {"__name__": "up", "instance": "localhost:9090", "job": "prometheus"},
+            "values": [
+                [1623860998.456, "1"],
+                [1623861058.456, "1"]
+            ]
+        }
+    ]
+})
+_ALERTS = MappingProxyType({
+    "alerts": [
+        {
+            "labels": {"alertname": "TestAlert", "severity": "critical"},
+            "annotations": {"description": "This is a test alert"},
+            "state": "firing",
+            "activeAt": "2023-01-01T00:00:00Z",
+            "value": 1.0
+        }
+    ]
+})
+_METADATA = MappingProxyType({
+    "up": {
+        "type": "gauge",
+        "help": "1 if the target is up, 0 if the target is down",
+        "unit": ""
+    }
+})
+
+_DASHBOARD_1 = MappingProxyType({
+    "id": 1,
+    "uid": "abcd1234",
+    "title": "Test Dashboard",
+    "url": "/d/abcd1234",
+    "folder_id": 0,
+    "folder_title": "General",
+    "is_starred": False,
+    "tags": ["test"]
+})
+_DASHBOARDS = (_DASHBOARD_1,)
+_FOLDERS = (MappingProxyType({
+    "id": 1,
+    "uid": "folder1234",
+    "title": "Test Folder",
+    "url": "/dashboards/f/folder1234"
+}),)
+_DATASOURCES = (MappingProxyType({
+    "id": 1,
+    "uid": "ds1234",
+    "name": "Test Prometheus",
+    "type": "prometheus",
+    "url": "http://prometheus:9090",
+    "access": "proxy",
+    "is_default": True
+}),)
+
+_NODE_1 = MappingProxyType({
+    "id": "node1",
+    "node": "node1",
+    "status": "online",
+    "cpu": 0.1,
+    "memory": 1073741824,  # 1 GB
+    "uptime": 3600,
+    "ip": "192.168.1.1"
+})
+_NODES = (_NODE_1,)
+_CLUSTER_OVERVIEW = MappingProxyType({
+    "nodes": 1,
+    "vms": 2,
+    "storage": 1,
+    "total_cpu": 4,
+    "total_memory": 8589934592,  # 8 GB
+    "total_disk": 107374182400  # 100 GB
+})
+_VM_100 = MappingProxyType({
+    "vmid": 100,
+    "name": "test-vm1",
+    "status": "running",
+    "node": "node1",
+    "cpu": 1,
+    "memory": 1073741824,  # 1 GB
+    "disk": 10737418240,  # 10 GB
+    "uptime": 3600
+})
+_VM_101 = MappingProxyType({
+    "vmid": 101,
+    "name": "test-vm2",
+    "status": "stopped",
+    "node": "node1",
+    "cpu": 2,
+    "memory": 2147483648,  # 2 GB
+    "disk": 21474836480,  # 20 GB
+    "uptime": 0
+})
+_VMS = (_VM_100, _VM_101)
+_VMS_BY_KEY = {(vm["node"], vm["vmid"]): vm for vm in _VMS}
+_START_MSG = "VM {} start initiated".format
+_STOP_MSG = "VM {} stop initiated".format
+_VM_NOT_FOUND_MSG = "VM {} not found on node {}".format
+
+# Route compilation happens once at import; tests needing isolation should use
+# _APP.dependency_overrides rather than building a fresh app
+_APP = FastAPI()
+_APP.include_router(api_router)
+register_exception_handlers(_APP)
+
+
+# Mock services returning the canned responses above
+class MockUptimeKumaService:
+    """Stand-in for the Uptime Kuma service."""
+    
+    async def check_health(self):
+        return True
+    
+    async def get_monitors(self):
+        return _MONITORS
+    
+    async def get_monitor(self, monitor_id):
+        if monitor_id == 1:
+            return _MONITOR_1
+        return None
+    
+    async def create_monitor(self, monitor):
+        return {
+            "id": 2,
+            "name": monitor.name,
+            "type": monitor.type,
+            "url": monitor.url,
+            "interval": monitor.interval,
+            "active": True,
+            "status": None,
+            "uptime": None,
+        }
+    
+    async def update_monitor(self, monitor_id, monitor):
+        if monitor_id == 1:
+            return {
+                "id": 1,
+                "name": monitor.name if monitor.name else "Test Monitor",
+                "type": monitor.type if monitor.type else "http",
+                "url": monitor.url if monitor.url else "http://test-url",
+                "interval": monitor.interval if monitor.interval else 60,
+                "active": True,
+                "status": 1,
+                "uptime": 99.9,
+            }
+        return None
+    
+    async def delete_monitor(self, monitor_id):
+        return monitor_id == 1
+    
+    async def get_status_pages(self):
+        return _STATUS_PAGES
+    
+    async def get_status_page(self, page_id):
+        if page_id == 1:
+            return _STATUS_PAGE_1
+        return None
+
+
+class MockPrometheusService:
+    """Stand-in for the Prometheus service."""
+    
+    async def check_health(self):
+        return True
+    
+    async def query(self, query, time=None):
+        return _QUERY_RESULT
+    
+    async def query_range(self, query, start, end, step):
+        return _QUERY_RANGE_RESULT
+    
+    async def get_alerts(self):
+        return _ALERTS
+    
+    async def list_metrics(self, match=None):
+        return ["up", "http_requests_total", "node_cpu_seconds_total"]
+    
+    async def get_metadata(self, metric=None):
+        return _METADATA
+
+
+class MockGrafanaService:
+    """Stand-in for the Grafana service."""
+    
+    async def check_health(self):
+        return True
+    
+    async def get_dashboards(self, folder_id=None):
+        return _DASHBOARDS
+    
+    async def get_dashboard(self, dashboard_uid):
+        if dashboard_uid == "abcd1234":
+            return _DASHBOARD_1
+        return None
+    
+    async def create_dashboard(self, dashboard):
+        return {
+            "id": 2,
+            "uid": "efgh5678",
+            "title": "New Dashboard",
+            "url": "/d/efgh5678",
+            "folder_id": dashboard.folder_id,
+            "folder_title": "General",
+            "is_starred": False,
+            "tags": []
+        }
+    
+    async def delete_dashboard(self, dashboard_uid):
+        return dashboard_uid == "abcd1234"
+    
+    async def get_folders(self):
+        return _FOLDERS
+    
+    async def create_folder(self, folder):
+        return {
+            "id": 2,
+            "uid": "folder5678",
+            "title": folder.title,
+            "url": f"/dashboards/f/folder5678"
+        }
+    
+    async def get_datasources(self):
+        return _DATASOURCES
+    
+    async def create_datasource(self, datasource):
+        return {
+            "id": 2,
+            "uid": "ds5678",
+            "name": datasource.name,
+            "type": datasource.type,
+            "url": datasource.url,
+            "access": datasource.access,
+            "is_default": datasource.is_default
+        }
+
+
+class MockProxmoxService:
+    """Stand-in for the Proxmox service."""
+    
+    async def check_health(self):
+        return True
+    
+    async def get_nodes(self):
+        return _NODES
+    
+    async def get_node(self, node):
+        if node == "node1":
+            return _NODE_1
+        return None
+    
+    async def get_cluster_overview(self):
+        return _CLUSTER_OVERVIEW
+    
+    async def get_vms(self, node=None):
+        if not node:
+            return _VMS
+        return tuple(vm for vm in _VMS if vm["node"] == node)
+    
+    async def get_vm(self, node, vmid):
+        return _VMS_BY_KEY.get((node, vmid))
+    
+    async def create_vm(self, node, vm):
+        return {
+            "vmid": 102,
+            "name": vm.name,
+            "status": "stopped",
+            "node": node,
+            "cpu": vm.cores,
+            "memory": vm.memory * 1024 * 1024,  # Convert to bytes
+            "disk": None,
+            "uptime": 0
+        }
+    
+    async def start_vm(self, node, vmid):
+        if (node, vmid) in _VMS_BY_KEY:
+            return _START_MSG(vmid)
+        raise ValueError(_VM_NOT_FOUND_MSG(vmid, node))
+    
+    async def stop_vm(self, node, vmid):
+        if (node, vmid) in _VMS_BY_KEY:
+            return _STOP_MSG(vmid)
+        raise ValueError(_VM_NOT_FOUND_MSG(vmid, node))
+    
+    async def delete_vm(self, node, vmid):
+        return (node, vmid) in _VMS_BY_KEY
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """
+    Run async tests on uvloop where it is available.
+    
+    uvloop ships with uvicorn[standard] on everything but Windows.
+    
+    Args:
+        config: Pytest config
+        item: Test item being parametrized
+        
+    Returns:
+        Dict[str, Callable]: Event loop factory by name
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            return {"uvloop": uvloop.new_event_loop}
+        except ImportError:
+            pass
+    return {"asyncio": asyncio.new_event_loop}
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Run every async test on the session-wide event loop.
+    
+    Args:
+        items: Collected test items
+    """
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+# Patch shared state with a single patch.dict/patch.object per fixture rather
+# than a monkeypatch call per attribute; each one restores everything at once.
+@pytest.fixture(scope="session", autouse=True)
+def _test_env() -> Generator[None, None, None]:
+    """
+    Point the service settings at test hosts for the whole session.
+    """
+    with patch.dict(os.environ, TEST_ENV):
+        # The app reads settings while it is imported, before this fixture runs
+        get_settings.cache_clear()
+        yield
+    get_settings.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_dependency_overrides() -> Generator[None, None, None]:
+    """
+    Drop any dependency overrides a test installed on the shared application.
+    """
+    yield
+    _APP.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
 def app() -> FastAPI:
     """
-    Create a FastAPI test application.
+    Get the shared FastAPI test application.
     
     Returns:
         FastAPI: Test application
     """
-    app = FastAPI()
-    app.include_router(api_router)
-    register_exception_handlers(app)
-    return app
+    return _APP
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app: FastAPI) -> TestClient:
     """
     Create a test client for the application.
@@ -59,7 +441,26 @@ def client(app: FastAPI) -> TestClient:
     return TestClient(app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+async def async_client(app: FastAPI) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Create an async client that calls the application in-process.
+    
+    Unlike TestClient, requests run on the test's own event loop rather than
+    in a portal thread, so async tests can await or gather them directly.
+    
+    Args:
+        app: FastAPI application
+        
+    Yields:
+        httpx.AsyncClient: Async test client
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture(scope="session")
 def main_client() -> TestClient:
     """
     Create a test client for the main application.
@@ -70,412 +471,281 @@ def main_client() -> TestClient:
     return TestClient(main_app)
 
 
-# Mock service fixtures
-@pytest.fixture
-def mock_uptime_kuma_service(monkeypatch):
+# Client mocks shared by the service unit tests. Each is a namespace holding
+# only the client attributes the service touches, rather than a MagicMock with
+# spec= that walks the whole client class; it is built once per session and the
+# function-scoped fixtures reset it to its canned responses. The canned
+# responses are kept as JSON, the form the clients receive them in.
+_GRAFANA_HEALTH = orjson.loads(b'{"database":"ok","version":"9.0.0"}')
+_GRAFANA_SEARCH_DASHBOARDS = orjson.loads(
+    b'[{"id":1,"uid":"abcd1234","title":"Test Dashboard","url":"/d/abcd1234",'
+    b'"folderId":0,"folderTitle":"General","isStarred":false,"tags":["test"]}]'
+)
+_GRAFANA_GET_DASHBOARD = orjson.loads(
+    b'{"meta":{"id":1,"uid":"abcd1234","folderId":0,"folderTitle":"General",'
+    b'"isStarred":false},"dashboard":{"id":1,"title":"Test Dashboard",'
+    b'"tags":["test"]}}'
+)
+_GRAFANA_UPDATE_DASHBOARD = orjson.loads(
+    b'{"id":2,"uid":"efgh5678","title":"New Dashboard","url":"/d/efgh5678"}'
+)
+_GRAFANA_FOLDERS = orjson.loads(
+    b'[{"id":1,"uid":"folder1234","title":"Test Folder",'
+    b'"url":"/dashboards/f/folder1234"}]'
+)
+_GRAFANA_CREATE_FOLDER = orjson.loads(
+    b'{"id":2,"uid":"folder5678","title":"New Folder",'
+    b'"url":"/dashboards/f/folder5678"}'
+)
+_GRAFANA_DATASOURCES = orjson.loads(
+    b'[{"id":1,"uid":"ds1234","name":"Test Prometheus","type":"prometheus",'
+    b'"url":"http://prometheus:9090","access":"proxy","isDefault":true}]'
+)
+_GRAFANA_CREATE_DATASOURCE = orjson.loads(
+    b'{"datasource":{"id":2,"uid":"ds5678","name":"New Datasource",'
+    b'"type":"influxdb","url":"http://influxdb:8086","access":"proxy",'
+    b'"isDefault":false},"id":2,"message":"Datasource added"}'
+)
+_PROM_QUERY = orjson.loads(
+    b'[{"metric":{"__name__":"up","instance":"localhost:9090",'
+    b'"job":"prometheus"},"value":[1623860998.456,"1"]}]'
+)
+_PROM_RANGE = orjson.loads(
+    b'[{"metric":{"__name__":"up","instance":"localhost:9090",'
+    b'"job":"prometheus"},"values":[[1623860998.456,"1"],'
+    b'[1623861058.456,"1"]]}]'
+)
+_PROM_ALERTS = orjson.loads(
+    b'[{"labels":{"alertname":"InstanceDown","severity":"critical"},'
+    b'"annotations":{"description":"Instance is down",'
+    b'"summary":"Instance down"},"state":"firing",'
+    b'"activeAt":"2023-01-01T00:00:00Z","value":1.0}]'
+)
+_PROM_METRICS = orjson.loads(b'["up","http_requests_total","node_cpu_seconds_total"]')
+_PROM_METADATA = orjson.loads(
+    b'{"up":{"type":"gauge","help":"1 if the target is up,'
+    b' 0 if the target is down","unit":""}}'
+)
+
+
+# Settings for the client-backed services, validated once
+_GRAFANA_SETTINGS = Settings(
+    GRAFANA_URL="http://test-grafana:3000",
+    GRAFANA_API_KEY="test-api-key"
+)
+_PROMETHEUS_SETTINGS = Settings(
+    PROMETHEUS_URL="http://test-prometheus:9090",
+    PROMETHEUS_USERNAME="test-user",
+    PROMETHEUS_PASSWORD="test-password"
+)
+
+
+def _reset_client(client: SimpleNamespace) -> None:
     """
-    Mock the Uptime Kuma service.
+    Clear the calls, return values and side effects of a client mock.
     
     Args:
-        monkeypatch: Pytest monkeypatch fixture
+        client: Client mock namespace
     """
-    class MockUptimeKumaService:
-        async def check_health(self):
-            return True
-        
-        async def get_monitors(self):
-            return [
-                {
-                    "id": 1,
-                    "name": "Test Monitor",
-                    "type": "http",
-                    "url": "http://test-url",
-                    "interval": 60,
-                    "active": True,
-                    "status": 1,
-                    "uptime": 99.9,
-                }
-            ]
-        
-        async def get_monitor(self, monitor_id):
-            if monitor_id == 1:
-                return {
-                    "id": 1,
-                    "name": "Test Monitor",
-                    "type": "http",
-                    "url": "http://test-url",
-                    "interval": 60,
-                    "active": True,
-                    "status": 1,
-                    "uptime": 99.9,
-                }
-            return None
-        
-        async def create_monitor(self, monitor):
-            return {
-                "id": 2,
-                "name": monitor.name,
-                "type": monitor.type,
-                "url": monitor.url,
-                "interval": monitor.interval,
-                "active": True,
-                "status": None,
-                "uptime": None,
-            }
-        
-        async def update_monitor(self, monitor_id, monitor):
-            if monitor_id == 1:
-                return {
-                    "id": 1,
-                    "name": monitor.name if monitor.name else "Test Monitor",
-                    "type": monitor.type if monitor.type else "http",
-                    "url": monitor.url if monitor.url else "http://test-url",
-                    "interval": monitor.interval if monitor.interval else 60,
-                    "active": True,
-                    "status": 1,
-                    "uptime": 99.9,
-                }
-            return None
-        
-        async def delete_monitor(self, monitor_id):
-            return monitor_id == 1
-        
-        async def get_status_pages(self):
-            return [
-                {
-                    "id": 1,
-                    "title": "Test Status Page",
-                    "slug": "test-status-page",
-                    "published": True,
-                }
-            ]
-        
-        async def get_status_page(self, page_id):
-            if page_id == 1:
-                return {
-                    "id": 1,
-                    "title": "Test Status Page",
-                    "slug": "test-status-page",
-                    "published": True,
-                }
-            return None
+    for attr in vars(client).values():
+        attr.reset_mock(return_value=True, side_effect=True)
+
+
+def _configure_grafana_client(client: SimpleNamespace) -> None:
+    """
+    Set the canned GrafanaApi responses.
     
-    monkeypatch.setattr("app.api.endpoints.health.UptimeKumaService", MockUptimeKumaService)
-    monkeypatch.setattr("app.api.endpoints.uptime_kuma.UptimeKumaService", MockUptimeKumaService)
+    Args:
+        client: GrafanaApi mock
+    """
+    # Mock nested responses
+    client.health.check.return_value = _GRAFANA_HEALTH
+    client.search.search_dashboards.return_value = _GRAFANA_SEARCH_DASHBOARDS
+    client.dashboard.get_dashboard.return_value = _GRAFANA_GET_DASHBOARD
+    client.dashboard.update_dashboard.return_value = _GRAFANA_UPDATE_DASHBOARD
+    client.folder.get_all_folders.return_value = _GRAFANA_FOLDERS
+    client.folder.create_folder.return_value = _GRAFANA_CREATE_FOLDER
+    client.datasource.list_datasources.return_value = _GRAFANA_DATASOURCES
+    client.datasource.create_datasource.return_value = _GRAFANA_CREATE_DATASOURCE
+
+
+def _configure_prometheus_client(client: SimpleNamespace) -> None:
+    """
+    Set the canned PrometheusConnect responses.
     
-    return MockUptimeKumaService()
+    Args:
+        client: PrometheusConnect mock
+    """
+    # Mock responses
+    client.custom_query.return_value = _PROM_QUERY
+    client.custom_query_range.return_value = _PROM_RANGE
+    client.all_alerts.return_value = _PROM_ALERTS
+    client.all_metrics.return_value = _PROM_METRICS
+    client.get_metadata.return_value = _PROM_METADATA
+
+
+@pytest.fixture(scope="session")
+def _grafana_client() -> SimpleNamespace:
+    """Session-wide GrafanaApi mock; use mock_grafana_client in tests."""
+    return SimpleNamespace(
+        health=MagicMock(),
+        search=MagicMock(),
+        dashboard=MagicMock(),
+        folder=MagicMock(),
+        datasource=MagicMock()
+    )
+
+
+@pytest.fixture(scope="session")
+def _prometheus_client() -> SimpleNamespace:
+    """Session-wide PrometheusConnect mock; use mock_prometheus_client in tests."""
+    return SimpleNamespace(
+        custom_query=MagicMock(),
+        custom_query_range=MagicMock(),
+        all_alerts=MagicMock(),
+        all_metrics=MagicMock(),
+        get_metadata=MagicMock()
+    )
+
+
+@pytest.fixture
+def mock_grafana_client(_grafana_client: SimpleNamespace) -> SimpleNamespace:
+    """Mock GrafanaApi client, reset to its canned responses."""
+    _reset_client(_grafana_client)
+    _configure_grafana_client(_grafana_client)
+    return _grafana_client
+
+
+@pytest.fixture
+def mock_prometheus_client(_prometheus_client: SimpleNamespace) -> SimpleNamespace:
+    """Mock PrometheusConnect client, reset to its canned responses."""
+    _reset_client(_prometheus_client)
+    _configure_prometheus_client(_prometheus_client)
+    return _prometheus_client
+
+
+@pytest.fixture(scope="session")
+async def _grafana_service(_grafana_client: SimpleNamespace) -> GrafanaService:
+    """Session-wide Grafana service wired to the client mock."""
+    with patch("app.services.grafana_service.GrafanaApi", return_value=_grafana_client):
+        service = GrafanaService(settings=_GRAFANA_SETTINGS)
+        await service._get_client()
+    return service
+
+
+@pytest.fixture(scope="session")
+async def _prometheus_service(_prometheus_client: SimpleNamespace) -> PrometheusService:
+    """Session-wide Prometheus service wired to the client mock."""
+    with patch("app.services.prometheus_service.PrometheusConnect", return_value=_prometheus_client):
+        service = PrometheusService(settings=_PROMETHEUS_SETTINGS)
+        await service._get_client()
+    return service
+
+
+@pytest.fixture
+def grafana_service(_grafana_service: GrafanaService, mock_grafana_client: SimpleNamespace) -> GrafanaService:
+    """Create Grafana service with mocked client."""
+    return _grafana_service
 
 
 @pytest.fixture
-def mock_prometheus_service(monkeypatch):
+def prometheus_service(_prometheus_service: PrometheusService, mock_prometheus_client: SimpleNamespace) -> PrometheusService:
+    """Create Prometheus service with mocked client."""
+    return _prometheus_service
+
+
+# Mock service fixtures
+def _reset_health_check(service) -> None:
     """
-    Mock the Prometheus service.
+    Clear a shared mock service's health-check calls and overrides.
     
     Args:
-        monkeypatch: Pytest monkeypatch fixture
+        service: Mock service
     """
-    class MockPrometheusService:
-        async def check_health(self):
-            return True
-        
-        async def query(self, query, time=None):
-            return {
-                "status": "success",
-                "data": [
-                    {
-                        "metric": {"__name__": "up", "instance": "localhost:9090", "job": "prometheus"},
-                        "value": [1623860998.456, "1"]
-                    }
-                ]
-            }
-        
-        async def query_range(self, query, start, end, step):
-            return {
-                "status": "success",
-                "data": [
-                    {
-                        "metric": {"__name__": "up", "instance": "localhost:9090", "job": "prometheus"},
-                        "values": [
-                            [1623860998.456, "1"],
-                            [1623861058.456, "1"]
-                        ]
-                    }
-                ]
-            }
-        
-        async def get_alerts(self):
-            return {
-                "alerts": [
-                    {
-                        "labels": {"alertname": "TestAlert", "severity": "critical"},
-                        "annotations": {"description": "This is a test alert"},
-                        "state": "firing",
-                        "activeAt": "2023-01-01T00:00:00Z",
-                        "value": 1.0
-                    }
-                ]
-            }
-        
-        async def list_metrics(self, match=None):
-            return ["up", "http_requests_total", "node_cpu_seconds_total"]
-        
-        async def get_metadata(self, metric=None):
-            return {
-                "up": {
-                    "type": "gauge",
-                    "help": "1 if the target is up, 0 if the target is down",
-                    "unit": ""
-                }
-            }
-    
-    monkeypatch.setattr("app.api.endpoints.health.PrometheusService", MockPrometheusService)
-    monkeypatch.setattr("app.api.endpoints.prometheus.PrometheusService", MockPrometheusService)
-    
-    return MockPrometheusService()
+    service.check_health.reset_mock(return_value=True, side_effect=True)
+    service.check_health.return_value = True
+
+
+@pytest.fixture(scope="session")
+def _mock_uptime_kuma_service() -> MockUptimeKumaService:
+    """Session-wide mock Uptime Kuma service; use mock_uptime_kuma_service in tests."""
+    service = MockUptimeKumaService()
+    service.check_health = AsyncMock(return_value=True)
+    return service
 
 
 @pytest.fixture
-def mock_grafana_service(monkeypatch):
+def mock_uptime_kuma_service(_mock_uptime_kuma_service: MockUptimeKumaService) -> MockUptimeKumaService:
     """
-    Mock the Grafana service.
+    Mock the Uptime Kuma service.
     
     Args:
-        monkeypatch: Pytest monkeypatch fixture
+        _mock_uptime_kuma_service: Session-wide mock service
     """
-    class MockGrafanaService:
-        async def check_health(self):
-            return True
-        
-        async def get_dashboards(self, folder_id=None):
-            return [
-                {
-                    "id": 1,
-                    "uid": "abcd1234",
-                    "title": "Test Dashboard",
-                    "url": "/d/abcd1234",
-                    "folder_id": 0,
-                    "folder_title": "General",
-                    "is_starred": False,
-                    "tags": ["test"]
-                }
-            ]
-        
-        async def get_dashboard(self, dashboard_uid):
-            if dashboard_uid == "abcd1234":
-                return {
-                    "id": 1,
-                    "uid": "abcd1234",
-                    "title": "Test Dashboard",
-                    "url": "/d/abcd1234",
-                    "folder_id": 0,
-                    "folder_title": "General",
-                    "is_starred": False,
-                    "tags": ["test"]
-                }
-            return None
-        
-        async def create_dashboard(self, dashboard):
-            return {
-                "id": 2,
-                "uid": "efgh5678",
-                "title": "New Dashboard",
-                "url": "/d/efgh5678",
-                "folder_id": dashboard.folder_id,
-                "folder_title": "General",
-                "is_starred": False,
-                "tags": []
-            }
-        
-        async def delete_dashboard(self, dashboard_uid):
-            return dashboard_uid == "abcd1234"
-        
-        async def get_folders(self):
-            return [
-                {
-                    "id": 1,
-                    "uid": "folder1234",
-                    "title": "Test Folder",
-                    "url": "/dashboards/f/folder1234"
-                }
-            ]
-        
-        async def create_folder(self, folder):
-            return {
-                "id": 2,
-                "uid": "folder5678",
-                "title": folder.title,
-                "url": f"/dashboards/f/folder5678"
-            }
-        
-        async def get_datasources(self):
-            return [
-                {
-                    "id": 1,
-                    "uid": "ds1234",
-                    "name": "Test Prometheus",
-                    "type": "prometheus",
-                    "url": "http://prometheus:9090",
-                    "access": "proxy",
-                    "is_default": True
-                }
-            ]
-        
-        async def create_datasource(self, datasource):
-            return {
-                "id": 2,
-                "uid": "ds5678",
-                "name": datasource.name,
-                "type": datasource.type,
-                "url": datasource.url,
-                "access": datasource.access,
-                "is_default": datasource.is_default
-            }
-    
-    monkeypatch.setattr("app.api.endpoints.health.GrafanaService", MockGrafanaService)
-    monkeypatch.setattr("app.api.endpoints.grafana.GrafanaService", MockGrafanaService)
-    
-    return MockGrafanaService()
+    _reset_health_check(_mock_uptime_kuma_service)
+    _APP.dependency_overrides[get_uptime_kuma_service] = lambda: _mock_uptime_kuma_service
+    return _mock_uptime_kuma_service
+
+
+@pytest.fixture(scope="session")
+def _mock_prometheus_service() -> MockPrometheusService:
+    """Session-wide mock Prometheus service; use mock_prometheus_service in tests."""
+    service = MockPrometheusService()
+    service.check_health = AsyncMock(return_value=True)
+    return service
 
 
 @pytest.fixture
-def mock_proxmox_service(monkeypatch):
+def mock_prometheus_service(_mock_prometheus_service: MockPrometheusService) -> MockPrometheusService:
     """
-    Mock the Proxmox service.
+    Mock the Prometheus service.
     
     Args:
-        monkeypatch: Pytest monkeypatch fixture
+        _mock_prometheus_service: Session-wide mock service
     """
-    class MockProxmoxService:
-        async def check_health(self):
-            return True
-        
-        async def get_nodes(self):
-            return [
-                {
-                    "id": "node1",
-                    "node": "node1",
-                    "status": "online",
-                    "cpu": 0.1,
-                    "memory": 1073741824,  # 1 GB
-                    "uptime": 3600,
-                    "ip": "192.168.1.1"
-                }
-            ]
-        
-        async def get_node(self, node):
-            if node == "node1":
-                return {
-                    "id": "node1",
-                    "node": "node1",
-                    "status": "online",
-                    "cpu": 0.1,
-                    "memory": 1073741824,  # 1 GB
-                    "uptime": 3600,
-                    "ip": "192.168.1.1"
-                }
-            return None
-        
-        async def get_cluster_overview(self):
-            return {
-                "nodes": 1,
-                "vms": 2,
-                "storage": 1,
-                "total_cpu": 4,
-                "total_memory": 8589934592,  # 8 GB
-                "total_disk": 107374182400  # 100 GB
-            }
-        
-        async def get_vms(self, node=None):
-            vms = [
-                {
-                    "vmid": 100,
-                    "name": "test-vm1",
-                    "status": "running",
-                    "node": "node1",
-                    "cpu": 1,
-                    "memory": 1073741824,  # 1 GB
-                    "disk": 10737418240,  # 10 GB
-                    "uptime": 3600
-                },
-                {
-                    "vmid": 101,
-                    "name": "test-vm2",
-                    "status": "stopped",
-                    "node": "node1",
-                    "cpu": 2,
-                    "memory": 2147483648,  # 2 GB
-                    "disk": 21474836480,  # 20 GB
-                    "uptime": 0
-                }
-            ]
-            if node:
-                return [vm for vm in vms if vm["node"] == node]
-            return vms
-        
-        async def get_vm(self, node, vmid):
-            if node == "node1" and vmid == 100:
-                return {
-                    "vmid": 100,
-                    "name": "test-vm1",
-                    "status": "running",
-                    "node": "node1",
-                    "cpu": 1,
-                    "memory": 1073741824,  # 1 GB
-                    "disk": 10737418240,  # 10 GB
-                    "uptime": 3600
-                }
-            elif node == "node1" and vmid == 101:
-                return {
-                    "vmid": 101,
-                    "name": "test-vm2",
-                    "status": "stopped",
-                    "node": "node1",
-                    "cpu": 2,
-                    "memory": 2147483648,  # 2 GB
-                    "disk": 21474836480,  # 20 GB
-                    "uptime": 0
-                }
-            return None
-        
-        async def create_vm(self, node, vm):
-            return {
-                "vmid": 102,
-                "name": vm.name,
-                "status": "stopped",
-                "node": node,
-                "cpu": vm.cores,
-                "memory": vm.memory * 1024 * 1024,  # Convert to bytes
-                "disk": None,
-                "uptime": 0
-            }
-        
-        async def start_vm(self, node, vmid):
-            if node == "node1" and vmid in [100, 101]:
-                return f"VM {vmid} start initiated"
-            raise ValueError(f"VM {vmid} not found on node {node}")
-        
-        async def stop_vm(self, node, vmid):
-            if node == "node1" and vmid in [100, 101]:
-                return f"VM {vmid} stop initiated"
-            raise ValueError(f"VM {vmid} not found on node {node}")
-        
-        async def delete_vm(self, node, vmid):
-            return node == "node1" and vmid in [100, 101]
-    
-    monkeypatch.setattr("app.api.endpoints.health.ProxmoxService", MockProxmoxService)
-    monkeypatch.setattr("app.api.endpoints.proxmox.ProxmoxService", MockProxmoxService)
+    _reset_health_check(_mock_prometheus_service)
+    _APP.dependency_overrides[get_prometheus_service] = lambda: _mock_prometheus_service
+    return _mock_prometheus_service
+
+
+@pytest.fixture(scope="session")
+def _mock_grafana_service() -> MockGrafanaService:
+    """Session-wide mock Grafana service; use mock_grafana_service in tests."""
+    service = MockGrafanaService()
+    service.check_health = AsyncMock(return_value=True)
+    return service
+
+
+@pytest.fixture
+def mock_grafana_service(_mock_grafana_service: MockGrafanaService) -> MockGrafanaService:
+    """
+    Mock the Grafana service.
     
-    return MockProxmoxService()
+    Args:
+        _mock_grafana_service: Session-wide mock service
+    """
+    _reset_health_check(_mock_grafana_service)
+    _APP.dependency_overrides[get_grafana_service] = lambda: _mock_grafana_service
+    return _mock_grafana_service
+
+
+@pytest.fixture(scope="session")
+def _mock_proxmox_service() -> MockProxmoxService:
+    """Session-wide mock Proxmox service; use mock_proxmox_service in tests."""
+    service = MockProxmoxService()
+    service.check_health = AsyncMock(return_value=True)
+    return service
 
 
 @pytest.fixture
-def event_loop():
+def mock_proxmox_service(_mock_proxmox_service: MockProxmoxService) -> MockProxmoxService:
     """
-    Create an asyncio event loop for tests.
+    Mock the Proxmox service.
     
-    Returns:
-        asyncio.AbstractEventLoop: Event loop
+    Args:
+        _mock_proxmox_service: Session-wide mock service
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    _reset_health_check(_mock_proxmox_service)
+    _APP.dependency_overrides[get_proxmox_service] = lambda: _mock_proxmox_service
+    return _mock_proxmox_service
+
@@ -3,22 +3,20 @@ Integration tests for Grafana API integration.
 These tests are meant to run against a real Grafana instance.
 Skip them in CI unless a test instance is available.
 """
+import contextlib
 import os
 import pytest
+import pytest_asyncio
+
+# Skip the whole module, before importing the app, if we have no test instance
+if not (os.environ.get("TEST_GRAFANA_URL") and os.environ.get("TEST_GRAFANA_API_KEY")):
+    pytest.skip("No Grafana test credentials provided", allow_module_level=True)
 
 from app.config import Settings
 from app.models.grafana import DashboardCreate, FolderCreate, DataSourceCreate
 from app.services.grafana_service import GrafanaService
 
 
-# Check if we have environment variables for the test
-# If not, we'll skip these tests
-skip_if_no_grafana = pytest.mark.skipif(
-    not (os.environ.get("TEST_GRAFANA_URL") and os.environ.get("TEST_GRAFANA_API_KEY")),
-    reason="No Grafana test credentials provided"
-)
-
-
 @pytest.fixture
 def grafana_service():
     """Create real Grafana service for integration testing."""
@@ -28,10 +26,9 @@ def grafana_service():
             GRAFANA_API_KEY=os.environ.get("TEST_GRAFANA_API_KEY", "")
         )
     )
-    yield service
+    return service
 
 
-@skip_if_no_grafana
 @pytest.mark.asyncio
 async def test_check_health(grafana_service):
     """Test health check against real Grafana instance."""
@@ -39,7 +36,6 @@ async def test_check_health(grafana_service):
     assert result is True
 
 
-@skip_if_no_grafana
 @pytest.mark.asyncio
 async def test_folder_lifecycle(grafana_service):
     """
@@ -62,7 +58,6 @@ async def test_folder_lifecycle(grafana_service):
     # in some versions, and we don't want to leave a mess in the test environment
 
 
-@skip_if_no_grafana
 @pytest.mark.asyncio
 async def test_datasource_lifecycle(grafana_service):
     """
@@ -97,33 +92,38 @@ async def test_datasource_lifecycle(grafana_service):
         pytest.skip(f"Unable to create test data source: {str(e)}")
 
 
-@skip_if_no_grafana
+@pytest_asyncio.fixture
+async def created_dashboard(grafana_service):
+    """Create a test dashboard and make sure it is removed afterwards."""
+    dashboard_data = DashboardCreate(
+        dashboard_json={
+            "title": "Integration Test Dashboard",
+            "tags": ["test", "integration"],
+            "timezone": "browser",
+            "panels": [],
+            "schemaVersion": 26,
+            "version": 0
+        },
+        folder_id=0,  # General folder
+        overwrite=True,
+        message="Created by integration test"
+    )
+    
+    dashboard = await grafana_service.create_dashboard(dashboard_data)
+    yield dashboard
+    # The test may already have deleted it
+    with contextlib.suppress(Exception):
+        await grafana_service.delete_dashboard(dashboard.uid)
+
+
 @pytest.mark.asyncio
-async def test_dashboard_lifecycle(grafana_service):
+async def test_dashboard_lifecycle(grafana_service, created_dashboard):
     """
     Test full lifecycle of a dashboard:
     - Create
     - Read
     - Delete
     """
-    # Create a simple dashboard JSON
-    dashboard_json = {
-        "title": "Integration Test Dashboard",
-        "tags": ["test", "integration"],
-        "timezone": "browser",
-        "panels": [],
-        "schemaVersion": 26,
-        "version": 0
-    }
-    
-    dashboard_data = DashboardCreate(
-        dashboard_json=dashboard_json,
-        folder_id=0,  # General folder
-        overwrite=True,
-        message="Created by integration test"
-    )
-    
-    created_dashboard = await grafana_service.create_dashboard(dashboard_data)
     assert created_dashboard is not None
     assert created_dashboard.title == "Integration Test Dashboard"
     
@@ -7,18 +7,14 @@ import os
 import pytest
 from datetime import datetime, timedelta
 
+# Skip the whole module, before importing the app, if we have no test instance
+if not os.environ.get("TEST_PROMETHEUS_URL"):
+    pytest.skip("No Prometheus test URL provided", allow_module_level=True)
+
 from app.config import Settings
 from app.services.prometheus_service import PrometheusService
 
 
-# Check if we have environment variables for the test
-# If not, we'll skip these tests
-skip_if_no_prometheus = pytest.mark.skipif(
-    not os.environ.get("TEST_PROMETHEUS_URL"),
-    reason="No Prometheus test URL provided"
-)
-
-
 @pytest.fixture
 def prometheus_service():
     """Create real Prometheus service for integration testing."""
@@ -29,10 +25,9 @@ def prometheus_service():
             PROMETHEUS_PASSWORD=os.environ.get("TEST_PROMETHEUS_PASSWORD", "")
         )
     )
-    yield service
+    return service
 
 
-@skip_if_no_prometheus
 @pytest.mark.asyncio
 async def test_check_health(prometheus_service):
     """Test health check against real Prometheus instance."""
@@ -40,7 +35,6 @@ async def test_check_health(prometheus_service):
     assert result is True
 
 
-@skip_if_no_prometheus
 @pytest.mark.asyncio
 async def test_query(prometheus_service):
     """Test executing PromQL query against real Prometheus instance."""
@@ -52,7 +46,6 @@ async def test_query(prometheus_service):
     assert len(result.data) > 0
 
 
-@skip_if_no_prometheus
 @pytest.mark.asyncio
 async def test_query_range(prometheus_service):
     """Test executing PromQL range query against real Prometheus instance."""
@@ -68,7 +61,6 @@ async def test_query_range(prometheus_service):
     # but it should be a valid response structure
 
 
-@skip_if_no_prometheus
 @pytest.mark.asyncio
 async def test_get_alerts(prometheus_service):
     """Test retrieving alerts from real Prometheus instance."""
@@ -79,7 +71,6 @@ async def test_get_alerts(prometheus_service):
     # but it should be a valid response structure
 
 
-@skip_if_no_prometheus
 @pytest.mark.asyncio
 async def test_list_metrics(prometheus_service):
     """Test listing metrics from real Prometheus instance."""
@@ -91,7 +82,6 @@ async def test_list_metrics(prometheus_service):
     assert "up" in result
 
 
-@skip_if_no_prometheus
 @pytest.mark.asyncio
 async def test_get_metadata(prometheus_service):
     """Test retrieving metric metadata from real Prometheus instance."""
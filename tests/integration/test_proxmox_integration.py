@@ -6,21 +6,16 @@ Skip them in CI unless a test instance is available.
 import os
 import pytest
 
+# Skip the whole module, before importing the app, if we have no test instance
+if not (os.environ.get("TEST_PROXMOX_URL") and
+        os.environ.get("TEST_PROXMOX_USERNAME") and
+        os.environ.get("TEST_PROXMOX_PASSWORD")):
+    pytest.skip("No Proxmox test credentials provided", allow_module_level=True)
+
 from app.config import Settings
-from app.models.proxmox import VMCreate
 from app.services.proxmox_service import ProxmoxService
 
 
-# Check if we have environment variables for the test
-# If not, we'll skip these tests
-skip_if_no_proxmox = pytest.mark.skipif(
-    not (os.environ.get("TEST_PROXMOX_URL") and 
-         os.environ.get("TEST_PROXMOX_USERNAME") and 
-         os.environ.get("TEST_PROXMOX_PASSWORD")),
-    reason="No Proxmox test credentials provided"
-)
-
-
 @pytest.fixture
 def proxmox_service():
     """Create real Proxmox service for integration testing."""
@@ -32,10 +27,9 @@ def proxmox_service():
             PROXMOX_VERIFY_SSL=os.environ.get("TEST_PROXMOX_VERIFY_SSL", "False").lower() == "true"
         )
     )
-    yield service
+    return service
 
 
-@skip_if_no_proxmox
 @pytest.mark.asyncio
 async def test_check_health(proxmox_service):
     """Test health check against real Proxmox instance."""
@@ -43,7 +37,6 @@ async def test_check_health(proxmox_service):
     assert result is True
 
 
-@skip_if_no_proxmox
 @pytest.mark.asyncio
 async def test_get_nodes(proxmox_service):
     """Test retrieving nodes from real Proxmox instance."""
@@ -54,7 +47,6 @@ async def test_get_nodes(proxmox_service):
     assert all(hasattr(node, "node") for node in nodes)
 
 
-@skip_if_no_proxmox
 @pytest.mark.asyncio
 async def test_get_cluster_overview(proxmox_service):
     """Test retrieving cluster overview from real Proxmox instance."""
@@ -66,7 +58,6 @@ async def test_get_cluster_overview(proxmox_service):
     assert hasattr(overview, "total_disk")
 
 
-@skip_if_no_proxmox
 @pytest.mark.asyncio
 async def test_get_vms(proxmox_service):
     """Test retrieving VMs from real Proxmox instance."""
@@ -81,7 +72,6 @@ async def test_get_vms(proxmox_service):
         assert hasattr(vm, "node")
 
 
-@skip_if_no_proxmox
 @pytest.mark.asyncio
 async def test_get_specific_node(proxmox_service):
     """Test retrieving a specific node from real Proxmox instance."""
@@ -98,7 +88,6 @@ async def test_get_specific_node(proxmox_service):
     assert node.node == first_node_name
 
 
-@skip_if_no_proxmox
 @pytest.mark.asyncio
 async def test_node_vms(proxmox_service):
     """Test retrieving VMs for a specific node from real Proxmox instance."""
@@ -3,27 +3,25 @@ Integration tests for Uptime Kuma API integration.
 These tests are meant to run against a real Uptime Kuma instance.
 Skip them in CI unless a test instance is available.
 """
+import asyncio
+import contextlib
 import os
 import pytest
-from unittest.mock import patch
+import pytest_asyncio
+
+# Skip the whole module, before importing the app, if we have no test instance
+if not (os.environ.get("TEST_UPTIME_KUMA_URL") and
+        os.environ.get("TEST_UPTIME_KUMA_USERNAME") and
+        os.environ.get("TEST_UPTIME_KUMA_PASSWORD")):
+    pytest.skip("No Uptime Kuma test credentials provided", allow_module_level=True)
 
 from app.config import Settings
 from app.models.uptime_kuma import MonitorCreate, MonitorUpdate
 from app.services.uptime_kuma_service import UptimeKumaService
 
 
-# Check if we have environment variables for the test
-# If not, we'll skip these tests
-skip_if_no_credentials = pytest.mark.skipif(
-    not (os.environ.get("TEST_UPTIME_KUMA_URL") and 
-         os.environ.get("TEST_UPTIME_KUMA_USERNAME") and 
-         os.environ.get("TEST_UPTIME_KUMA_PASSWORD")),
-    reason="No Uptime Kuma test credentials provided"
-)
-
-
-@pytest.fixture
-def uptime_kuma_service():
+@pytest_asyncio.fixture
+async def uptime_kuma_service():
     """Create real Uptime Kuma service for integration testing."""
     service = UptimeKumaService(
         settings=Settings(
@@ -34,10 +32,9 @@ def uptime_kuma_service():
     )
     yield service
     # Clean up by closing the connection
-    asyncio.run(service.close())
+    await service.close()
 
 
-@skip_if_no_credentials
 @pytest.mark.asyncio
 async def test_check_health(uptime_kuma_service):
     """Test health check against real Uptime Kuma instance."""
@@ -45,9 +42,26 @@ async def test_check_health(uptime_kuma_service):
     assert result is True
 
 
-@skip_if_no_credentials
+@pytest_asyncio.fixture
+async def disposable_monitor(uptime_kuma_service):
+    """Create a test monitor and make sure it is removed afterwards."""
+    monitor = await uptime_kuma_service.create_monitor(
+        MonitorCreate(
+            name="Integration Test Monitor",
+            type="http",
+            url="https://httpbin.org/status/200",
+            interval=60,
+            description="Created by integration test"
+        )
+    )
+    yield monitor
+    # The test may already have deleted it
+    with contextlib.suppress(Exception):
+        await uptime_kuma_service.delete_monitor(monitor.id)
+
+
 @pytest.mark.asyncio
-async def test_monitor_lifecycle(uptime_kuma_service):
+async def test_monitor_lifecycle(uptime_kuma_service, disposable_monitor):
     """
     Test full lifecycle of a monitor:
     - Create
@@ -55,22 +69,12 @@ async def test_monitor_lifecycle(uptime_kuma_service):
     - Update
     - Delete
     """
-    # Create a test monitor
-    monitor_data = MonitorCreate(
-        name="Integration Test Monitor",
-        type="http",
-        url="https://httpbin.org/status/200",
-        interval=60,
-        description="Created by integration test"
-    )
-    
-    created_monitor = await uptime_kuma_service.create_monitor(monitor_data)
-    assert created_monitor is not None
-    assert created_monitor.name == "Integration Test Monitor"
-    assert created_monitor.type == "http"
+    assert disposable_monitor is not None
+    assert disposable_monitor.name == "Integration Test Monitor"
+    assert disposable_monitor.type == "http"
     
     # Get the monitor
-    monitor_id = created_monitor.id
+    monitor_id = disposable_monitor.id
     fetched_monitor = await uptime_kuma_service.get_monitor(monitor_id)
     assert fetched_monitor is not None
     assert fetched_monitor.id == monitor_id
@@ -90,12 +94,15 @@ async def test_monitor_lifecycle(uptime_kuma_service):
     deleted = await uptime_kuma_service.delete_monitor(monitor_id)
     assert deleted is True
     
-    # Verify it's gone
-    non_existent = await uptime_kuma_service.get_monitor(monitor_id)
+    # Verify it's gone, both directly and from the monitor list
+    non_existent, monitors = await asyncio.gather(
+        uptime_kuma_service.get_monitor(monitor_id),
+        uptime_kuma_service.get_monitors()
+    )
     assert non_existent is None
+    assert all(monitor.id != monitor_id for monitor in monitors)
 
 
-@skip_if_no_credentials
 @pytest.mark.asyncio
 async def test_get_monitors_and_status_pages(uptime_kuma_service):
     """Test retrieving all monitors and status pages."""
@@ -1,9 +1,13 @@
 """
 Unit tests for health check endpoints.
 """
-import pytest
-from fastapi.testclient import TestClient
-from datetime import datetime
+import threading
+
+from app.services.grafana_service import get_grafana_service
+from app.services.prometheus_service import get_prometheus_service
+
+# How long a blocking health probe waits for the other one before giving up
+_PROBE_TIMEOUT = 5
 
 
 def test_health_check(client, mock_uptime_kuma_service, mock_prometheus_service, mock_grafana_service, mock_proxmox_service):
@@ -44,7 +48,7 @@ def test_ping_endpoint(client):
     assert data["message"] == "pong"
 
 
-def test_health_check_degraded(client, monkeypatch, mock_uptime_kuma_service, mock_prometheus_service, mock_grafana_service, mock_proxmox_service):
+def test_health_check_degraded(client, mock_uptime_kuma_service, mock_prometheus_service, mock_grafana_service, mock_proxmox_service):
     """
     Test health check endpoint reports degraded status when a service is unhealthy.
     """
@@ -53,7 +57,7 @@ def test_health_check_degraded(client, monkeypatch, mock_uptime_kuma_service, mo
         async def check_health(self):
             raise Exception("Prometheus connection error")
     
-    monkeypatch.setattr("app.api.endpoints.health.PrometheusService", MockFailingPrometheusService)
+    client.app.dependency_overrides[get_prometheus_service] = lambda: MockFailingPrometheusService()
     
     response = client.get("/api/v1/health/")
     assert response.status_code == 200
@@ -69,50 +73,36 @@ def test_health_check_degraded(client, monkeypatch, mock_uptime_kuma_service, mo
     assert "Prometheus connection error" in services["prometheus"]["message"]
 
 
-def test_health_check_integrates_all_services(client, mock_uptime_kuma_service, mock_prometheus_service, mock_grafana_service, mock_proxmox_service):
+def test_health_check_integrates_all_services(client, mock_uptime_kuma_service, prometheus_service, mock_prometheus_client, grafana_service, mock_grafana_client, mock_proxmox_service):
     """
     Test health check endpoint calls health check methods for all services.
     """
-    # Spy on the service health check methods to verify they're called
-    call_counts = {
-        "uptime_kuma": 0,
-        "prometheus": 0,
-        "grafana": 0,
-        "proxmox": 0
-    }
-    
-    original_uptime_kuma_check = mock_uptime_kuma_service.check_health
-    original_prometheus_check = mock_prometheus_service.check_health
-    original_grafana_check = mock_grafana_service.check_health
-    original_proxmox_check = mock_proxmox_service.check_health
-    
-    async def uptime_kuma_spy():
-        call_counts["uptime_kuma"] += 1
-        return await original_uptime_kuma_check()
+    # The real Grafana and Prometheus services, with client calls that block
+    # the way the synchronous clients do. Each waits for the other, so both
+    # only return if they run at the same time; run one after the other, the
+    # barrier breaks and the checks fail.
+    barrier = threading.Barrier(2, timeout=_PROBE_TIMEOUT)
     
-    async def prometheus_spy():
-        call_counts["prometheus"] += 1
-        return await original_prometheus_check()
+    def blocking_health_probe(*args, **kwargs):
+        barrier.wait()
+        return {}
     
-    async def grafana_spy():
-        call_counts["grafana"] += 1
-        return await original_grafana_check()
-    
-    async def proxmox_spy():
-        call_counts["proxmox"] += 1
-        return await original_proxmox_check()
-    
-    mock_uptime_kuma_service.check_health = uptime_kuma_spy
-    mock_prometheus_service.check_health = prometheus_spy
-    mock_grafana_service.check_health = grafana_spy
-    mock_proxmox_service.check_health = proxmox_spy
+    mock_grafana_client.health.check.side_effect = blocking_health_probe
+    mock_prometheus_client.custom_query.side_effect = blocking_health_probe
+    client.app.dependency_overrides[get_grafana_service] = lambda: grafana_service
+    client.app.dependency_overrides[get_prometheus_service] = lambda: prometheus_service
     
     # Call the health check endpoint
     response = client.get("/api/v1/health/")
     assert response.status_code == 200
     
+    data = response.json()
+    assert data["services"]["grafana"]["status"] == "healthy"
+    assert data["services"]["prometheus"]["status"] == "healthy"
+    assert data["status"] == "healthy"
+    
     # Check that all service health check methods were called
-    assert call_counts["uptime_kuma"] == 1
-    assert call_counts["prometheus"] == 1
-    assert call_counts["grafana"] == 1
-    assert call_counts["proxmox"] == 1
+    assert mock_uptime_kuma_service.check_health.await_count == 1
+    assert mock_prometheus_client.custom_query.call_count == 1
+    assert mock_grafana_client.health.check.call_count == 1
+    assert mock_proxmox_service.check_health.await_count == 1
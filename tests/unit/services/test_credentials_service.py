@@ -0,0 +1,64 @@
+"""
+Unit tests for Credentials service.
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from jose import jwt, JWTError
+
+from app.services.credentials_service import CredentialsService
+
+
+@pytest.fixture
+def credentials_service():
+    """Create Credentials service with a fixed secret."""
+    return CredentialsService(secret_key="test-secret-key")
+
+
+def test_encode_token_matches_jose(credentials_service):
+    """Test tokens signed with the primed HMAC context are identical to jose's."""
+    claims = {"sub": "test-user", "exp": datetime.now(timezone.utc) + timedelta(minutes=5)}
+
+    token = credentials_service._encode_token(claims)
+
+    assert token == jwt.encode(claims, "test-secret-key", algorithm="HS256")
+
+
+def test_decode_token(credentials_service):
+    """Test decoding a token issued by jose."""
+    token = jwt.encode(
+        {"sub": "test-user", "exp": datetime.now(timezone.utc) + timedelta(minutes=5)},
+        "test-secret-key",
+        algorithm="HS256"
+    )
+
+    payload = credentials_service._decode_token(token)
+
+    assert payload["sub"] == "test-user"
+
+
+def test_decode_token_bad_signature(credentials_service):
+    """Test a token signed with another secret is rejected."""
+    token = jwt.encode(
+        {"sub": "test-user", "exp": datetime.now(timezone.utc) + timedelta(minutes=5)},
+        "other-secret",
+        algorithm="HS256"
+    )
+
+    with pytest.raises(JWTError):
+        credentials_service._decode_token(token)
+
+
+def test_decode_token_expired(credentials_service):
+    """Test an expired token raises ExpiredSignatureError."""
+    token = credentials_service._encode_token(
+        {"sub": "test-user", "exp": datetime.now(timezone.utc) - timedelta(minutes=5)}
+    )
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        credentials_service._decode_token(token)
+
+
+def test_decode_token_malformed(credentials_service):
+    """Test a malformed token is rejected."""
+    with pytest.raises(JWTError):
+        credentials_service._decode_token("not-a-token")
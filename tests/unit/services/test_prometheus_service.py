@@ -3,167 +3,123 @@ Unit tests for Prometheus service.
 """
 import pytest
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
 
-from prometheus_api_client import PrometheusConnect
+import requests
+from requests.adapters import BaseAdapter
 
-from app.config import Settings
-from app.services.prometheus_service import PrometheusService
 
-
-@pytest.fixture
-def mock_prometheus_client():
-    """Mock PrometheusConnect client."""
-    mock_client = MagicMock(spec=PrometheusConnect)
+class StubTransport(BaseAdapter):
+    """Answer every request with a canned JSON body, recording what was sent."""
     
-    # Mock responses
-    mock_client.custom_query.return_value = [
-        {
-            "metric": {"__name__": "up", "instance": "localhost:9090", "job": "prometheus"},
-            "value": [1623860998.456, "1"]
-        }
-    ]
-    mock_client.custom_query_range.return_value = [
-        {
-            "metric": {"__name__": "up", "instance": "localhost:9090", "job": "prometheus"},
-            "values": [
-                [1623860998.456, "1"],
-                [1623861058.456, "1"]
-            ]
-        }
-    ]
-    mock_client.all_alerts.return_value = [
-        {
-            "labels": {"alertname": "InstanceDown", "severity": "critical"},
-            "annotations": {"description": "Instance is down", "summary": "Instance down"},
-            "state": "firing",
-            "activeAt": "2023-01-01T00:00:00Z",
-            "value": 1.0
-        }
-    ]
-    mock_client.all_metrics.return_value = ["up", "http_requests_total", "node_cpu_seconds_total"]
-    mock_client.get_metadata.return_value = {
-        "up": {
-            "type": "gauge",
-            "help": "1 if the target is up, 0 if the target is down",
-            "unit": ""
-        }
-    }
+    def __init__(self, body: bytes):
+        super().__init__()
+        self.body = body
+        self.requests = []
+    
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.body
+        response.url = request.url
+        response.request = request
+        return response
     
-    return mock_client
+    def close(self):
+        pass
 
 
-@pytest.fixture
-def prometheus_service(mock_prometheus_client):
-    """Create Prometheus service with mocked client."""
-    with patch("app.services.prometheus_service.PrometheusConnect", return_value=mock_prometheus_client):
-        service = PrometheusService(
-            settings=Settings(
-                PROMETHEUS_URL="http://test-prometheus:9090",
-                PROMETHEUS_USERNAME="test-user",
-                PROMETHEUS_PASSWORD="test-password"
-            )
-        )
-        yield service
+_QUERY_TIME = datetime(2023, 1, 1, 12, 0, 0)
 
 
 @pytest.mark.asyncio
-async def test_check_health(prometheus_service, mock_prometheus_client):
-    """Test health check."""
-    result = await prometheus_service.check_health()
+@pytest.mark.parametrize(
+    "method,args,client_method,client_args,client_kwargs,check",
+    [
+        ("query", ("up",), "custom_query", (), {"query": "up", "params": None},
+         lambda r: r.status == "success" and r.data[0]["metric"]["__name__"] == "up"),
+        ("query", ("up", _QUERY_TIME), "custom_query", (),
+         {"query": "up", "params": {"time": _QUERY_TIME.timestamp()}},
+         lambda r: r.status == "success"),
+        ("get_alerts", (), "all_alerts", (), {},
+         lambda r: r.alerts[0]["labels"]["alertname"] == "InstanceDown"),
+        ("list_metrics", (), "all_metrics", (None,), {},
+         lambda r: {"up", "http_requests_total"} <= set(r)),
+        # The mock always returns the same list, but in reality it would filter
+        ("list_metrics", ("node_.*",), "all_metrics", ("node_.*",), {},
+         lambda r: len(r) == 3),
+        ("get_metadata", (), "get_metadata", (None,), {},
+         lambda r: r["up"].type == "gauge"
+         and r["up"].help == "1 if the target is up, 0 if the target is down"),
+        ("get_metadata", ("up",), "get_metadata", ("up",), {},
+         lambda r: "up" in r),
+    ],
+    ids=[
+        "query",
+        "query_with_time",
+        "get_alerts",
+        "list_metrics",
+        "list_metrics_with_match",
+        "get_metadata",
+        "get_metadata_with_metric",
+    ],
+)
+async def test_client_passthrough(
+    prometheus_service, mock_prometheus_client,
+    method, args, client_method, client_args, client_kwargs, check
+):
+    """Test service methods that map onto a single Prometheus client call."""
+    result = await getattr(prometheus_service, method)(*args)
     
-    assert result is True
-    mock_prometheus_client.custom_query.assert_called_once_with(query="up")
+    assert check(result)
+    getattr(mock_prometheus_client, client_method).assert_called_once_with(
+        *client_args, **client_kwargs
+    )
 
 
 @pytest.mark.asyncio
-async def test_query(prometheus_service, mock_prometheus_client):
-    """Test executing a PromQL query."""
-    result = await prometheus_service.query("up")
+async def test_query_batch(prometheus_service, mock_prometheus_client):
+    """Test executing several PromQL queries in one batch."""
+    result = await prometheus_service.query_batch(["up", "http_requests_total"])
     
-    assert result.status == "success"
-    assert len(result.data) == 1
-    assert result.data[0]["metric"]["__name__"] == "up"
-    mock_prometheus_client.custom_query.assert_called_once_with(query="up", time=None)
+    assert len(result) == 2
+    assert all(r.status == "success" for r in result)
+    assert mock_prometheus_client.custom_query.call_count == 2
+    mock_prometheus_client.custom_query.assert_any_call(query="up", params=None)
+    mock_prometheus_client.custom_query.assert_any_call(query="http_requests_total", params=None)
 
 
 @pytest.mark.asyncio
-async def test_query_with_time(prometheus_service, mock_prometheus_client):
-    """Test executing a PromQL query with specific time."""
-    query_time = datetime(2023, 1, 1, 12, 0, 0)
-    
-    result = await prometheus_service.query("up", query_time)
-    
-    assert result.status == "success"
-    mock_prometheus_client.custom_query.assert_called_once_with(
-        query="up", 
-        time=query_time.timestamp()
-    )
-
-
-@pytest.mark.asyncio
-async def test_query_range(prometheus_service, mock_prometheus_client):
+async def test_query_range(prometheus_service):
     """Test executing a PromQL range query."""
     start_time = datetime(2023, 1, 1, 12, 0, 0)
     end_time = datetime(2023, 1, 1, 13, 0, 0)
     
-    result = await prometheus_service.query_range("up", start_time, end_time, "5m")
-    
-    assert result.status == "success"
-    assert len(result.data) == 1
-    mock_prometheus_client.custom_query_range.assert_called_once_with(
-        query="up",
-        start_time=start_time.timestamp(),
-        end_time=end_time.timestamp(),
-        step="5m"
+    # Range queries go straight through the service's HTTP session, so answer
+    # them at the transport layer and check what was actually sent
+    transport = StubTransport(
+        b'{"status":"success","data":{"resultType":"matrix","result":['
+        b'{"metric":{"__name__":"up","instance":"localhost:9090","job":"prometheus"},'
+        b'"values":[[1623860998.456,"1"],[1623861058.456,"1"]]}]}}'
     )
-
-
-@pytest.mark.asyncio
-async def test_get_alerts(prometheus_service, mock_prometheus_client):
-    """Test retrieving alerts."""
-    result = await prometheus_service.get_alerts()
+    session = requests.Session()
+    session.mount("http://", transport)
     
-    assert len(result.alerts) == 1
-    assert result.alerts[0]["labels"]["alertname"] == "InstanceDown"
-    mock_prometheus_client.all_alerts.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_list_metrics(prometheus_service, mock_prometheus_client):
-    """Test listing available metrics."""
-    result = await prometheus_service.list_metrics()
-    
-    assert len(result) == 3
-    assert "up" in result
-    assert "http_requests_total" in result
-    mock_prometheus_client.all_metrics.assert_called_once_with(None)
-
-
-@pytest.mark.asyncio
-async def test_list_metrics_with_match(prometheus_service, mock_prometheus_client):
-    """Test listing metrics with a filter pattern."""
-    result = await prometheus_service.list_metrics("node_.*")
-    
-    assert len(result) == 3  # Mock always returns the same list, but in reality it would filter
-    mock_prometheus_client.all_metrics.assert_called_once_with("node_.*")
-
-
-@pytest.mark.asyncio
-async def test_get_metadata(prometheus_service, mock_prometheus_client):
-    """Test retrieving metric metadata."""
-    result = await prometheus_service.get_metadata()
+    with patch.object(prometheus_service, "_session", session):
+        result = await prometheus_service.query_range("up", start_time, end_time, "5m")
     
-    assert "up" in result
-    assert result["up"].type == "gauge"
-    assert result["up"].help == "1 if the target is up, 0 if the target is down"
-    mock_prometheus_client.get_metadata.assert_called_once_with(None)
-
-
-@pytest.mark.asyncio
-async def test_get_metadata_with_metric(prometheus_service, mock_prometheus_client):
-    """Test retrieving metadata for a specific metric."""
-    result = await prometheus_service.get_metadata("up")
-    
-    assert "up" in result
-    mock_prometheus_client.get_metadata.assert_called_once_with("up")
+    assert result.status == "success"
+    assert len(result.data) == 1
+    assert result.data[0]["values"][1] == [1623861058.456, "1"]
+    (sent,) = transport.requests
+    url = urlsplit(sent.url)
+    assert (url.netloc, url.path) == ("test-prometheus:9090", "/api/v1/query_range")
+    assert parse_qs(url.query) == {
+        "query": ["up"],
+        "start": [str(start_time.timestamp())],
+        "end": [str(end_time.timestamp())],
+        "step": ["5m"]
+    }
+    assert "Authorization" in sent.headers
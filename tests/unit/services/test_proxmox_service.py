@@ -1,133 +1,205 @@
 """
 Unit tests for Proxmox service.
 """
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
-from proxmoxer import ProxmoxAPI
+from proxmoxer import ResourceException
 
 from app.config import Settings
 from app.models.proxmox import VMCreate
 from app.services.proxmox_service import ProxmoxService
 
 
-@pytest.fixture
-def mock_proxmox_client():
-    """Mock ProxmoxAPI client."""
-    mock_client = MagicMock(spec=ProxmoxAPI)
-    
-    # Mock version endpoint
-    mock_client.version = MagicMock()
-    mock_client.version.get.return_value = {"version": "7.2-3", "release": "stable"}
-    
-    # Mock nodes endpoint
-    mock_client.nodes = MagicMock()
-    mock_client.nodes.get.return_value = [
-        {
-            "id": "node1",
-            "node": "node1",
-            "status": "online",
-            "cpu": 0.1,
-            "mem": 1073741824,
-            "uptime": 3600,
-            "ip": "192.168.1.1"
-        }
-    ]
-    
-    # Mock node methods
-    mock_node = MagicMock()
-    mock_node.status.get.return_value = {
-        "status": "online",
-        "cpu": 0.1,
-        "memory": {"used": 1073741824},
-        "uptime": 3600,
-        "ip": "192.168.1.1"
-    }
-    
-    # Mock node qemu methods
-    mock_node.qemu.get.return_value = [
-        {
-            "vmid": 100,
-            "name": "test-vm1",
-            "status": "running",
-            "cpu": 1,
-            "maxmem": 1073741824,
-            "maxdisk": 10737418240,
-            "uptime": 3600
-        }
-    ]
-    
-    # Mock vm config and status
-    mock_vm = MagicMock()
-    mock_vm.config.get.return_value = {
+# Canned ProxmoxAPI responses, read-only so the shared client mock cannot
+# carry one test's changes into the next
+_VERSION = MappingProxyType({"version": "7.2-3", "release": "stable"})
+_NODE_1 = MappingProxyType({
+    "id": "node1",
+    "node": "node1",
+    "status": "online",
+    "cpu": 0.1,
+    "mem": 1073741824,
+    "uptime": 3600,
+    "ip": "192.168.1.1"
+})
+_NODE_STATUS = MappingProxyType({
+    "status": "online",
+    "cpu": 0.1,
+    "memory": MappingProxyType({"used": 1073741824}),
+    "uptime": 3600,
+    "ip": "192.168.1.1"
+})
+_VM_100 = MappingProxyType({
+    "vmid": 100,
+    "name": "test-vm1",
+    "status": "running",
+    "cpu": 1,
+    "maxmem": 1073741824,
+    "maxdisk": 10737418240,
+    "uptime": 3600
+})
+_VM_CONFIG = MappingProxyType({
+    "name": "test-vm1",
+    "cores": 1,
+    "memory": 1024
+})
+_VM_STATUS = MappingProxyType({
+    "status": "running",
+    "cpus": 1,
+    "maxmem": 1073741824,
+    "uptime": 3600
+})
+_TASK_OK = MappingProxyType({"status": "ok"})
+_CREATE_UPID = "UPID:node1:00001234:00005678:5F000000:qmcreate:102:root@pam:"
+_CLUSTER_RESOURCES = (
+    MappingProxyType({
+        "type": "node",
+        "node": "node1",
+        "maxcpu": 4,
+        "maxmem": 8589934592
+    }),
+    MappingProxyType({
+        "type": "storage",
+        "storage": "local",
+        "maxdisk": 107374182400
+    }),
+    MappingProxyType({
+        "type": "qemu",
         "name": "test-vm1",
-        "cores": 1,
-        "memory": 1024
-    }
-    mock_vm.status.current.get.return_value = {
-        "status": "running",
-        "cpus": 1,
-        "maxmem": 1073741824,
-        "uptime": 3600
-    }
-    
-    # Mock vm operations
-    mock_vm.status.start.post.return_value = {"status": "ok"}
-    mock_vm.status.stop.post.return_value = {"status": "ok"}
-    
-    # Link mocks together using __call__ to simulate method chaining
-    mock_node.qemu.__call__.return_value = mock_vm
-    mock_client.nodes.__call__.return_value = mock_node
+        "vmid": 100
+    }),
+)
+
+
+_PROXMOX_SETTINGS = Settings(
+    PROXMOX_URL="test-proxmox.example.com",
+    PROXMOX_USERNAME="test-user",
+    PROXMOX_PASSWORD="test-password",
+    PROXMOX_VERIFY_SSL=False
+)
+
+
+def _configure_proxmox_client(client: MagicMock, vm: SimpleNamespace) -> None:
+    """
+    Set the canned ProxmoxAPI responses.
+    
+    Args:
+        client: ProxmoxAPI mock
+        vm: VM endpoints returned by client.nodes(...).qemu(...)
+    """
+    # Mock version and nodes endpoints
+    client.configure_mock(**{
+        "version.get.return_value": _VERSION,
+        "nodes.get.return_value": [_NODE_1],
+    })
+    
+    # Mock node status and qemu listing
+    mock_node = client.nodes.return_value
+    mock_node.configure_mock(**{
+        "status.get.return_value": _NODE_STATUS,
+        "qemu.get.return_value": [_VM_100],
+    })
+    
+    # Mock vm config, status and operations
+    mock_node.qemu.return_value = vm
+    vm.config.get.return_value = _VM_CONFIG
+    vm.status.current.get.return_value = _VM_STATUS
+    vm.status.start.post.return_value = _TASK_OK
+    vm.status.stop.post.return_value = _TASK_OK
     
     # Mock cluster resources
-    mock_client.cluster = MagicMock()
-    mock_client.cluster.resources.get.return_value = [
-        {
-            "type": "node",
-            "node": "node1",
-            "maxcpu": 4,
-            "maxmem": 8589934592
-        },
-        {
-            "type": "storage",
-            "storage": "local",
-            "maxdisk": 107374182400
-        },
-        {
-            "type": "qemu",
-            "name": "test-vm1",
-            "vmid": 100
-        }
-    ]
-    
-    return mock_client
+    client.cluster.resources.get.return_value = _CLUSTER_RESOURCES
+
+
+@pytest.fixture(scope="session")
+def _proxmox_client():
+    """Session-wide ProxmoxAPI mock; use mock_proxmox_client in tests."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="session")
+def _proxmox_vm():
+    """
+    Session-wide VM endpoints; reach them through mock_proxmox_client.
+    
+    Only the calls the service makes are mocked, on plain namespaces, so tests
+    do not walk a chain of auto-created MagicMocks to get to them.
+    """
+    return SimpleNamespace(
+        config=SimpleNamespace(get=Mock()),
+        status=SimpleNamespace(
+            current=SimpleNamespace(get=Mock()),
+            start=SimpleNamespace(post=Mock()),
+            stop=SimpleNamespace(post=Mock())
+        ),
+        delete=Mock()
+    )
 
 
 @pytest.fixture
-def proxmox_service(mock_proxmox_client):
+def mock_proxmox_client(_proxmox_client, _proxmox_vm):
+    """Mock ProxmoxAPI client, reset to its canned responses."""
+    _proxmox_client.reset_mock(return_value=True, side_effect=True)
+    for endpoint in (
+        _proxmox_vm.config.get,
+        _proxmox_vm.status.current.get,
+        _proxmox_vm.status.start.post,
+        _proxmox_vm.status.stop.post,
+        _proxmox_vm.delete,
+    ):
+        endpoint.reset_mock(return_value=True, side_effect=True)
+    _configure_proxmox_client(_proxmox_client, _proxmox_vm)
+    return _proxmox_client
+
+
+@pytest.fixture(scope="session")
+async def _proxmox_service(_proxmox_client):
+    """Session-wide Proxmox service wired to the client mock."""
+    service = ProxmoxService(settings=_PROXMOX_SETTINGS)
+    # Patch only the build, so modules collected later still see the real ProxmoxAPI
+    with patch("app.services.proxmox_service.ProxmoxAPI", return_value=_proxmox_client):
+        await service._get_client()
+    return service
+
+
+@pytest.fixture
+def proxmox_service(_proxmox_service, mock_proxmox_client):
     """Create Proxmox service with mocked client."""
-    with patch("app.services.proxmox_service.ProxmoxAPI", return_value=mock_proxmox_client):
-        service = ProxmoxService(
-            settings=Settings(
-                PROXMOX_URL="test-proxmox.example.com",
-                PROXMOX_USERNAME="test-user",
-                PROXMOX_PASSWORD="test-password",
-                PROXMOX_VERIFY_SSL=False
-            )
-        )
-        yield service
-
-
-@pytest.mark.asyncio
+    # Start every test from a cold cache
+    _proxmox_service._cache.clear()
+    _proxmox_service._vm_exists_cache.clear()
+    return _proxmox_service
+
+
+@pytest.fixture
+def stub_get_vm(proxmox_service):
+    """Replace get_vm on the shared service with an AsyncMock for one test."""
+    with patch.object(proxmox_service, "get_vm", AsyncMock()) as get_vm:
+        yield get_vm
+
+
 async def test_check_health(proxmox_service, mock_proxmox_client):
     """Test health check."""
     result = await proxmox_service.check_health()
     
     assert result is True
-    mock_proxmox_client.version.get.assert_called_once()
+    assert mock_proxmox_client.version.get.call_count == 1
+
+
+async def test_concurrent_first_calls_authenticate_once(mock_proxmox_client):
+    """Test requests racing on a cold service share one authenticated client."""
+    with patch("app.services.proxmox_service.ProxmoxAPI",
+               return_value=mock_proxmox_client) as api:
+        service = ProxmoxService(settings=_PROXMOX_SETTINGS)
+        clients = await asyncio.gather(*(service._get_client() for _ in range(5)))
+    
+    assert all(client is mock_proxmox_client for client in clients)
+    assert api.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_get_nodes(proxmox_service, mock_proxmox_client):
     """Test retrieving nodes."""
     nodes = await proxmox_service.get_nodes()
@@ -136,10 +208,19 @@ async def test_get_nodes(proxmox_service, mock_proxmox_client):
     assert nodes[0].id == "node1"
     assert nodes[0].node == "node1"
     assert nodes[0].status == "online"
-    mock_proxmox_client.nodes.get.assert_called_once()
+    assert mock_proxmox_client.nodes.get.call_count == 1
+
+
+async def test_get_nodes_concurrent_misses(proxmox_service, mock_proxmox_client):
+    """Test concurrent cache misses share a single fetch."""
+    results = await asyncio.gather(*(proxmox_service.get_nodes() for _ in range(5)))
+    
+    assert all(nodes == results[0] for nodes in results)
+    assert mock_proxmox_client.nodes.get.call_count == 1
+    # The fill lock goes once nobody is waiting on it
+    assert len(proxmox_service._cache._fill_locks) == 0
 
 
-@pytest.mark.asyncio
 async def test_get_node(proxmox_service, mock_proxmox_client):
     """Test retrieving a specific node."""
     node = await proxmox_service.get_node("node1")
@@ -147,23 +228,23 @@ async def test_get_node(proxmox_service, mock_proxmox_client):
     assert node is not None
     assert node.id == "node1"
     assert node.node == "node1"
-    mock_proxmox_client.nodes.get.assert_called_once()
-    mock_proxmox_client.nodes.assert_called_once_with("node1")
+    assert mock_proxmox_client.nodes.get.call_count == 0
+    assert mock_proxmox_client.nodes.call_args_list == [call("node1")]
 
 
-@pytest.mark.asyncio
 async def test_get_node_not_found(proxmox_service, mock_proxmox_client):
     """Test retrieving a non-existent node."""
-    # Make nodes.get return a list that doesn't include the requested node
-    mock_proxmox_client.nodes.get.return_value = [{"node": "different-node"}]
+    # Proxmox rejects status lookups of unknown nodes
+    mock_proxmox_client.nodes.return_value.status.get.side_effect = ResourceException(
+        500, "Internal Server Error", "hostname lookup 'nonexistent' failed"
+    )
     
     node = await proxmox_service.get_node("nonexistent")
     
     assert node is None
-    mock_proxmox_client.nodes.get.assert_called_once()
+    assert mock_proxmox_client.nodes.get.call_count == 0
 
 
-@pytest.mark.asyncio
 async def test_get_cluster_overview(proxmox_service, mock_proxmox_client):
     """Test retrieving cluster overview."""
     overview = await proxmox_service.get_cluster_overview()
@@ -174,10 +255,34 @@ async def test_get_cluster_overview(proxmox_service, mock_proxmox_client):
     assert overview.total_cpu == 4
     assert overview.total_memory == 8589934592
     assert overview.total_disk == 107374182400
-    mock_proxmox_client.cluster.resources.get.assert_called_once()
+    assert mock_proxmox_client.cluster.resources.get.call_count == 1
+
+
+async def test_poll_cluster_tasks_invalidates_cache(proxmox_service, mock_proxmox_client):
+    """Test a newly finished VM task drops the cached cluster data."""
+    mock_proxmox_client.cluster.tasks.get.return_value = [
+        {"type": "qmstart", "starttime": 90, "endtime": 100}
+    ]
+    last_seen = await proxmox_service._poll_cluster_tasks(None)
+    await proxmox_service.get_cluster_overview()
+    
+    mock_proxmox_client.cluster.tasks.get.return_value = [
+        {"type": "vzdump", "starttime": 105, "endtime": 110},
+        {"type": "qmstart", "starttime": 90, "endtime": 100}
+    ]
+    last_seen = await proxmox_service._poll_cluster_tasks(last_seen)
+    assert "cluster_overview" in proxmox_service._cache
+    
+    mock_proxmox_client.cluster.tasks.get.return_value = [
+        {"type": "qmdestroy", "starttime": 115, "endtime": 120},
+        {"type": "vzdump", "starttime": 105, "endtime": 110}
+    ]
+    last_seen = await proxmox_service._poll_cluster_tasks(last_seen)
+    
+    assert last_seen == 120
+    assert "cluster_overview" not in proxmox_service._cache
 
 
-@pytest.mark.asyncio
 async def test_get_vms(proxmox_service, mock_proxmox_client):
     """Test retrieving all VMs."""
     vms = await proxmox_service.get_vms()
@@ -186,11 +291,10 @@ async def test_get_vms(proxmox_service, mock_proxmox_client):
     assert vms[0].vmid == 100
     assert vms[0].name == "test-vm1"
     assert vms[0].status == "running"
-    mock_proxmox_client.nodes.get.assert_called_once()
-    mock_proxmox_client.nodes.assert_called_once_with("node1")
+    assert mock_proxmox_client.nodes.get.call_count == 1
+    assert mock_proxmox_client.nodes.call_args_list == [call("node1")]
 
 
-@pytest.mark.asyncio
 async def test_get_vms_filtered_by_node(proxmox_service, mock_proxmox_client):
     """Test retrieving VMs filtered by node."""
     vms = await proxmox_service.get_vms(node="node1")
@@ -198,10 +302,9 @@ async def test_get_vms_filtered_by_node(proxmox_service, mock_proxmox_client):
     assert len(vms) == 1
     assert vms[0].vmid == 100
     assert vms[0].name == "test-vm1"
-    mock_proxmox_client.nodes.assert_called_once_with("node1")
+    assert mock_proxmox_client.nodes.call_args_list == [call("node1")]
 
 
-@pytest.mark.asyncio
 async def test_get_vm(proxmox_service, mock_proxmox_client):
     """Test retrieving a specific VM."""
     vm = await proxmox_service.get_vm("node1", 100)
@@ -210,42 +313,65 @@ async def test_get_vm(proxmox_service, mock_proxmox_client):
     assert vm.vmid == 100
     assert vm.name == "test-vm1"
     assert vm.status == "running"
-    mock_proxmox_client.nodes.assert_called_with("node1")
+    assert mock_proxmox_client.nodes.call_args == call("node1")
+
+
+@pytest.mark.parametrize(
+    "method,error,expected",
+    [
+        ("get_vm", None, None),
+        ("start_vm", "VM 999 not found on node node1", None),
+        ("stop_vm", "VM 999 not found on node node1", None),
+        ("delete_vm", None, False),
+    ],
+)
+async def test_vm_not_found(proxmox_service, mock_proxmox_client, method, error, expected):
+    """Test acting on a non-existent VM."""
+    # Proxmox rejects status lookups of unknown VMs
+    mock_vm = mock_proxmox_client.nodes.return_value.qemu.return_value
+    mock_vm.status.current.get.side_effect = ResourceException(
+        500, "Internal Server Error", "Configuration file 'nodes/node1/qemu-server/999.conf' does not exist"
+    )
+    
+    if error:
+        with pytest.raises(ValueError, match=error):
+            await getattr(proxmox_service, method)("node1", 999)
+    else:
+        assert await getattr(proxmox_service, method)("node1", 999) is expected
+    
+    assert mock_vm.status.current.get.call_count == 1
+    assert mock_proxmox_client.nodes.call_args == call("node1")
 
 
-@pytest.mark.asyncio
-async def test_get_vm_not_found(proxmox_service, mock_proxmox_client):
-    """Test retrieving a non-existent VM."""
-    # Make config.get raise an exception to simulate VM not found
-    mock_vm = MagicMock()
-    mock_vm.config.get.side_effect = Exception("VM not found")
-    mock_node = MagicMock()
-    mock_node.qemu.__call__.return_value = mock_vm
-    mock_proxmox_client.nodes.__call__.return_value = mock_node
-    
-    vm = await proxmox_service.get_vm("node1", 999)
+async def test_vm_server_error_propagates(proxmox_service, mock_proxmox_client):
+    """Test a Proxmox 500 that is not a missing VM is raised, not reported as not found."""
+    mock_vm = mock_proxmox_client.nodes.return_value.qemu.return_value
+    mock_vm.status.current.get.side_effect = ResourceException(
+        500, "Internal Server Error", "VM is locked (backup)"
+    )
     
-    assert vm is None
+    with pytest.raises(ResourceException, match="VM is locked"):
+        await proxmox_service.get_vm("node1", 100)
 
 
-@pytest.mark.asyncio
-async def test_create_vm(proxmox_service, mock_proxmox_client):
+async def test_create_vm(proxmox_service, mock_proxmox_client, stub_get_vm):
     """Test creating a VM."""
     new_vm = VMCreate(
+        vmid=102,
         name="new-vm",
         cores=2,
         memory=2048,
         storage="local"
     )
+    # A lookup made before the VM existed
+    proxmox_service._vm_exists_cache[("node1", 102)] = False
     
-    # Mock the post method to return a vmid
-    mock_node_qemu = MagicMock()
-    mock_node_qemu.post.return_value = 102
-    mock_proxmox_client.nodes.return_value.qemu = mock_node_qemu
+    # The post method returns the UPID of the creation task
+    mock_node_qemu = mock_proxmox_client.nodes.return_value.qemu
+    mock_node_qemu.post.return_value = _CREATE_UPID
     
     # Also mock get_vm to return details for the new VM
-    proxmox_service.get_vm = MagicMock()
-    proxmox_service.get_vm.return_value = {
+    stub_get_vm.return_value = {
         "vmid": 102,
         "name": "new-vm",
         "status": "stopped",
@@ -258,101 +384,65 @@ async def test_create_vm(proxmox_service, mock_proxmox_client):
     
     result = await proxmox_service.create_vm("node1", new_vm)
     
-    mock_node_qemu.post.assert_called_once()
-    proxmox_service.get_vm.assert_called_once_with("node1", 102)
+    assert mock_node_qemu.post.call_count == 1
+    assert mock_node_qemu.post.call_args.kwargs["vmid"] == 102
+    assert mock_proxmox_client.cluster.nextid.get.call_count == 0
+    assert ("node1", 102) not in proxmox_service._vm_exists_cache
+    stub_get_vm.assert_awaited_once_with("node1", 102)
+
+
+async def test_create_vm_allocates_vmid(proxmox_service, mock_proxmox_client, stub_get_vm):
+    """Test creating a VM without an ID takes the next free one."""
+    new_vm = VMCreate(
+        name="new-vm",
+        cores=2,
+        memory=2048,
+        storage="local"
+    )
+    mock_proxmox_client.cluster.nextid.get.return_value = "103"
+    mock_node_qemu = mock_proxmox_client.nodes.return_value.qemu
+    mock_node_qemu.post.return_value = _CREATE_UPID
+    
+    await proxmox_service.create_vm("node1", new_vm)
+    
+    assert mock_node_qemu.post.call_args.kwargs["vmid"] == 103
+    stub_get_vm.assert_awaited_once_with("node1", 103)
 
 
-@pytest.mark.asyncio
 async def test_start_vm(proxmox_service, mock_proxmox_client):
     """Test starting a VM."""
-    # Mock get_vm to return a valid VM
-    proxmox_service.get_vm = MagicMock()
-    proxmox_service.get_vm.return_value = {
-        "vmid": 100,
-        "name": "test-vm1",
-        "status": "stopped",
-        "node": "node1"
-    }
-    
     result = await proxmox_service.start_vm("node1", 100)
     
     assert "VM 100 start initiated" in result
-    proxmox_service.get_vm.assert_called_once_with("node1", 100)
-    mock_proxmox_client.nodes.assert_called_with("node1")
+    mock_vm = mock_proxmox_client.nodes.return_value.qemu.return_value
+    assert mock_vm.status.current.get.call_count == 1
+    assert mock_proxmox_client.nodes.call_args == call("node1")
 
 
-@pytest.mark.asyncio
-async def test_start_vm_not_found(proxmox_service, mock_proxmox_client):
-    """Test starting a non-existent VM."""
-    # Mock get_vm to return None for VM not found
-    proxmox_service.get_vm = MagicMock()
-    proxmox_service.get_vm.return_value = None
-    
-    with pytest.raises(ValueError, match="VM 999 not found on node node1"):
-        await proxmox_service.start_vm("node1", 999)
+async def test_vm_exists_is_cached(proxmox_service, mock_proxmox_client):
+    """Test back-to-back actions on a VM share one existence check."""
+    await proxmox_service.start_vm("node1", 100)
+    await proxmox_service.stop_vm("node1", 100)
     
-    proxmox_service.get_vm.assert_called_once_with("node1", 999)
+    mock_vm = mock_proxmox_client.nodes.return_value.qemu.return_value
+    assert mock_vm.status.current.get.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_stop_vm(proxmox_service, mock_proxmox_client):
     """Test stopping a VM."""
-    # Mock get_vm to return a valid VM
-    proxmox_service.get_vm = MagicMock()
-    proxmox_service.get_vm.return_value = {
-        "vmid": 100,
-        "name": "test-vm1",
-        "status": "running",
-        "node": "node1"
-    }
-    
     result = await proxmox_service.stop_vm("node1", 100)
     
     assert "VM 100 stop initiated" in result
-    proxmox_service.get_vm.assert_called_once_with("node1", 100)
-    mock_proxmox_client.nodes.assert_called_with("node1")
-
-
-@pytest.mark.asyncio
-async def test_stop_vm_not_found(proxmox_service, mock_proxmox_client):
-    """Test stopping a non-existent VM."""
-    # Mock get_vm to return None for VM not found
-    proxmox_service.get_vm = MagicMock()
-    proxmox_service.get_vm.return_value = None
-    
-    with pytest.raises(ValueError, match="VM 999 not found on node node1"):
-        await proxmox_service.stop_vm("node1", 999)
-    
-    proxmox_service.get_vm.assert_called_once_with("node1", 999)
+    mock_vm = mock_proxmox_client.nodes.return_value.qemu.return_value
+    assert mock_vm.status.current.get.call_count == 1
+    assert mock_proxmox_client.nodes.call_args == call("node1")
 
 
-@pytest.mark.asyncio
 async def test_delete_vm(proxmox_service, mock_proxmox_client):
     """Test deleting a VM."""
-    # Mock get_vm to return a valid VM
-    proxmox_service.get_vm = MagicMock()
-    proxmox_service.get_vm.return_value = {
-        "vmid": 100,
-        "name": "test-vm1",
-        "status": "stopped",
-        "node": "node1"
-    }
-    
     result = await proxmox_service.delete_vm("node1", 100)
     
     assert result is True
-    proxmox_service.get_vm.assert_called_once_with("node1", 100)
-    mock_proxmox_client.nodes.assert_called_with("node1")
-
-
-@pytest.mark.asyncio
-async def test_delete_vm_not_found(proxmox_service, mock_proxmox_client):
-    """Test deleting a non-existent VM."""
-    # Mock get_vm to return None for VM not found
-    proxmox_service.get_vm = MagicMock()
-    proxmox_service.get_vm.return_value = None
-    
-    result = await proxmox_service.delete_vm("node1", 999)
-    
-    assert result is False
-    proxmox_service.get_vm.assert_called_once_with("node1", 999)
+    mock_vm = mock_proxmox_client.nodes.return_value.qemu.return_value
+    assert mock_vm.status.current.get.call_count == 1
+    assert mock_proxmox_client.nodes.call_args == call("node1")
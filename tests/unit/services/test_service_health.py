@@ -0,0 +1,43 @@
+"""
+Unit tests for the health checks shared by the client-backed services.
+"""
+import logging
+from operator import attrgetter
+
+import pytest
+
+
+@pytest.fixture
+def health_target(request):
+    """Resolve the service, its client mock, the health probe and its canned reply."""
+    service_fixture, client_fixture, probe, reply = request.param
+    return (
+        request.getfixturevalue(service_fixture),
+        request.getfixturevalue(client_fixture),
+        probe,
+        reply,
+    )
+
+
+@pytest.mark.parametrize(
+    "health_target",
+    [
+        ("grafana_service", "mock_grafana_client", attrgetter("health.check"), "'database': 'ok'"),
+        ("prometheus_service", "mock_prometheus_client", attrgetter("custom_query"), "'instance': 'localhost:9090'"),
+    ],
+    ids=["grafana", "prometheus"],
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_check_health(health_target, caplog):
+    """Test health check calls the client's health probe and reads its response."""
+    service, mock_client, probe, reply = health_target
+    caplog.set_level(logging.DEBUG)
+    
+    result = await service.check_health()
+    
+    assert result is True
+    probe(mock_client).assert_called_once()
+    # The service logs the probe's response; finding the canned one shows the
+    # fixture configured the method the service actually calls
+    assert reply in caplog.text
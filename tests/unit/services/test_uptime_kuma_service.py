@@ -1,106 +1,157 @@
 """
 Unit tests for Uptime Kuma service.
 """
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from uptime_kuma_api import UptimeKumaApi
+from types import MappingProxyType
+from unittest.mock import MagicMock, call, patch
 
 from app.config import Settings
 from app.models.uptime_kuma import MonitorCreate, MonitorUpdate
 from app.services.uptime_kuma_service import UptimeKumaService
 
 
+# Canned UptimeKumaApi responses, read-only so the shared client mock cannot
+# carry one test's changes into the next
+_INFO = MappingProxyType({"version": "1.0.0"})
+_MONITOR_1 = MappingProxyType({
+    "id": 1,
+    "name": "Test Monitor",
+    "type": "http",
+    "url": "http://test.com",
+    "interval": 60,
+    "active": True,
+    "status": 1,
+    "uptime": 99.9
+})
+_NEW_MONITOR = MappingProxyType({
+    "id": 2,
+    "name": "New Monitor",
+    "type": "http",
+    "url": "http://new-test.com",
+    "interval": 60,
+    "active": True,
+    "status": None,
+    "uptime": None
+})
+_UPDATED_MONITOR = MappingProxyType({**_MONITOR_1, "name": "Updated Monitor", "interval": 30})
+_STATUS_PAGE_1 = MappingProxyType({
+    "id": 1,
+    "title": "Test Status Page",
+    "slug": "test-status-page",
+    "published": True
+})
+
+
+_UPTIME_KUMA_SETTINGS = Settings(
+    UPTIME_KUMA_URL="http://test-url",
+    UPTIME_KUMA_USERNAME="test-user",
+    UPTIME_KUMA_PASSWORD="test-password"
+)
+
+
+def _configure_uptime_kuma_client(mock_client: MagicMock) -> None:
+    """
+    Set the canned UptimeKumaApi responses.
+    
+    Args:
+        mock_client: UptimeKumaApi mock
+    """
+    mock_client.configure_mock(**{
+        "info.return_value": _INFO,
+        "get_monitors.return_value": [_MONITOR_1],
+        "get_monitor.return_value": _MONITOR_1,
+        "add_monitor.return_value": _NEW_MONITOR,
+        "edit_monitor.return_value": _UPDATED_MONITOR,
+        "get_status_pages.return_value": [_STATUS_PAGE_1],
+        "get_status_page.return_value": _STATUS_PAGE_1,
+    })
+
+
+@pytest.fixture(scope="session")
+def _uptime_kuma_client():
+    """Session-wide UptimeKumaApi mock; use mock_uptime_kuma_client in tests."""
+    # uptime_kuma_api is synchronous; the service calls it through to_thread
+    return MagicMock()
+
+
 @pytest.fixture
-def mock_uptime_kuma_client():
-    """Mock UptimeKumaApi client."""
-    mock_client = AsyncMock(spec=UptimeKumaApi)
-    
-    # Mock responses
-    mock_client.get_info.return_value = {"version": "1.0.0"}
-    mock_client.get_monitors.return_value = [
-        {
-            "id": 1,
-            "name": "Test Monitor",
-            "type": "http",
-            "url": "http://test.com",
-            "interval": 60,
-            "active": True,
-            "status": 1,
-            "uptime": 99.9
-        }
-    ]
-    mock_client.get_monitor.return_value = {
-        "id": 1,
-        "name": "Test Monitor",
-        "type": "http",
-        "url": "http://test.com",
-        "interval": 60,
-        "active": True,
-        "status": 1,
-        "uptime": 99.9
-    }
-    mock_client.add_monitor.return_value = {
-        "id": 2,
-        "name": "New Monitor",
-        "type": "http",
-        "url": "http://new-test.com",
-        "interval": 60,
-        "active": True,
-        "status": None,
-        "uptime": None
-    }
-    mock_client.edit_monitor.return_value = {
-        "id": 1,
-        "name": "Updated Monitor",
-        "type": "http",
-        "url": "http://test.com",
-        "interval": 30,
-        "active": True,
-        "status": 1,
-        "uptime": 99.9
-    }
-    mock_client.get_status_pages.return_value = [
-        {
-            "id": 1,
-            "title": "Test Status Page",
-            "slug": "test-status-page",
-            "published": True
-        }
-    ]
-    mock_client.get_status_page.return_value = {
-        "id": 1,
-        "title": "Test Status Page",
-        "slug": "test-status-page",
-        "published": True
-    }
-    
-    return mock_client
+def mock_uptime_kuma_client(_uptime_kuma_client):
+    """Mock UptimeKumaApi client, reset to its canned responses."""
+    _uptime_kuma_client.reset_mock(return_value=True, side_effect=True)
+    _configure_uptime_kuma_client(_uptime_kuma_client)
+    return _uptime_kuma_client
+
+
+@pytest.fixture(scope="session")
+async def _uptime_kuma_service(_uptime_kuma_client):
+    """Session-wide Uptime Kuma service wired to the client mock."""
+    service = UptimeKumaService(settings=_UPTIME_KUMA_SETTINGS)
+    # Connect and log in once for the whole session; patch only the build, so
+    # modules collected later still see the real UptimeKumaApi
+    with patch("app.services.uptime_kuma_service.UptimeKumaApi", return_value=_uptime_kuma_client):
+        await service._get_client()
+    return service
 
 
 @pytest.fixture
-def uptime_kuma_service(mock_uptime_kuma_client):
+def uptime_kuma_service(_uptime_kuma_service, mock_uptime_kuma_client):
     """Create Uptime Kuma service with mocked client."""
-    with patch("app.services.uptime_kuma_service.UptimeKumaApi", return_value=mock_uptime_kuma_client):
-        service = UptimeKumaService(
-            settings=Settings(
-                UPTIME_KUMA_URL="http://test-url",
-                UPTIME_KUMA_USERNAME="test-user",
-                UPTIME_KUMA_PASSWORD="test-password"
-            )
-        )
-        yield service
-
-
-@pytest.mark.asyncio
+    # Start every test connected and from a cold cache; close() and failed
+    # health checks drop the client
+    _uptime_kuma_service.client = mock_uptime_kuma_client
+    _uptime_kuma_service._snapshot = None
+    _uptime_kuma_service._cache.clear()
+    return _uptime_kuma_service
+
+
 async def test_check_health(uptime_kuma_service, mock_uptime_kuma_client):
     """Test health check."""
     result = await uptime_kuma_service.check_health()
     
     assert result is True
-    mock_uptime_kuma_client.get_info.assert_called_once()
+    assert mock_uptime_kuma_client.info.call_count == 1
+
+
+async def test_get_info(uptime_kuma_service, mock_uptime_kuma_client):
+    """Test retrieving the instance info."""
+    info = await uptime_kuma_service.get_info()
+    
+    assert info == _INFO
+    assert mock_uptime_kuma_client.info.call_count == 1
+
+
+async def test_check_health_reconnects_after_failure(uptime_kuma_service, mock_uptime_kuma_client):
+    """Test a failed health check drops the connection so the next one logs in again."""
+    mock_uptime_kuma_client.info.side_effect = [ConnectionError("socket closed"), _INFO]
+    
+    with pytest.raises(ConnectionError):
+        await uptime_kuma_service.check_health()
+    assert uptime_kuma_service.client is None
+    assert mock_uptime_kuma_client.disconnect.call_count == 1
+    
+    with patch("app.services.uptime_kuma_service.UptimeKumaApi",
+               return_value=mock_uptime_kuma_client):
+        result = await uptime_kuma_service.check_health()
+    
+    assert result is True
+    assert mock_uptime_kuma_client.login.call_args_list == [call("test-user", "test-password")]
+    assert mock_uptime_kuma_client.info.call_count == 2
+
+
+async def test_concurrent_first_calls_log_in_once(mock_uptime_kuma_client):
+    """Test requests racing on a cold service share one connection."""
+    with patch("app.services.uptime_kuma_service.UptimeKumaApi",
+               return_value=mock_uptime_kuma_client) as api:
+        service = UptimeKumaService(settings=_UPTIME_KUMA_SETTINGS)
+        clients = await asyncio.gather(*(service._get_client() for _ in range(5)))
+    
+    assert all(client is mock_uptime_kuma_client for client in clients)
+    assert api.call_count == 1
+    assert mock_uptime_kuma_client.login.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_get_monitors(uptime_kuma_service, mock_uptime_kuma_client):
     """Test retrieving monitors."""
     monitors = await uptime_kuma_service.get_monitors()
@@ -110,10 +161,9 @@ async def test_get_monitors(uptime_kuma_service, mock_uptime_kuma_client):
     assert monitors[0].name == "Test Monitor"
     assert monitors[0].type == "http"
     assert monitors[0].url == "http://test.com"
-    mock_uptime_kuma_client.get_monitors.assert_called_once()
+    assert mock_uptime_kuma_client.get_monitors.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_get_monitor(uptime_kuma_service, mock_uptime_kuma_client):
     """Test retrieving a specific monitor."""
     monitor = await uptime_kuma_service.get_monitor(1)
@@ -121,21 +171,33 @@ async def test_get_monitor(uptime_kuma_service, mock_uptime_kuma_client):
     assert monitor is not None
     assert monitor.id == 1
     assert monitor.name == "Test Monitor"
-    mock_uptime_kuma_client.get_monitor.assert_called_once_with(1)
+    assert mock_uptime_kuma_client.get_monitor.call_args_list == [call(1)]
 
 
-@pytest.mark.asyncio
-async def test_get_monitor_not_found(uptime_kuma_service, mock_uptime_kuma_client):
-    """Test retrieving a non-existent monitor."""
-    mock_uptime_kuma_client.get_monitor.return_value = None
+@pytest.mark.parametrize(
+    "method,args,lookup,untouched,expected",
+    [
+        ("get_monitor", (999,), "get_monitor", None, None),
+        ("update_monitor", (999, MonitorUpdate(name="Updated Monitor")), "get_monitor", "edit_monitor", None),
+        ("delete_monitor", (999,), "get_monitor", "delete_monitor", False),
+        ("get_status_page", (999,), "get_status_page", None, None),
+    ],
+    ids=["get_monitor", "update_monitor", "delete_monitor", "get_status_page"],
+)
+async def test_not_found(
+    uptime_kuma_service, mock_uptime_kuma_client, method, args, lookup, untouched, expected
+):
+    """Test acting on a non-existent monitor or status page."""
+    getattr(mock_uptime_kuma_client, lookup).return_value = None
     
-    monitor = await uptime_kuma_service.get_monitor(999)
+    result = await getattr(uptime_kuma_service, method)(*args)
     
-    assert monitor is None
-    mock_uptime_kuma_client.get_monitor.assert_called_once_with(999)
+    assert result is expected
+    assert getattr(mock_uptime_kuma_client, lookup).call_args_list == [call(999)]
+    if untouched:
+        assert getattr(mock_uptime_kuma_client, untouched).call_count == 0
 
 
-@pytest.mark.asyncio
 async def test_create_monitor(uptime_kuma_service, mock_uptime_kuma_client):
     """Test creating a monitor."""
     new_monitor = MonitorCreate(
@@ -150,10 +212,9 @@ async def test_create_monitor(uptime_kuma_service, mock_uptime_kuma_client):
     assert result.id == 2
     assert result.name == "New Monitor"
     assert result.url == "http://new-test.com"
-    mock_uptime_kuma_client.add_monitor.assert_called_once()
+    assert mock_uptime_kuma_client.add_monitor.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_update_monitor(uptime_kuma_service, mock_uptime_kuma_client):
     """Test updating a monitor."""
     update_data = MonitorUpdate(
@@ -167,46 +228,19 @@ async def test_update_monitor(uptime_kuma_service, mock_uptime_kuma_client):
     assert result.id == 1
     assert result.name == "Updated Monitor"
     assert result.interval == 30
-    mock_uptime_kuma_client.get_monitor.assert_called_once_with(1)
-    mock_uptime_kuma_client.edit_monitor.assert_called_once()
-
+    assert mock_uptime_kuma_client.get_monitor.call_args_list == [call(1)]
+    assert mock_uptime_kuma_client.edit_monitor.call_count == 1
 
-@pytest.mark.asyncio
-async def test_update_monitor_not_found(uptime_kuma_service, mock_uptime_kuma_client):
-    """Test updating a non-existent monitor."""
-    mock_uptime_kuma_client.get_monitor.return_value = None
-    
-    update_data = MonitorUpdate(name="Updated Monitor")
-    result = await uptime_kuma_service.update_monitor(999, update_data)
-    
-    assert result is None
-    mock_uptime_kuma_client.get_monitor.assert_called_once_with(999)
-    mock_uptime_kuma_client.edit_monitor.assert_not_called()
 
-
-@pytest.mark.asyncio
 async def test_delete_monitor(uptime_kuma_service, mock_uptime_kuma_client):
     """Test deleting a monitor."""
     result = await uptime_kuma_service.delete_monitor(1)
     
     assert result is True
-    mock_uptime_kuma_client.get_monitor.assert_called_once_with(1)
-    mock_uptime_kuma_client.delete_monitor.assert_called_once_with(1)
-
-
-@pytest.mark.asyncio
-async def test_delete_monitor_not_found(uptime_kuma_service, mock_uptime_kuma_client):
-    """Test deleting a non-existent monitor."""
-    mock_uptime_kuma_client.get_monitor.return_value = None
-    
-    result = await uptime_kuma_service.delete_monitor(999)
-    
-    assert result is False
-    mock_uptime_kuma_client.get_monitor.assert_called_once_with(999)
-    mock_uptime_kuma_client.delete_monitor.assert_not_called()
+    assert mock_uptime_kuma_client.get_monitor.call_args_list == [call(1)]
+    assert mock_uptime_kuma_client.delete_monitor.call_args_list == [call(1)]
 
 
-@pytest.mark.asyncio
 async def test_get_status_pages(uptime_kuma_service, mock_uptime_kuma_client):
     """Test retrieving status pages."""
     status_pages = await uptime_kuma_service.get_status_pages()
@@ -215,10 +249,9 @@ async def test_get_status_pages(uptime_kuma_service, mock_uptime_kuma_client):
     assert status_pages[0].id == 1
     assert status_pages[0].title == "Test Status Page"
     assert status_pages[0].slug == "test-status-page"
-    mock_uptime_kuma_client.get_status_pages.assert_called_once()
+    assert mock_uptime_kuma_client.get_status_pages.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_get_status_page(uptime_kuma_service, mock_uptime_kuma_client):
     """Test retrieving a specific status page."""
     status_page = await uptime_kuma_service.get_status_page(1)
@@ -226,21 +259,9 @@ async def test_get_status_page(uptime_kuma_service, mock_uptime_kuma_client):
     assert status_page is not None
     assert status_page.id == 1
     assert status_page.title == "Test Status Page"
-    mock_uptime_kuma_client.get_status_page.assert_called_once_with(1)
-
-
-@pytest.mark.asyncio
-async def test_get_status_page_not_found(uptime_kuma_service, mock_uptime_kuma_client):
-    """Test retrieving a non-existent status page."""
-    mock_uptime_kuma_client.get_status_page.return_value = None
-    
-    status_page = await uptime_kuma_service.get_status_page(999)
-    
-    assert status_page is None
-    mock_uptime_kuma_client.get_status_page.assert_called_once_with(999)
+    assert mock_uptime_kuma_client.get_status_page.call_args_list == [call(1)]
 
 
-@pytest.mark.asyncio
 async def test_close(uptime_kuma_service, mock_uptime_kuma_client):
     """Test closing the client connection."""
     # First we need to access the client to initialize it
@@ -249,4 +270,4 @@ async def test_close(uptime_kuma_service, mock_uptime_kuma_client):
     # Then close the connection
     await uptime_kuma_service.close()
     
-    mock_uptime_kuma_client.disconnect.assert_called_once()
+    assert mock_uptime_kuma_client.disconnect.call_count == 1